@@ -32,7 +32,7 @@ from sklearn.model_selection import GridSearchCV, GroupKFold, GroupShuffleSplit,
 from tqdm import tqdm
 from xgboost.callback import EarlyStopping
 
-from recur_scan.features import get_features
+from recur_scan.features import get_user_features
 from recur_scan.transactions import (
     group_transactions,
     read_labeled_transactions,
@@ -212,16 +212,27 @@ if use_precomputed_features:
     features = pd.read_csv(precomputed_features_path).to_dict(orient="records")
     logger.info(f"Read {len(features)} precomputed features: {len(features[0])} features per transaction")
 else:
-    # feature generation is parallelized using joblib
+    # feature generation is parallelized across users using joblib, one job per user's (user_id, name) groups
+    user_group_keys: defaultdict[str, list[tuple[str, str]]] = defaultdict(list)
+    for group_key in grouped_transactions:
+        user_group_keys[group_key[0]].append(group_key)
     # Use backend that works better with shared memory
     try:
         with joblib.parallel_backend("loky", n_jobs=n_jobs):
-            features = joblib.Parallel(
+            user_features = joblib.Parallel(
                 verbose=1,
             )(
-                joblib.delayed(get_features)(transaction, grouped_transactions[(transaction.user_id, transaction.name)])
-                for transaction in tqdm(transactions, desc="Processing transactions")
+                joblib.delayed(get_user_features)([grouped_transactions[group_key] for group_key in group_keys])
+                for group_keys in tqdm(user_group_keys.values(), desc="Processing users")
             )
+        features_by_group = {
+            group_key: group_features
+            for group_keys, user_group_features in zip(user_group_keys.values(), user_features, strict=True)
+            for group_key, group_features in zip(group_keys, user_group_features, strict=True)
+        }
+        features = [
+            features_by_group[(transaction.user_id, transaction.name)][transaction] for transaction in transactions
+        ]
         # save the features to a csv file
         pd.DataFrame(features).to_csv(precomputed_features_path, index=False)
         logger.info(f"Generated {len(features)} features")
@@ -8,12 +8,13 @@ import argparse
 import gc
 import glob
 import os
+from collections import defaultdict
 
 import joblib
 from loguru import logger
 from tqdm import tqdm
 
-from recur_scan.features import get_features
+from recur_scan.features import get_user_features
 from recur_scan.transactions import (
     group_transactions,
     read_earnin_test_transactions,
@@ -95,12 +96,26 @@ for csv_file in csv_files:
     for batch_idx, batch in enumerate(transaction_batches):
         logger.info(f"Processing batch {batch_idx + 1}/{len(transaction_batches)} with {len(batch)} transactions")
 
-        # Generate features for this batch
+        # Generate features for this batch, one job per user covering their (user_id, name) groups in the batch
+        batch_user_group_keys: defaultdict[str, list[tuple[str, str]]] = defaultdict(list)
+        for group_key in dict.fromkeys((transaction.user_id, transaction.name) for transaction in batch):
+            batch_user_group_keys[group_key[0]].append(group_key)
         with joblib.parallel_backend("loky", n_jobs=n_jobs):
-            batch_features = joblib.Parallel(verbose=1)(
-                joblib.delayed(get_features)(transaction, grouped_transactions[(transaction.user_id, transaction.name)])
-                for transaction in tqdm(batch, desc=f"Processing batch {batch_idx + 1} of {file_name}")
+            batch_user_features = joblib.Parallel(verbose=1)(
+                joblib.delayed(get_user_features)([grouped_transactions[group_key] for group_key in group_keys])
+                for group_keys in tqdm(
+                    batch_user_group_keys.values(), desc=f"Processing batch {batch_idx + 1} of {file_name}"
+                )
             )
+        features_by_group = {
+            group_key: group_features
+            for group_keys, user_group_features in zip(batch_user_group_keys.values(), batch_user_features, strict=True)
+            for group_key, group_features in zip(group_keys, user_group_features, strict=True)
+        }
+        batch_features: list[dict[str, float | int | bool]] | None = [
+            features_by_group[(transaction.user_id, transaction.name)][transaction] for transaction in batch
+        ]
+        del features_by_group  # Release memory
         logger.info(f"Generated features for batch {batch_idx + 1}")
 
         # Transform batch features to matrix and release memory
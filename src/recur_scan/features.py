@@ -1,5 +1,6 @@
 import warnings
-from collections import defaultdict
+from datetime import date
+from functools import lru_cache
 
 import numpy as np
 
@@ -323,7 +324,6 @@ from recur_scan.features_praise import (
 )
 from recur_scan.features_precious import (
     get_additional_features as get_additional_features_precious,
-    get_amount_variation_features as get_amount_variation_features_precious,
     get_avg_days_between_same_merchant_amount as get_avg_days_between_same_merchant_amount_precious,
     get_new_features as get_new_features_precious,
     is_recurring_merchant as is_recurring_merchant_precious,
@@ -407,28 +407,70 @@ np.seterr(divide="raise", invalid="raise")
 # Turn all RuntimeWarnings into errors
 warnings.filterwarnings("error", category=RuntimeWarning)
 
+# Features already computed in this process, keyed by the group's transactions and then by transaction,
+# so re-featurizing the same group (e.g. once per CV fold or experiment) is a dictionary lookup.
+# Keying on the group's contents means a group whose transactions change is simply a new entry.
+_FEATURES_CACHE_MAX_GROUPS = 1024
+_features_cache: dict[tuple[Transaction, ...], dict[Transaction, dict[str, float | int | bool]]] = {}
+
 
 def get_features(transaction: Transaction, all_transactions: list[Transaction]) -> dict[str, float | int | bool]:
-    """Get the features for a transaction"""
-    """Extract all features for a transaction by calling individual feature functions.
-    This prepares a dictionary of features for model training.
+    """Get the features for a transaction, reusing them if this transaction and group were featurized before"""
+    group_key = tuple(all_transactions)
+    group_cache = _features_cache.get(group_key)
+    if group_cache is None:
+        if len(_features_cache) >= _FEATURES_CACHE_MAX_GROUPS:
+            # evict the oldest group
+            del _features_cache[next(iter(_features_cache))]
+        group_cache = _features_cache[group_key] = {}
+    features = group_cache.get(transaction)
+    if features is None:
+        features = group_cache[transaction] = _compute_features(transaction, all_transactions)
+    # return a copy so callers can't modify the cached features
+    return dict(features)
 
-    Args:
-        transaction (Transaction): The transaction to extract features for.
-        all_transactions (List[Transaction]): List of all transactions for context.
 
-    Returns:
-        Dict[str, Union[float, int]]: Dictionary mapping feature names to their computed values.
-    """
-    # Compute groups and amount counts internally
-    groups = _aggregate_transactions_laurels(all_transactions)
-    amount_counts: defaultdict[float, int] = defaultdict(int)
-    for t in all_transactions:
-        amount_counts[t.amount] += 1
+# Features that tell apart transactions sharing a user, name, amount and date (e.g. by their position in the
+# date-sorted group), so they are recomputed rather than copied for such duplicates in get_group_features.
+_ORDER_DEPENDENT_FEATURES = {
+    "transaction_recency_felix": get_transaction_recency_felix,
+}
+
+
+def get_group_features(all_transactions: list[Transaction]) -> dict[Transaction, dict[str, float | int | bool]]:
+    """Get the features for every transaction in a (user_id, name) group, keyed by transaction"""
+    # featurizing a whole group in one call lets the per-group caches in the feature modules be reused
+    # for every transaction in the group, and lets callers dispatch (and pickle) one job per group
+    group_features: dict[Transaction, dict[str, float | int | bool]] = {}
+    # duplicate charges (same user, name, amount and date) get the same features, so only the first is computed
+    features_by_key: dict[tuple[str, str, float, str], dict[str, float | int | bool]] = {}
+    for transaction in dict.fromkeys(all_transactions):
+        key = (transaction.user_id, transaction.name, transaction.amount, transaction.date)
+        first_features = features_by_key.get(key)
+        if first_features is None:
+            features = features_by_key[key] = get_features(transaction, all_transactions)
+        else:
+            features = dict(first_features)
+            for name, feature in _ORDER_DEPENDENT_FEATURES.items():
+                features[name] = feature(transaction, all_transactions)
+        group_features[transaction] = features
+    return group_features
+
+
+def get_user_features(groups: list[list[Transaction]]) -> list[dict[Transaction, dict[str, float | int | bool]]]:
+    """Get the features for each of one user's (user_id, name) groups, one get_group_features result per group"""
+    # most (user_id, name) groups hold only a handful of transactions, so dispatching all of a user's groups
+    # as one parallel job keeps joblib's per-job scheduling and pickling overhead small next to the work
+    return [get_group_features(group) for group in groups]
 
-    # Extract user ID and merchant name from the transaction
-    user_id, merchant_name = transaction.user_id, transaction.name
+
+@lru_cache(maxsize=128)
+def _merchant_context(
+    all_transactions: tuple[Transaction, ...], user_id: str, merchant_name: str
+) -> tuple[list[Transaction], list[date], dict[str, float], dict[str, float]]:
+    """Get the date-sorted transactions, parsed dates and interval/amount statistics for a user and merchant"""
     # Get transactions for this user and merchant
+    groups = _aggregate_transactions_laurels(list(all_transactions))
     merchant_trans = groups.get(user_id, {}).get(merchant_name, [])
     # Sort transactions by date for chronological analysis
     merchant_trans.sort(key=lambda x: x.date)
@@ -436,15 +478,34 @@ def get_features(transaction: Transaction, all_transactions: list[Transaction])
     # Parse all dates for this merchant's transactions once
     parsed_dates = []
     for trans in merchant_trans:
-        date = parse_date(trans.date)
-        if date is not None:
-            parsed_dates.append(date)
+        parsed_date = parse_date(trans.date)
+        if parsed_date is not None:
+            parsed_dates.append(parsed_date)
 
     # Calculate intervals and amounts for statistical analysis
     intervals = _calculate_intervals_laurels(parsed_dates)
     amounts = [trans.amount for trans in merchant_trans]
     interval_stats = _calculate_statistics_laurels([float(i) for i in intervals])
     amount_stats = _calculate_statistics_laurels(amounts)
+    return merchant_trans, parsed_dates, interval_stats, amount_stats
+
+
+def _compute_features(transaction: Transaction, all_transactions: list[Transaction]) -> dict[str, float | int | bool]:
+    """Get the features for a transaction"""
+    """Extract all features for a transaction by calling individual feature functions.
+    This prepares a dictionary of features for model training.
+
+    Args:
+        transaction (Transaction): The transaction to extract features for.
+        all_transactions (List[Transaction]): List of all transactions for context.
+
+    Returns:
+        Dict[str, Union[float, int]]: Dictionary mapping feature names to their computed values.
+    """
+    # The merchant context only depends on the group, so it is computed once and shared by its transactions
+    merchant_trans, parsed_dates, interval_stats, amount_stats = _merchant_context(
+        tuple(all_transactions), transaction.user_id, transaction.name
+    )
 
     histogram = get_interval_histogram_tife(all_transactions)
 
@@ -1012,7 +1073,8 @@ def get_features(transaction: Transaction, all_transactions: list[Transaction])
         # "recurring_frequency_precious": get_recurring_frequency_precious(transaction, all_transactions),
         "is_subscription_amount_precious": is_subscription_amount_precious(transaction),
         **get_additional_features_precious(transaction, all_transactions),
-        **get_amount_variation_features_precious(transaction, all_transactions),
+        # relative_amount_diff_precious, its only feature, is overwritten by get_new_features_precious below
+        # **get_amount_variation_features_precious(transaction, all_transactions),
         **get_new_features_precious(transaction, all_transactions),
         # Happy's features
         "get_n_transactions_same_description_happy": get_n_transactions_same_description_happy(
@@ -2,7 +2,9 @@ import re
 import statistics
 from collections import defaultdict
 from datetime import datetime
+from functools import lru_cache
 
+import numpy as np
 from fuzzywuzzy import fuzz
 
 from recur_scan.transactions import Transaction
@@ -41,6 +43,7 @@ ALWAYS_RECURRING_VENDORS_AT = frozenset([
 ])
 
 
+@lru_cache(maxsize=65536)
 def parse_date(date_str: str) -> datetime:
     """
     Parse a date string in multiple formats.
@@ -62,6 +65,26 @@ def parse_date(date_str: str) -> datetime:
     raise ValueError(f"Invalid date: {date_str}")
 
 
+def _parse_date_or_none(date_str: str) -> datetime | None:
+    """Parse a date string like parse_date, returning None if it is invalid."""
+    try:
+        return parse_date(date_str)
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=8192)
+def _strip_vendor_at(name: str) -> str:
+    """Lowercase a vendor name and drop its punctuation, the form the fuzzy vendor matches compare."""
+    return re.sub(r"[^\w\s]", "", name.lower()).strip()
+
+
+@lru_cache(maxsize=65536)
+def _vendor_similarity_at(base_vendor: str, vendor: str) -> int:
+    """fuzz.token_sort_ratio of two vendor names, memoized since every transaction re-compares the same pairs."""
+    return int(fuzz.token_sort_ratio(base_vendor, vendor))
+
+
 def normalize_amount(amount: float) -> float:
     """
     Normalize transaction amount by rounding and adjusting for common patterns.
@@ -80,6 +103,15 @@ def normalize_amount(amount: float) -> float:
     return rounded
 
 
+@lru_cache(maxsize=128)
+def _positive_vendors_and_amounts_at(transactions: tuple[Transaction, ...]) -> tuple[tuple[str, ...], np.ndarray]:
+    """Stripped vendor names and normalized amounts of the positive transactions, built once per list."""
+    positive = [t for t in transactions if t.amount > 0]
+    vendors = tuple(_strip_vendor_at(t.name) for t in positive)
+    amounts = np.array([normalize_amount(t.amount) for t in positive], dtype=np.float64)
+    return vendors, amounts
+
+
 def normalize_vendor_name(vendor: str) -> str:
     """Extract the core company name from a vendor string."""
     vendor = vendor.lower().replace(" ", "")
@@ -126,17 +158,17 @@ def get_is_always_recurring_at(transaction: Transaction) -> bool:
 
 def get_is_utility_at(transaction: Transaction) -> bool:
     """Standalone version of get_is_utility with _at suffix"""
-    return bool(re.search(r"\b(utility|utilit|energy)\b", transaction.name, re.IGNORECASE))
+    return bool(UTILITY_PATTERN.search(transaction.name))
 
 
 def get_is_insurance_at(transaction: Transaction) -> bool:
     """Standalone version of get_is_insurance with _at suffix"""
-    return bool(re.search(r"\b(insurance|insur|insuranc)\b", transaction.name, re.IGNORECASE))
+    return bool(INSURANCE_PATTERN.search(transaction.name))
 
 
 def get_is_phone_at(transaction: Transaction) -> bool:
     """Standalone version of get_is_phone with _at suffix"""
-    return bool(re.search(r"\b(at&t|t-mobile|verizon|comcast|spectrum)\b", transaction.name, re.IGNORECASE))
+    return bool(PHONE_PATTERN.search(transaction.name))
 
 
 def get_is_communication_or_energy_at(transaction: Transaction) -> bool:
@@ -245,7 +277,7 @@ def compute_recurring_inputs_at(
 
 def get_n_transactions_same_amount_at(transaction: Transaction, all_transactions: list[Transaction]) -> int:
     """Standalone version of get_n_transactions_same_amount with _at suffix"""
-    return len([t for t in all_transactions if abs(t.amount - transaction.amount) < 0.001])
+    return sum(1 for t in all_transactions if abs(t.amount - transaction.amount) < 0.001)
 
 
 def get_percent_transactions_same_amount_tolerant(transaction: Transaction, vendor_txns: list[Transaction]) -> float:
@@ -260,14 +292,16 @@ def get_percent_transactions_same_amount_tolerant(transaction: Transaction, vend
 # Additional patterns for non-recurring transaction detection
 PERSON_NAME_PATTERN = re.compile(r"\b(mr|mrs|ms|dr)\.?\s+\w+|\b\w+\s+\w+\b", re.IGNORECASE)
 EMAIL_PATTERN = re.compile(r"[\w\.-]+@[\w\.-]+\.\w+")
-PHONE_PATTERN = re.compile(r"\d{3}[-\.\s]?\d{3}[-\.\s]?\d{4}")
+PHONE_NUMBER_PATTERN = re.compile(r"\d{3}[-\.\s]?\d{3}[-\.\s]?\d{4}")
 
 
 def get_is_one_time_vendor_at(transaction: Transaction) -> bool:
     """Check if vendor appears to be a one-time service provider."""
     name = transaction.name.lower()
     return (
-        bool(PERSON_NAME_PATTERN.search(name)) or bool(EMAIL_PATTERN.search(name)) or bool(PHONE_PATTERN.search(name))
+        bool(PERSON_NAME_PATTERN.search(name))
+        or bool(EMAIL_PATTERN.search(name))
+        or bool(PHONE_NUMBER_PATTERN.search(name))
     )
 
 
@@ -287,37 +321,37 @@ def get_vendor_name_entropy_at(transaction: Transaction) -> float:
 def get_vendor_occurrence_count_at(transaction: Transaction, all_transactions: list[Transaction]) -> int:
     """Count how many times this vendor appears in all transactions."""
     normalized_name = normalize_vendor_name_at(transaction.name)
-    return len([t for t in all_transactions if normalize_vendor_name_at(t.name) == normalized_name])
+    return sum(1 for t in all_transactions if normalize_vendor_name_at(t.name) == normalized_name)
 
 
 def get_user_vendor_occurrence_count_at(transaction: Transaction, all_transactions: list[Transaction]) -> int:
     """Count how many times this user transacted with this vendor."""
     normalized_name = normalize_vendor_name_at(transaction.name)
-    return len([
-        t
+    return sum(
+        1
         for t in all_transactions
         if t.user_id == transaction.user_id and normalize_vendor_name_at(t.name) == normalized_name
-    ])
+    )
 
 
 def get_same_amount_count_at(transaction: Transaction, all_transactions: list[Transaction]) -> int:
     """Count transactions with same amount (±$0.01)."""
-    return len([
-        t
+    return sum(
+        1
         for t in all_transactions
         if normalize_vendor_name_at(t.name) == normalize_vendor_name_at(transaction.name)
         and abs(t.amount - transaction.amount) < 0.01
-    ])
+    )
 
 
 def get_similar_amount_count_at(transaction: Transaction, all_transactions: list[Transaction]) -> int:
     """Count transactions with similar amount (±5%)."""
-    return len([
-        t
+    return sum(
+        1
         for t in all_transactions
         if normalize_vendor_name_at(t.name) == normalize_vendor_name_at(transaction.name)
         and abs(t.amount - transaction.amount) <= 0.05 * transaction.amount
-    ])
+    )
 
 
 def get_amount_uniqueness_score_at(transaction: Transaction, all_transactions: list[Transaction]) -> float:
@@ -413,13 +447,13 @@ def is_recurring_based_on_99(transaction: Transaction, all_transactions: list[Tr
         return False
 
     # Normalize vendor name
-    base_vendor = re.sub(r"[^\w\s]", "", transaction.name.lower()).strip()
+    base_vendor = _strip_vendor_at(transaction.name)
 
     # Find similar .99 transactions
     similar: list[Transaction] = []
     for t in all_transactions:
-        t_vendor = re.sub(r"[^\w\s]", "", t.name.lower()).strip()
-        if fuzz.token_sort_ratio(base_vendor, t_vendor) > 90 and abs((t.amount * 100) % 100 - 99) < 0.01:
+        t_vendor = _strip_vendor_at(t.name)
+        if _vendor_similarity_at(base_vendor, t_vendor) > 90 and abs((t.amount * 100) % 100 - 99) < 0.01:
             similar.append(t)
 
     # Need 2+ occurrences
@@ -459,21 +493,13 @@ def is_recurring_based_on_99(transaction: Transaction, all_transactions: list[Tr
 
 
 def get_interval_variance_coefficient(transaction: Transaction, all_transactions: list[Transaction]) -> float:
-    base_vendor = re.sub(r"[^\w\s]", "", transaction.name.lower()).strip()
-
-    def parse_date(date_str: str) -> datetime:
-        for fmt in ["%Y-%m-%d", "%m/%d/%Y", "%m-%d-%Y"]:
-            try:
-                return datetime.strptime(date_str, fmt)
-            except ValueError:
-                continue
-        raise ValueError(f"Invalid date: {date_str}")
+    base_vendor = _strip_vendor_at(transaction.name)
 
     same_transactions = sorted(
         [
             t
             for t in all_transactions
-            if fuzz.token_sort_ratio(base_vendor, re.sub(r"[^\w\s]", "", t.name.lower()).strip()) > 90
+            if _vendor_similarity_at(base_vendor, _strip_vendor_at(t.name)) > 90
             and abs(t.amount - transaction.amount) < 0.01
         ],
         key=lambda x: parse_date(x.date),
@@ -521,30 +547,17 @@ def amount_variability_score(transactions: list[Transaction], base_vendor: str |
 
     # Normalize vendor name and filter transactions
     if base_vendor:
-        base_vendor = re.sub(r"[^\w\s]", "", base_vendor.lower()).strip()
-        transactions = [
-            t
-            for t in transactions
-            if fuzz.token_sort_ratio(base_vendor, re.sub(r"[^\w\s]", "", t.name.lower()).strip()) > 85
-        ]
+        base_vendor = _strip_vendor_at(base_vendor)
+        transactions = [t for t in transactions if _vendor_similarity_at(base_vendor, _strip_vendor_at(t.name)) > 85]
 
     if len(transactions) < 2:
         return 1.0  # Single transactions are non-recurring
 
-    # Parse dates and filter valid transactions in one pass
-    def parse_date(date_str: str) -> datetime | None:
-        for fmt in ["%Y-%m-%d", "%m/%d/%Y", "%m-%d-%Y"]:
-            try:
-                return datetime.strptime(date_str, fmt)
-            except ValueError:
-                continue
-        return None
-
     # Store transactions with valid dates and amounts
     valid_transactions: list[tuple[Transaction, datetime]] = [
         (t, datetime.combine(parsed_date, datetime.min.time()))
         for t in transactions
-        if (parsed_date := parse_date(t.date)) is not None and t.amount > 0
+        if (parsed_date := _parse_date_or_none(t.date)) is not None and t.amount > 0
     ]
     if len(valid_transactions) < 2:
         return 1.0
@@ -655,26 +668,17 @@ def is_known_recurring_company(transaction: Transaction, all_transactions: list[
     ]
 
     # Normalize vendor name
-    base_vendor = re.sub(r"[^\w\s]", "", transaction.name.lower()).strip()
+    base_vendor = _strip_vendor_at(transaction.name)
 
     # Check if vendor matches a known recurring keyword (fuzzy match)
-    is_keyword_match = any(fuzz.token_sort_ratio(base_vendor, keyword) > 85 for keyword in known_recurring_keywords)
-
-    # Parse date with multiple formats
-    def parse_date(date_str: str) -> datetime:
-        for fmt in ["%Y-%m-%d", "%m/%d/%Y", "%m-%d-%Y"]:
-            try:
-                return datetime.strptime(date_str, fmt)
-            except ValueError:
-                continue
-        raise ValueError(f"Invalid date format: {date_str}")
+    is_keyword_match = any(_vendor_similarity_at(base_vendor, keyword) > 85 for keyword in known_recurring_keywords)
 
     # Find similar transactions (fuzzy vendor match, similar amount)
     similar_transactions = []
     for t in all_transactions:
         try:
-            t_vendor = re.sub(r"[^\w\s]", "", t.name.lower()).strip()
-            if fuzz.token_sort_ratio(base_vendor, t_vendor) > 85 and abs(t.amount - transaction.amount) < 0.05:
+            t_vendor = _strip_vendor_at(t.name)
+            if _vendor_similarity_at(base_vendor, t_vendor) > 85 and abs(t.amount - transaction.amount) < 0.05:
                 similar_transactions.append(t)
         except ValueError:
             continue
@@ -723,25 +727,16 @@ def is_price_trending(transaction: Transaction, all_transactions: list[Transacti
     :return: True if part of a recurring pattern, False otherwise
     """
     # Normalize vendor name
-    base_vendor = re.sub(r"[^\w\s]", "", transaction.name.lower()).strip()
-
-    # Parse dates
-    def parse_date(date_str: str) -> datetime | None:
-        for fmt in ["%Y-%m-%d", "%m/%d/%Y", "%m-%d-%Y"]:
-            try:
-                return datetime.strptime(date_str, fmt)
-            except ValueError:
-                continue
-        return None
+    base_vendor = _strip_vendor_at(transaction.name)
 
     # Filter same-vendor transactions with valid dates and amounts
     same_vendor_txs: list[tuple[Transaction, datetime]] = []
     for t in all_transactions:
-        parsed_date = parse_date(t.date)
+        parsed_date = _parse_date_or_none(t.date)
         if parsed_date is None or t.amount <= 0:
             continue
-        t_vendor = re.sub(r"[^\w\s]", "", t.name.lower()).strip()
-        if fuzz.token_sort_ratio(base_vendor, t_vendor) > 85:
+        t_vendor = _strip_vendor_at(t.name)
+        if _vendor_similarity_at(base_vendor, t_vendor) > 85:
             same_vendor_txs.append((t, parsed_date))
 
     if len(same_vendor_txs) < 2:
@@ -830,27 +825,17 @@ def get_n_transactions_same_amount_chris(
     :return: Number of transactions with similar amounts
     """
     # Normalize vendor name
-    base_vendor_normalized = re.sub(r"[^\w\s]", "", base_vendor.lower()).strip() if base_vendor else None
-
-    def normalize_amount(amount: float) -> float:
-        if amount <= 0:
-            return 0.0
-        rounded = round(amount, 2)
-        if abs((amount * 100) % 100 - 99) < 5 or abs((amount * 100) % 100) < 5:
-            return rounded
-        return rounded
+    base_vendor_normalized = _strip_vendor_at(base_vendor) if base_vendor else None
 
-    target_amount = normalize_amount(transaction.amount)
-    count = 0
-    for t in all_transactions:
-        if t.amount <= 0:
-            continue
-        t_vendor = re.sub(r"[^\w\s]", "", t.name.lower()).strip()
-        if base_vendor_normalized and fuzz.token_sort_ratio(base_vendor_normalized, t_vendor) <= 85:
-            continue
-        if abs(normalize_amount(t.amount) - target_amount) <= 0.05:
-            count += 1
-    return count
+    vendors, amounts = _positive_vendors_and_amounts_at(tuple(all_transactions))
+    similar = np.abs(amounts - normalize_amount(transaction.amount)) <= 0.05
+    if base_vendor_normalized:
+        similar &= np.fromiter(
+            (_vendor_similarity_at(base_vendor_normalized, vendor) > 85 for vendor in vendors),
+            dtype=bool,
+            count=len(vendors),
+        )
+    return int(np.count_nonzero(similar))
 
 
 def get_percent_transactions_same_amount_chris(
@@ -868,15 +853,14 @@ def get_percent_transactions_same_amount_chris(
         return 0.0
 
     # Normalize vendor name
-    base_vendor_normalized = re.sub(r"[^\w\s]", "", base_vendor.lower()).strip() if base_vendor else None
+    base_vendor_normalized = _strip_vendor_at(base_vendor) if base_vendor else None
 
     # Filter vendor-specific transactions
     if base_vendor_normalized:
         vendor_transactions = [
             t
             for t in all_transactions
-            if fuzz.token_sort_ratio(base_vendor_normalized, re.sub(r"[^\w\s]", "", t.name.lower()).strip()) > 85
-            and t.amount > 0
+            if _vendor_similarity_at(base_vendor_normalized, _strip_vendor_at(t.name)) > 85 and t.amount > 0
         ]
     else:
         vendor_transactions = [t for t in all_transactions if t.amount > 0]
@@ -1,12 +1,66 @@
+import re
 import statistics
 from collections import Counter
 from datetime import datetime, timedelta
+from functools import lru_cache
+
+import numpy as np
 
 from recur_scan.features_dallanq import get_n_transactions_same_amount
 from recur_scan.transactions import Transaction
 
+# Subscription-related keywords, matched anywhere in the lowercased name in a single scan
+SUBSCRIPTION_KEYWORD_PATTERN = re.compile(
+    "|".join(
+        re.escape(keyword)
+        for keyword in (
+            "monthly",
+            "subscription",
+            "premium",
+            "plus",
+            "membership",
+            "service",
+            "plan",
+            "bill",
+            "energy",
+            "utility",
+            "insurance",
+            "mobile",
+            "+",
+            "max",
+            "prime",
+            "fiber",
+            "internet",
+            "streaming",
+        )
+    )
+)
+
+# Telecom providers and keywords, matched anywhere in the lowercased name in a single scan
+TELECOM_KEYWORD_PATTERN = re.compile(
+    "|".join(
+        re.escape(keyword)
+        for keyword in (
+            "sprint",
+            "t-mobile",
+            "verizon",
+            "at&t",
+            "cricket",
+            "boost",
+            "metropcs",
+            "phone",
+            "mobile",
+            "wireless",
+            "cellular",
+            "telecom",
+            "communications",
+        )
+    )
+)
+
 
 # parse date
+@lru_cache(maxsize=65536)
 def parse_date(date_str: str) -> datetime:
     """Parse date string into datetime object"""
     try:
@@ -71,41 +125,34 @@ def get_time_regularity_score(transaction: Transaction, all_transactions: list[T
         return 0.0
 
     try:
-        # Sort by date
-        sorted_txns = sorted(same_vendor_txns, key=lambda t: parse_date(t.date))
-
-        # Calculate days between consecutive transactions
-        days_between = []
-        for i in range(1, len(sorted_txns)):
-            days = (parse_date(sorted_txns[i].date) - parse_date(sorted_txns[i - 1].date)).days
-            days_between.append(days)
+        # Sort by date and calculate days between consecutive transactions
+        ordinals = np.sort(np.fromiter((parse_date(t.date).toordinal() for t in same_vendor_txns), dtype=np.int64))
+        days_between = np.diff(ordinals)
 
-        # Combine the empty check with standard deviation calculation
-        if not days_between or len(days_between) <= 1:
-            return 0.0
-
-        std_dev = statistics.stdev(days_between)
+        std_dev = float(days_between.std(ddof=1))
         # Convert to a score between 0 and 1 (1 = perfectly regular)
         return 1.0 / (1.0 + std_dev / 5.0)
     except Exception:
         return 0.0
 
 
+ALWAYS_RECURRING_VENDORS = frozenset({
+    "google storage",
+    "netflix",
+    "hulu",
+    "spotify",
+    "amazon prime",
+    "disney+",
+    "apple music",
+    "xbox game pass",
+    "youtube premium",
+    "adobe creative cloud",
+})
+
+
 def get_is_always_recurring(transaction: Transaction) -> bool:
     """Check if the transaction is always recurring because of the vendor name - check lowercase match"""
-    always_recurring_vendors = {
-        "google storage",
-        "netflix",
-        "hulu",
-        "spotify",
-        "amazon prime",
-        "disney+",
-        "apple music",
-        "xbox game pass",
-        "youtube premium",
-        "adobe creative cloud",
-    }
-    return transaction.name.lower() in always_recurring_vendors
+    return transaction.name.lower() in ALWAYS_RECURRING_VENDORS
 
 
 # New helper functions for date handling
@@ -152,30 +199,50 @@ def get_n_transactions_days_apart(
     return n_txs
 
 
+@lru_cache(maxsize=128)
+def _vendor_amount_arrays(all_transactions: tuple[Transaction, ...]) -> dict[str, np.ndarray]:
+    """Group amounts by vendor name into read-only float64 arrays, once per transaction list"""
+    grouped: dict[str, list[float]] = {}
+    for t in all_transactions:
+        grouped.setdefault(t.name, []).append(t.amount)
+    arrays = {}
+    for name, amounts in grouped.items():
+        array = np.array(amounts, dtype=np.float64)
+        array.flags.writeable = False
+        arrays[name] = array
+    return arrays
+
+
+def _vendor_amounts(transaction: Transaction, all_transactions: list[Transaction]) -> np.ndarray:
+    """Amounts of all transactions with the same vendor name as transaction"""
+    return _vendor_amount_arrays(tuple(all_transactions)).get(transaction.name, np.empty(0, dtype=np.float64))
+
+
 def get_transaction_amount_variance(transaction: Transaction, all_transactions: list[Transaction]) -> float:
     """Calculate standard deviation of transaction amounts for the same vendor."""
-    vendor_txns = [t.amount for t in all_transactions if t.name == transaction.name]
+    vendor_txns = _vendor_amounts(transaction, all_transactions)
 
     if len(vendor_txns) <= 1:
         return 0.0  # No variance if there's only one transaction
-    try:
-        return statistics.stdev(vendor_txns)
-    except Exception:
+    # Identical amounts are checked exactly, since the array mean can be off by an ulp
+    if np.all(vendor_txns == vendor_txns[0]):
         return 0.0
+    return float(vendor_txns.std(ddof=1))  # Sample std deviation, as statistics.stdev
 
 
 def get_outlier_score(transaction: Transaction, all_transactions: list[Transaction]) -> float:
     """Detects if a transaction amount is an outlier with a refined Z-score method."""
-    vendor_txns = [t.amount for t in all_transactions if t.name == transaction.name]
+    vendor_txns = _vendor_amounts(transaction, all_transactions)
 
     if len(vendor_txns) <= 1:
         return 0.0  # No outliers if only one transaction
 
-    mean_amount = statistics.mean(vendor_txns)
-    std_dev = statistics.pstdev(vendor_txns) if len(vendor_txns) > 1 else 0  # Use population std deviation
+    # No variation, so no outliers (checked exactly, since np.mean of repeated floats can be off by an ulp)
+    if np.all(vendor_txns == vendor_txns[0]):
+        return 0.0
 
-    if std_dev == 0:
-        return 0.0  # No variation, so no outliers
+    mean_amount = float(vendor_txns.mean())
+    std_dev = float(vendor_txns.std())  # Use population std deviation
 
     # Increase outlier sensitivity by using absolute Z-score
     z_score = abs((transaction.amount - mean_amount) / std_dev)
@@ -198,74 +265,52 @@ def get_recurring_confidence_score(transaction: Transaction, all_transactions: l
     return min(score, 1.0)  # Ensure the score is between 0 and 1
 
 
+SUBSCRIPTION_VENDORS = frozenset({
+    "google storage",
+    "netflix",
+    "hulu",
+    "spotify",
+    "amazon prime",
+    "disney+",
+    "apple music",
+    "xbox game pass",
+    "youtube premium",
+    "adobe creative cloud",
+    "metro by t-mobile",
+    "t-mobile",
+    "at&t",
+    "xfinity",
+    "comcast",
+    "audible",
+    "apple",
+    "microsoft",
+    "sirius",
+    "siriusxm",
+    "hbo",
+    "progressive",
+    "geico",
+    "affirm",
+    "afterpay",
+    "klarna",
+    "starz",
+    "cps energy",
+    "verizon",
+    "planet fitness",
+})
+
+
 def get_subscription_keyword_score(transaction: Transaction) -> float:
     """
     Detect subscription-related keywords in transaction names
     that strongly indicate recurring transactions.
     """
-    subscription_keywords = [
-        "monthly",
-        "subscription",
-        "premium",
-        "plus",
-        "membership",
-        "service",
-        "plan",
-        "bill",
-        "energy",
-        "utility",
-        "insurance",
-        "mobile",
-        "+",
-        "max",
-        "prime",
-        "fiber",
-        "internet",
-        "streaming",
-    ]
-
-    # Check for exact matches in the always_recurring_vendors list first
-    always_recurring_vendors = {
-        "google storage",
-        "netflix",
-        "hulu",
-        "spotify",
-        "amazon prime",
-        "disney+",
-        "apple music",
-        "xbox game pass",
-        "youtube premium",
-        "adobe creative cloud",
-        "metro by t-mobile",
-        "t-mobile",
-        "at&t",
-        "xfinity",
-        "comcast",
-        "audible",
-        "apple",
-        "microsoft",
-        "sirius",
-        "siriusxm",
-        "hbo",
-        "progressive",
-        "geico",
-        "affirm",
-        "afterpay",
-        "klarna",
-        "starz",
-        "cps energy",
-        "verizon",
-        "planet fitness",
-    }
-
-    if transaction.name.lower() in always_recurring_vendors:
+    # Check for exact matches against the known subscription vendors first
+    if transaction.name.lower() in SUBSCRIPTION_VENDORS:
         return 1.0
 
     # Check for keywords in the transaction name
-    txn_name_lower = transaction.name.lower()
-    for keyword in subscription_keywords:
-        if keyword in txn_name_lower:
-            return 0.8
+    if SUBSCRIPTION_KEYWORD_PATTERN.search(transaction.name.lower()):
+        return 0.8
 
     return 0.0
 
@@ -473,26 +518,10 @@ def get_phone_bill_indicator(transaction: Transaction) -> float:
     Detect phone bill payments
     (addressing Sprint and similar)
     """
-    telecom_providers = {
-        "sprint",
-        "t-mobile",
-        "verizon",
-        "at&t",
-        "cricket",
-        "boost",
-        "metropcs",
-        "phone",
-        "mobile",
-        "wireless",
-        "cellular",
-        "telecom",
-        "communications",
-    }
-
     name_lower = transaction.name.lower()
 
     # Check for telecom keywords
-    has_telecom_keyword = any(provider in name_lower for provider in telecom_providers)
+    has_telecom_keyword = TELECOM_KEYWORD_PATTERN.search(name_lower) is not None
 
     # Check for typical bill amounts
     is_typical_amount = 10.0 <= transaction.amount <= 200.0
@@ -1,22 +1,60 @@
 import datetime
-from collections import Counter
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from functools import lru_cache
 
 import numpy as np
 
 from recur_scan.transactions import Transaction
+from recur_scan.utils import get_date_ordinal, parse_date
+
+ALWAYS_RECURRING_VENDORS = frozenset({
+    "netflix",
+    "spotify",
+    "microsoft",
+    "amazon prime",
+    "at&t",
+    "verizon",
+    "spectrum",
+    "geico",
+    "hugo insurance",
+})
+# vendors whose recurring charges are small amounts ending in .99
+SMALL_99_CENT_VENDORS = frozenset({"apple", "brigit", "cleo ai", "credit genie"})
+
+
+@lru_cache(maxsize=128)
+def _sorted_vendor_ordinals(all_transactions: tuple[Transaction, ...]) -> dict[str, list[int]]:
+    """Per vendor name, the date ordinals of its transactions in ascending order"""
+    vendor_ordinals: defaultdict[str, list[int]] = defaultdict(list)
+    for t in all_transactions:
+        vendor_ordinals[t.name].append(get_date_ordinal(t.date))
+    return {name: sorted(ordinals) for name, ordinals in vendor_ordinals.items()}
+
+
+@lru_cache(maxsize=1024)
+def _vendor_interval_stats(all_transactions: tuple[Transaction, ...], name: str) -> tuple[float, int, int, float]:
+    """Mean, range, upper median and population std of a vendor's day gaps, computed together once per vendor"""
+    dates = _sorted_vendor_ordinals(all_transactions)[name]
+    date_diffs = np.diff(dates)
+    n_diffs = len(date_diffs)
+    # consecutive gaps telescope, so their sum is the whole span
+    avg_frequency = (dates[-1] - dates[0]) / n_diffs
+    middle = n_diffs // 2
+    median_frequency = int(np.partition(date_diffs, middle)[middle])  # the upper median, without a full sort
+    std_frequency = float(np.sqrt(np.square(date_diffs - avg_frequency).mean()))
+    date_variability = int(np.ptp(date_diffs))
+    return avg_frequency, date_variability, median_frequency, std_frequency
 
 
 def get_frequency_features(transaction: Transaction, all_transactions: list[Transaction]) -> dict[str, float]:
-    merchant_transactions = [t for t in all_transactions if t.name == transaction.name]
-    if len(merchant_transactions) < 2:
+    transactions = tuple(all_transactions)
+    if len(_sorted_vendor_ordinals(transactions).get(transaction.name, [])) < 2:
         return {"frequency": 0.0, "date_variability": 0.0, "median_frequency": 0.0, "std_frequency": 0.0}
 
-    dates = sorted([datetime.datetime.strptime(t.date, "%Y-%m-%d") for t in merchant_transactions])
-    date_diffs = [(dates[i + 1] - dates[i]).days for i in range(len(dates) - 1)]
-    avg_frequency = sum(date_diffs) / len(date_diffs)
-    median_frequency = sorted(date_diffs)[len(date_diffs) // 2]
-    std_frequency = (sum((x - avg_frequency) ** 2 for x in date_diffs) / len(date_diffs)) ** 0.5
-    date_variability = max(date_diffs) - min(date_diffs)
+    avg_frequency, date_variability, median_frequency, std_frequency = _vendor_interval_stats(
+        transactions, transaction.name
+    )
 
     return {
         "frequency_asimi": avg_frequency,
@@ -34,26 +72,13 @@ def is_valid_recurring_transaction(transaction: Transaction) -> bool:
     - For 'Apple', 'Brigit', 'Cleo AI', 'Credit Genie': Amount must end with '.99' (within floating point tolerance)
     and be less than 20. (Checking specific amounts is not reliable as they may change over time)
     """
-    vendor_name = transaction.name.lower()
-    amount = transaction.amount
-
-    always_recurring_vendors = {
-        "netflix",
-        "spotify",
-        "microsoft",
-        "amazon prime",
-        "at&t",
-        "verizon",
-        "spectrum",
-        "geico",
-        "hugo insurance",
-    }
+    vendor_name = transaction.name_lower
 
     # instead of checking for specific amounts, which may change over time, check for small amount ending in 0.99
-    if vendor_name in {"apple", "brigit", "cleo ai", "credit genie"}:
-        # Better way to check for .99 ending
-        return amount < 20.00 and abs(amount - round(amount) + 0.01) < 0.001  # Check if decimal part is ~0.99
-    elif vendor_name in always_recurring_vendors:
+    if vendor_name in SMALL_99_CENT_VENDORS:
+        # Check the .99 ending on whole cents
+        return transaction.amount < 20.00 and transaction.amount_cents % 100 == 99
+    elif vendor_name in ALWAYS_RECURRING_VENDORS:
         return True
     else:
         return True
@@ -76,25 +101,43 @@ def get_vendor_features(transaction: Transaction, all_transactions: list[Transac
 
 
 def get_time_features(transaction: Transaction, all_transactions: list[Transaction]) -> dict[str, int]:
-    date_obj = datetime.datetime.strptime(transaction.date, "%Y-%m-%d")
-    merchant_transactions = [t for t in all_transactions if t.name == transaction.name]
-    dates = sorted([datetime.datetime.strptime(t.date, "%Y-%m-%d") for t in merchant_transactions])
-    next_transaction_date = dates[dates.index(date_obj) + 1] if dates.index(date_obj) < len(dates) - 1 else None
-    days_until_next = (next_transaction_date - date_obj).days if next_transaction_date else 0
+    date_ord = get_date_ordinal(transaction.date)
+    dates = _sorted_vendor_ordinals(tuple(all_transactions))[transaction.name]
+    # the first occurrence of this date in the sorted dates, found by binary search
+    position = bisect_left(dates, date_ord)
+    next_transaction_date = dates[position + 1] if position < len(dates) - 1 else None
+    days_until_next = next_transaction_date - date_ord if next_transaction_date is not None else 0
 
     return {
-        "month_asimi": date_obj.month,
+        "month_asimi": parse_date(transaction.date).month,
         "days_until_next_transaction_asimi": days_until_next,
     }
 
 
+@lru_cache(maxsize=128)
+def _user_recurrence_counts(all_transactions: tuple[Transaction, ...]) -> dict[str, tuple[int, int, int]]:
+    """Per user: the number of transactions, how many are valid recurring, and how many vendors those span"""
+    user_transactions: defaultdict[str, list[Transaction]] = defaultdict(list)
+    for t in all_transactions:
+        user_transactions[t.user_id].append(t)
+    counts: dict[str, tuple[int, int, int]] = {}
+    for user_id, transactions in user_transactions.items():
+        recurring = [t for t in transactions if is_valid_recurring_transaction(t)]
+        counts[user_id] = (len(transactions), len(recurring), len({t.name for t in recurring}))
+    return counts
+
+
+def _user_counts(transaction: Transaction, all_transactions: list[Transaction]) -> tuple[int, int, int]:
+    """The _user_recurrence_counts entry for transaction's user"""
+    return _user_recurrence_counts(tuple(all_transactions)).get(transaction.user_id, (0, 0, 0))
+
+
 def get_user_recurrence_rate(transaction: Transaction, all_transactions: list[Transaction]) -> dict[str, float]:
-    user_transactions = [t for t in all_transactions if t.user_id == transaction.user_id]
-    if len(user_transactions) < 2:
+    n_user_transactions, recurring_count, _ = _user_counts(transaction, all_transactions)
+    if n_user_transactions < 2:
         return {"user_recurrence_rate": 0.0}
 
-    recurring_count = sum(1 for t in user_transactions if is_valid_recurring_transaction(t))
-    user_recurrence_rate = recurring_count / len(user_transactions)
+    user_recurrence_rate = recurring_count / n_user_transactions
 
     return {
         "user_recurrence_rate_asimi": user_recurrence_rate,
@@ -102,16 +145,15 @@ def get_user_recurrence_rate(transaction: Transaction, all_transactions: list[Tr
 
 
 def get_user_specific_features(transaction: Transaction, all_transactions: list[Transaction]) -> dict[str, float]:
-    user_transactions = [t for t in all_transactions if t.user_id == transaction.user_id]
-    if len(user_transactions) < 2:
+    n_user_transactions, recurring_count, _ = _user_counts(transaction, all_transactions)
+    if n_user_transactions < 2:
         return {
             # "user_transaction_count_asimi": 0.0,
             "user_recurring_transaction_count_asimi": 0.0,
             "user_recurring_transaction_rate_asimi": 0.0,
         }
 
-    recurring_count = sum(1 for t in user_transactions if is_valid_recurring_transaction(t))
-    user_recurring_transaction_rate = recurring_count / len(user_transactions)
+    user_recurring_transaction_rate = recurring_count / n_user_transactions
 
     return {
         # "user_transaction_count_asimi": len(user_transactions),
@@ -121,9 +163,8 @@ def get_user_specific_features(transaction: Transaction, all_transactions: list[
 
 
 def get_user_recurring_vendor_count(transaction: Transaction, all_transactions: list[Transaction]) -> dict[str, int]:
-    user_transactions = [t for t in all_transactions if t.user_id == transaction.user_id]
-    recurring_vendors = {t.name for t in user_transactions if is_valid_recurring_transaction(t)}
-    return {"user_recurring_vendor_count_asimi": len(recurring_vendors)}
+    _, _, recurring_vendor_count = _user_counts(transaction, all_transactions)
+    return {"user_recurring_vendor_count_asimi": recurring_vendor_count}
 
 
 def get_user_transaction_frequency(transaction: Transaction, all_transactions: list[Transaction]) -> dict[str, float]:
@@ -133,10 +174,10 @@ def get_user_transaction_frequency(transaction: Transaction, all_transactions: l
 
     # Sort transactions by date
     user_transactions_sorted = sorted(user_transactions, key=lambda t: t.date)
-    dates = [datetime.datetime.strptime(t.date, "%Y-%m-%d") for t in user_transactions_sorted]
+    dates = [get_date_ordinal(t.date) for t in user_transactions_sorted]
 
     # Calculate the average time between transactions
-    date_diffs = [(dates[i + 1] - dates[i]).days for i in range(len(dates) - 1)]
+    date_diffs = [dates[i + 1] - dates[i] for i in range(len(dates) - 1)]
     avg_frequency = sum(date_diffs) / len(date_diffs)
 
     return {"user_transaction_frequency_asimi": avg_frequency}
@@ -147,11 +188,9 @@ def get_vendor_amount_std(transaction: Transaction, all_transactions: list[Trans
     if len(vendor_transactions) < 2:
         return {"vendor_amount_std_asimi": 0.0}
 
-    amounts = [t.amount for t in vendor_transactions]
-    mean_amount = sum(amounts) / len(amounts)
-    std_amount = (sum((x - mean_amount) ** 2 for x in amounts) / len(amounts)) ** 0.5
+    amounts = np.fromiter((t.amount for t in vendor_transactions), dtype=float, count=len(vendor_transactions))
 
-    return {"vendor_amount_std_asimi": std_amount}
+    return {"vendor_amount_std_asimi": float(amounts.std())}
 
 
 def get_vendor_recurring_user_count(transaction: Transaction, all_transactions: list[Transaction]) -> dict[str, int]:
@@ -167,10 +206,10 @@ def get_vendor_transaction_frequency(transaction: Transaction, all_transactions:
 
     # Sort transactions by date
     vendor_transactions_sorted = sorted(vendor_transactions, key=lambda t: t.date)
-    dates = [datetime.datetime.strptime(t.date, "%Y-%m-%d") for t in vendor_transactions_sorted]
+    dates = [get_date_ordinal(t.date) for t in vendor_transactions_sorted]
 
     # Calculate the average time between transactions
-    date_diffs = [(dates[i + 1] - dates[i]).days for i in range(len(dates) - 1)]
+    date_diffs = [dates[i + 1] - dates[i] for i in range(len(dates) - 1)]
     avg_frequency = sum(date_diffs) / len(date_diffs)
 
     return {"vendor_transaction_frequency_asimi": avg_frequency}
@@ -227,8 +266,8 @@ def get_temporal_consistency_features(
             # "is_weekly_consistent_asimi": 0,
         }
 
-    dates = sorted([datetime.datetime.strptime(t.date, "%Y-%m-%d") for t in vendor_transactions])
-    date_diffs = [(dates[i + 1] - dates[i]).days for i in range(len(dates) - 1)]
+    dates = sorted([get_date_ordinal(t.date) for t in vendor_transactions])
+    date_diffs = [dates[i + 1] - dates[i] for i in range(len(dates) - 1)]
 
     # Check for monthly consistency (28-31 day intervals)
     monthly_diffs = [diff for diff in date_diffs if 28 <= diff <= 31]
@@ -314,8 +353,8 @@ def get_user_vendor_relationship_features(
 
     # Calculate tenure (days since first transaction with this vendor)
     if user_vendor_transactions:
-        dates = [datetime.datetime.strptime(t.date, "%Y-%m-%d") for t in user_vendor_transactions]
-        tenure = (max(dates) - min(dates)).days
+        dates = [get_date_ordinal(t.date) for t in user_vendor_transactions]
+        tenure = max(dates) - min(dates)
     else:
         tenure = 0
 
@@ -352,10 +391,10 @@ def is_annual_subscription(transaction: Transaction, all_transactions: list[Tran
         return False
 
     intervals = []
-    dates = [datetime.datetime.strptime(t.date, "%Y-%m-%d") for t in user_vendor_txns]
+    dates = [get_date_ordinal(t.date) for t in user_vendor_txns]
 
     for i in range(1, len(dates)):
-        intervals.append((dates[i] - dates[i - 1]).days)
+        intervals.append(dates[i] - dates[i - 1])
 
     return any(350 <= delta <= 380 for delta in intervals)
 
@@ -370,11 +409,11 @@ def get_recurrence_streak(transaction: Transaction, all_transactions: list[Trans
         return 0
 
     streak = 0
-    dates = [datetime.datetime.strptime(t.date, "%Y-%m-%d") for t in vendor_trans]
+    dates = [get_date_ordinal(t.date) for t in vendor_trans]
     amounts = [t.amount for t in vendor_trans]
 
     for i in range(1, len(dates)):
-        delta = (dates[i] - dates[i - 1]).days
+        delta = dates[i] - dates[i - 1]
         amount_diff = abs(amounts[i] - amounts[i - 1])
 
         if 25 <= delta <= 35 and amount_diff < 0.1:
@@ -413,7 +452,7 @@ def get_amount_frequency_score(transaction: Transaction, all_transactions: list[
     return round(freq, 2)
 
 
-def calculate_day_of_month_consistency(dates: list[datetime.datetime]) -> float:
+def calculate_day_of_month_consistency(dates: list[datetime.date]) -> float:
     """Calculate consistency of transaction day of month (0-1 scale)."""
     if len(dates) < 3:
         return 0.0
@@ -456,8 +495,8 @@ def get_interval_precision(transaction: Transaction, all_transactions: list[Tran
     if len(vendor_trans) < 3:
         return 0.0
 
-    dates = [datetime.datetime.strptime(t.date, "%Y-%m-%d") for t in vendor_trans]
-    intervals = [(dates[i + 1] - dates[i]).days for i in range(len(dates) - 1)]
+    dates = [get_date_ordinal(t.date) for t in vendor_trans]
+    intervals = [dates[i + 1] - dates[i] for i in range(len(dates) - 1)]
 
     if transaction.name == "Apple":
         monthly_intervals = sum(25 <= diff <= 35 for diff in intervals)
@@ -487,8 +526,8 @@ def get_amount_temporal_consistency(transaction: Transaction, all_transactions:
         amount_std = 0.0
 
     # Temporal regularity (interval coefficient of variation)
-    dates = [datetime.datetime.strptime(t.date, "%Y-%m-%d") for t in vendor_trans]
-    intervals = np.diff([d.toordinal() for d in dates])
+    dates = [parse_date(t.date) for t in vendor_trans]
+    intervals = np.diff([get_date_ordinal(t.date) for t in vendor_trans])
     interval_cv = np.std(intervals) / (np.mean(intervals) + 1e-9)
 
     # Day-of-month consistency (new addition)
@@ -509,12 +548,11 @@ def get_burst_score(transaction: Transaction, all_transactions: list[Transaction
         return 0.0
 
     # Find transactions within 7 days with similar amounts
-    current_date = datetime.datetime.strptime(transaction.date, "%Y-%m-%d")
+    current_date = get_date_ordinal(transaction.date)
     similar_trans = [
         t
         for t in user_trans[-10:]
-        if abs((datetime.datetime.strptime(t.date, "%Y-%m-%d") - current_date).days) <= 7
-        and abs(t.amount - transaction.amount) < 2.0
+        if abs(get_date_ordinal(t.date) - current_date) <= 7 and abs(t.amount - transaction.amount) < 2.0
     ]
 
     return float(min(len(similar_trans) / 3.0, 1.0))  # Cap at 1.0
@@ -536,10 +574,7 @@ def get_series_duration(transaction: Transaction, all_transactions: list[Transac
         return 0.0
 
     sorted_trans = sorted(similar_transactions, key=lambda x: x.date)
-    duration_days = (
-        datetime.datetime.strptime(sorted_trans[-1].date, "%Y-%m-%d")
-        - datetime.datetime.strptime(sorted_trans[0].date, "%Y-%m-%d")
-    ).days
+    duration_days = get_date_ordinal(sorted_trans[-1].date) - get_date_ordinal(sorted_trans[0].date)
 
     # Normalize score (0-1) where 1 = 1+ year of history
     return round(min(1.0, duration_days / 365), 2)
@@ -557,16 +592,17 @@ def is_apple_subscription(transaction: Transaction, all_transactions: list[Trans
     if len(vendor_trans) < 4:  # Require at least 4 transactions to establish a pattern
         return False
 
-    dates = [datetime.datetime.strptime(t.date, "%Y-%m-%d") for t in vendor_trans]
+    dates = [parse_date(t.date) for t in vendor_trans]
+    ordinals = [get_date_ordinal(t.date) for t in vendor_trans]
 
     # ===== New Checks =====
     # 1. Burst Detection - reject if multiple charges in short windows
-    short_gaps = sum((dates[i + 1] - dates[i]).days <= 14 for i in range(len(dates) - 1))
+    short_gaps = sum(ordinals[i + 1] - ordinals[i] <= 14 for i in range(len(ordinals) - 1))
     if short_gaps > len(dates) * 0.25:  # If >25% of gaps are <=14 days
         return False
 
     # 2. Stricter Interval Checking
-    intervals = [(dates[i + 1] - dates[i]).days for i in range(len(dates) - 1)]
+    intervals = [ordinals[i + 1] - ordinals[i] for i in range(len(ordinals) - 1)]
 
     # Check for consistent monthly pattern (28-31 days)
     monthly_count = sum(28 <= diff <= 31 for diff in intervals)
@@ -667,8 +703,8 @@ def get_apple_interval_score(transaction: Transaction, all_transactions: list[Tr
     if len(vendor_trans) < 3:
         return 0.0
 
-    dates = [datetime.datetime.strptime(t.date, "%Y-%m-%d") for t in vendor_trans]
-    intervals = [(dates[i + 1] - dates[i]).days for i in range(len(dates) - 1)]
+    dates = [get_date_ordinal(t.date) for t in vendor_trans]
+    intervals = [dates[i + 1] - dates[i] for i in range(len(dates) - 1)]
 
     # Score: % of intervals that are 25-35 days (Apple's flexible billing cycle)
     monthly_intervals = sum(28 <= diff <= 31 for diff in intervals)
@@ -706,8 +742,8 @@ def get_loan_repayment_score(transaction: Transaction, all_transactions: list[Tr
         return 0.0  # Amounts vary too much for a loan repayment
 
     # Step 3: Check interval consistency (weekly = ~7 days)
-    dates = sorted([datetime.datetime.strptime(t.date, "%Y-%m-%d") for t in user_transactions])
-    intervals = [(dates[i + 1] - dates[i]).days for i in range(len(dates) - 1)]
+    dates = sorted([get_date_ordinal(t.date) for t in user_transactions])
+    intervals = [dates[i + 1] - dates[i] for i in range(len(dates) - 1)]
 
     # Allow ±1 day flexibility (e.g., 6-8 days for weekly payments)
     weekly_intervals = sum(6 <= diff <= 8 for diff in intervals)
@@ -1,26 +1,31 @@
 import re
-from collections import defaultdict
+from bisect import bisect_left
+from collections import Counter, defaultdict
 from datetime import datetime
+from functools import lru_cache
 
 from recur_scan.transactions import Transaction
 
+SUBSCRIPTION_PATTERN = re.compile(r"\b(subscription|monthly|recurring)\b", re.IGNORECASE)
+GYM_MEMBERSHIP_PATTERN = re.compile(r"\b(gym|fitness|membership|planet fitness)\b", re.IGNORECASE)
+
 
 def get_is_subscription(transaction: Transaction) -> bool:
     """Check if the transaction is a subscription payment."""
-    match = re.search(r"\b(subscription|monthly|recurring)\b", transaction.name, re.IGNORECASE)
-    return bool(match)
+    return bool(SUBSCRIPTION_PATTERN.search(transaction.name))
+
+
+STREAMING_SERVICES = frozenset({"netflix", "hulu", "spotify", "disney+"})
 
 
 def get_is_streaming_service(transaction: Transaction) -> bool:
     """Check if the transaction is a streaming service payment."""
-    streaming_services = {"netflix", "hulu", "spotify", "disney+"}
-    return transaction.name.lower() in streaming_services
+    return transaction.name_lower in STREAMING_SERVICES
 
 
 def get_is_gym_membership(transaction: Transaction) -> bool:
     """Check if the transaction is a gym membership payment."""
-    match = re.search(r"\b(gym|fitness|membership|planet fitness)\b", transaction.name, re.IGNORECASE)
-    return bool(match)
+    return bool(GYM_MEMBERSHIP_PATTERN.search(transaction.name))
 
 
 # The following functions are the new features added by Bassey
@@ -114,30 +119,47 @@ def get_monthly_spending_average_bassey(transaction: Transaction, all_transactio
     return sum(monthly_transactions) / len(monthly_transactions) if monthly_transactions else 0.0
 
 
+@lru_cache(maxsize=128)
+def _merchant_months(all_transactions: tuple[Transaction, ...]) -> dict[str, set[tuple[int, int]]]:
+    """Get the (year, month) pairs each merchant appears in, once per distinct list of transactions"""
+    merchant_months: defaultdict[str, set[tuple[int, int]]] = defaultdict(set)
+    for t in all_transactions:
+        t_date = datetime.strptime(t.date, "%Y-%m-%d")
+        merchant_months[t.name].add((t_date.year, t_date.month))
+    return dict(merchant_months)
+
+
 def get_is_merchant_recurring_bassey(transaction: Transaction, all_transactions: list[Transaction]) -> bool:
     """Check if the merchant appears in multiple months for the user."""
-    merchant_months = set()
-    for t in all_transactions:
-        if t.name == transaction.name:
-            t_date = datetime.strptime(t.date, "%Y-%m-%d")
-            merchant_months.add((t_date.year, t_date.month))
-    return len(merchant_months) > 1
+    return len(_merchant_months(tuple(all_transactions)).get(transaction.name, ())) > 1
+
+
+@lru_cache(maxsize=128)
+def _sorted_date_ordinals(all_transactions: tuple[Transaction, ...]) -> list[int]:
+    """Get the date ordinals in ascending order, once per distinct list of transactions"""
+    return sorted(t.date_ordinal for t in all_transactions)
 
 
 def get_days_since_last_transaction_bassey(transaction: Transaction, all_transactions: list[Transaction]) -> int:
     """Calculate the number of days since the user's last transaction."""
-    t_date = datetime.strptime(transaction.date, "%Y-%m-%d")
-    previous_dates = [datetime.strptime(t.date, "%Y-%m-%d") for t in all_transactions if t.date < transaction.date]
-    if not previous_dates:
+    ordinals = _sorted_date_ordinals(tuple(all_transactions))
+    t_ordinal = transaction.date_ordinal
+    # the number of transactions on earlier dates, found by binary search
+    n_previous = bisect_left(ordinals, t_ordinal)
+    if n_previous == 0:
         return -1  # No previous transactions
-    last_date = max(previous_dates)
-    return (t_date - last_date).days
+    return t_ordinal - ordinals[n_previous - 1]
+
+
+@lru_cache(maxsize=128)
+def _date_counts(all_transactions: tuple[Transaction, ...]) -> Counter[str]:
+    """Count the transactions on each date, once per distinct list of transactions"""
+    return Counter(t.date for t in all_transactions)
 
 
 def get_is_same_day_multiple_transactions_bassey(transaction: Transaction, all_transactions: list[Transaction]) -> bool:
     """Check if there are multiple transactions on the same day."""
-    same_day_transactions = [t for t in all_transactions if t.date == transaction.date]
-    return len(same_day_transactions) > 1
+    return _date_counts(tuple(all_transactions))[transaction.date] > 1
 
 
 def get_new_features(transaction: Transaction, all_transactions: list[Transaction]) -> dict[str, int | bool | float]:
@@ -1,6 +1,9 @@
 from datetime import datetime, timedelta
+from functools import lru_cache
 from statistics import StatisticsError, mean, median, stdev
 
+import numpy as np
+
 from recur_scan.transactions import Transaction
 from recur_scan.utils import parse_date
 
@@ -25,13 +28,19 @@ def std_amount_all_chris(all_transactions: list[Transaction]) -> float:
         return 0.0
 
 
+@lru_cache(maxsize=128)
+def _amounts_chris(transactions: tuple[Transaction, ...]) -> np.ndarray:
+    """Transaction amounts as an array, built once per list so amount matches are one vectorized comparison."""
+    return np.fromiter((t.amount for t in transactions), dtype=np.float64, count=len(transactions))
+
+
 def get_n_transactions_same_amount_chris(transaction: Transaction, all_transactions: list[Transaction]) -> int:
     """
     Count transactions with amounts that match within a 1% tolerance.
     This tolerance helps capture minor variations due to rounding.
     """
     tol = 0.01 * transaction.amount if transaction.amount != 0 else 0.01
-    return sum(1 for t in all_transactions if abs(t.amount - transaction.amount) <= tol)
+    return int(np.count_nonzero(np.abs(_amounts_chris(tuple(all_transactions)) - transaction.amount) <= tol))
 
 
 def get_percent_transactions_same_amount_chris(transaction: Transaction, all_transactions: list[Transaction]) -> float:
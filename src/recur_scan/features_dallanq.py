@@ -1,45 +1,146 @@
 import re
 from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
 
 import numpy as np
 
 from recur_scan.transactions import Transaction
-from recur_scan.utils import get_day, parse_date
+from recur_scan.utils import get_date_ordinal, get_day, parse_date
+
+INSURANCE_PATTERN = re.compile(r"\b(insurance|insur|insuranc)\b", re.IGNORECASE)
+UTILITY_PATTERN = re.compile(r"\b(utility|utilit|energy)\b", re.IGNORECASE)
+PHONE_PATTERN = re.compile(r"\b(at&t|t-mobile|verizon)\b", re.IGNORECASE)
+
+
+def _keyword_pattern(*keywords: str) -> re.Pattern[str]:
+    """One alternation matching any of the keywords anywhere in a lowercased name, longest keywords first"""
+    return re.compile("|".join(re.escape(keyword) for keyword in sorted(keywords, key=len, reverse=True)))
+
+
+AMAZON_PRIME_PATTERN = _keyword_pattern("amazon prime", "amazon.ca prime")
+LOAN_COMPANY_PATTERN = _keyword_pattern("lending", "credit ninja", "creditninja")
+PAY_IN_FOUR_COMPANY_PATTERN = _keyword_pattern("afterpay", "sezzle")
+CASH_ADVANCE_COMPANY_PATTERN = _keyword_pattern(
+    "empower", "brigit", "cleo", "credit genie", "creditgenie", "dave", "albert", "moneylion", "money lion"
+)
+PHONE_COMPANY_PATTERN = _keyword_pattern("verizon", "t-mobile", "wireless", "sprint")
+SUBSCRIPTION_COMPANY_PATTERN = _keyword_pattern(
+    "spotify",
+    "spectrum",
+    "comcast",
+    "youtube premium",
+    "espn+",
+    "amazon music",
+    "audible",
+    "netflix",
+    "disney+",
+    "bet+",
+    "hulu",
+    "hbo max",
+    "peacock",
+    "paramount+",
+    "showtime",
+    "walmart+",
+    "amazon kids+",
+    "starz",
+    "twitch",
+    "wix",
+    "linkedin",
+    "xfinity",
+)
+USUALLY_SUBSCRIPTION_COMPANY_PATTERN = _keyword_pattern(
+    "membership",
+    "fitness",
+    "gym",
+    "club",
+    "monthly",
+    "property",
+    "credit",
+    "storage",
+    "amazon digital",
+    "amazon kindle",
+    "disney",
+    "siriusxm",
+    "adobe",
+    "youtube",
+    "patreon",
+    "google",
+    "directv",
+    "rocket money",
+)
+UTILITY_COMPANY_PATTERN = _keyword_pattern("utility", "utilities", "energy", "electric", "water", "pg&e", "municipal")
+INSURANCE_COMPANY_PATTERN = _keyword_pattern(
+    "insurance", "geico", "progressive", "allstate", "state farm", "farmers", "liberty mutual"
+)
+CARWASH_COMPANY_PATTERN = _keyword_pattern(" wash", "carwash")
+RENTAL_COMPANY_PATTERN = _keyword_pattern("rent", "property")
+SUBSCRIPTION_AMOUNTS = frozenset({0.99, 1.99, 2.99, 4.99, 5.99, 9.99, 14.99, 19.99, 24.99, 29.99, 34.99, 39.99})
+
+ALWAYS_RECURRING_VENDORS = frozenset({
+    "google storage",
+    "netflix",
+    "hulu",
+    "spotify",
+})
 
 
 def get_is_always_recurring(transaction: Transaction) -> bool:
     """Check if the transaction is always recurring because of the vendor name - check lowercase match"""
-    always_recurring_vendors = {
-        "google storage",
-        "netflix",
-        "hulu",
-        "spotify",
-    }
-    return transaction.name.lower() in always_recurring_vendors
+    return transaction.name_lower in ALWAYS_RECURRING_VENDORS
 
 
 def get_is_insurance(transaction: Transaction) -> bool:
     """Check if the transaction is an insurance payment."""
     # use a regular expression with boundaries to match case-insensitive insurance
     # and insurance-related terms
-    match = re.search(r"\b(insurance|insur|insuranc)\b", transaction.name, re.IGNORECASE)
-    return bool(match)
+    return bool(INSURANCE_PATTERN.search(transaction.name))
 
 
 def get_is_utility(transaction: Transaction) -> bool:
     """Check if the transaction is a utility payment."""
     # use a regular expression with boundaries to match case-insensitive utility
     # and utility-related terms
-    match = re.search(r"\b(utility|utilit|energy)\b", transaction.name, re.IGNORECASE)
-    return bool(match)
+    return bool(UTILITY_PATTERN.search(transaction.name))
 
 
 def get_is_phone(transaction: Transaction) -> bool:
     """Check if the transaction is a phone payment."""
     # use a regular expression with boundaries to match case-insensitive phone
     # and phone-related terms
-    match = re.search(r"\b(at&t|t-mobile|verizon)\b", transaction.name, re.IGNORECASE)
-    return bool(match)
+    return bool(PHONE_PATTERN.search(transaction.name))
+
+
+@dataclass(frozen=True)
+class _TransactionColumns:
+    """One array per transaction field, in list order, so filters are vectorized masks instead of list scans"""
+
+    ordinals: np.ndarray
+    amounts: np.ndarray
+    days_of_month: np.ndarray
+
+
+@lru_cache(maxsize=128)
+def _columns(transactions: tuple[Transaction, ...]) -> _TransactionColumns:
+    """Build the columns once per distinct list of transactions"""
+    n = len(transactions)
+    return _TransactionColumns(
+        ordinals=np.fromiter((get_date_ordinal(t.date) for t in transactions), dtype=np.int64, count=n),
+        amounts=np.fromiter((t.amount for t in transactions), dtype=np.float64, count=n),
+        days_of_month=np.fromiter((get_day(t.date) for t in transactions), dtype=np.int64, count=n),
+    )
+
+
+def _sorted_intervals(ordinals: np.ndarray) -> np.ndarray:
+    """Day gaps between successive dates"""
+    return np.diff(np.sort(ordinals))
+
+
+def _count_days_apart(days_diff: np.ndarray, n_days_apart: int, n_days_off: int) -> int:
+    """Count day differences that are at least one period long and within n_days_off of a multiple of n_days_apart"""
+    remainder = days_diff % n_days_apart
+    near_multiple = (remainder <= n_days_off) | (remainder >= n_days_apart - n_days_off)
+    return int(np.count_nonzero((days_diff >= n_days_apart - n_days_off) & near_multiple))
 
 
 def get_n_transactions_days_apart(
@@ -52,28 +153,8 @@ def get_n_transactions_days_apart(
     Get the number of transactions in all_transactions that are within n_days_off of
     being n_days_apart from transaction
     """
-    n_txs = 0
-    transaction_date = parse_date(transaction.date)
-
-    # Pre-calculate bounds for faster checking
-    lower_remainder = n_days_apart - n_days_off
-    upper_remainder = n_days_off
-
-    for t in all_transactions:
-        t_date = parse_date(t.date)
-        days_diff = abs((t_date - transaction_date).days)
-
-        # Skip if the difference is less than minimum required
-        if days_diff < n_days_apart - n_days_off:
-            continue
-
-        # Check if the difference is close to any multiple of n_days_apart
-        remainder = days_diff % n_days_apart
-
-        if remainder <= upper_remainder or remainder >= lower_remainder:
-            n_txs += 1
-
-    return n_txs
+    ordinals = _columns(tuple(all_transactions)).ordinals
+    return _count_days_apart(np.abs(ordinals - get_date_ordinal(transaction.date)), n_days_apart, n_days_off)
 
 
 def get_pct_transactions_days_apart(
@@ -90,7 +171,8 @@ def get_pct_transactions_days_apart(
 
 def get_n_transactions_same_day(transaction: Transaction, all_transactions: list[Transaction], n_days_off: int) -> int:
     """Get the number of transactions in all_transactions that are on the same day of the month as transaction"""
-    return len([t for t in all_transactions if abs(get_day(t.date) - get_day(transaction.date)) <= n_days_off])
+    days_of_month = _columns(tuple(all_transactions)).days_of_month
+    return int(np.count_nonzero(np.abs(days_of_month - get_day(transaction.date)) <= n_days_off))
 
 
 def get_pct_transactions_same_day(
@@ -102,25 +184,30 @@ def get_pct_transactions_same_day(
 
 def get_ends_in_99(transaction: Transaction) -> bool:
     """Check if the transaction amount ends in 99"""
-    return abs((transaction.amount * 100) % 100 - 99) < 0.001
+    return transaction.amount_cents % 100 == 99
+
+
+@lru_cache(maxsize=128)
+def _amount_counts(transactions: tuple[Transaction, ...]) -> Counter[float]:
+    """Count each amount once per distinct list of transactions, so lookups are O(1) per transaction"""
+    return Counter(t.amount for t in transactions)
 
 
 def get_n_transactions_same_amount(transaction: Transaction, all_transactions: list[Transaction]) -> int:
     """Get the number of transactions in all_transactions with the same amount as transaction"""
-    return len([t for t in all_transactions if t.amount == transaction.amount])
+    return _amount_counts(tuple(all_transactions))[transaction.amount]
 
 
 def get_percent_transactions_same_amount(transaction: Transaction, all_transactions: list[Transaction]) -> float:
     """Get the percentage of transactions in all_transactions with the same amount as transaction"""
     if not all_transactions:
         return 0.0
-    n_same_amount = len([t for t in all_transactions if t.amount == transaction.amount])
-    return n_same_amount / len(all_transactions)
+    return get_n_transactions_same_amount(transaction, all_transactions) / len(all_transactions)
 
 
 def get_transaction_z_score(transaction: Transaction, all_transactions: list[Transaction]) -> float:
     """Get the z-score of the transaction amount compared to the mean and standard deviation of all_transactions."""
-    all_amounts = [t.amount for t in all_transactions]
+    all_amounts = _columns(tuple(all_transactions)).amounts
     # if the standard deviation is 0, return 0
     try:
         std_dev = float(np.std(all_amounts))
@@ -150,35 +237,33 @@ def count_transactions(all_transactions: list[Transaction]) -> int:
 
 def days_since_last(transaction: Transaction, all_transactions: list[Transaction]) -> float:
     """Days since the previous transaction (-1.0 if none)."""
-    dates = sorted(parse_date(t.date) for t in all_transactions)
-    cur = parse_date(transaction.date)
-    prev = [d for d in dates if d < cur]
-    return (cur - max(prev)).days if prev else -1.0
+    ordinals = _columns(tuple(all_transactions)).ordinals
+    cur = get_date_ordinal(transaction.date)
+    prev = ordinals[ordinals < cur]
+    return int(cur - prev.max()) if prev.size else -1.0
 
 
 def days_until_next(transaction: Transaction, all_transactions: list[Transaction]) -> float:
     """Days until the next transaction (-1.0 if none)."""
-    dates = sorted(parse_date(t.date) for t in all_transactions)
-    cur = parse_date(transaction.date)
-    fut = [d for d in dates if d > cur]
-    return (min(fut) - cur).days if fut else -1.0
+    ordinals = _columns(tuple(all_transactions)).ordinals
+    cur = get_date_ordinal(transaction.date)
+    fut = ordinals[ordinals > cur]
+    return int(fut.min() - cur) if fut.size else -1.0
 
 
 def mean_days_between(all_transactions: list[Transaction]) -> float:
     """Mean interval (in days) between successive transactions."""
-    dates = sorted(parse_date(t.date) for t in all_transactions)
-    if len(dates) < 2:
+    if len(all_transactions) < 2:
         return -1.0
-    diffs = [(dates[i] - dates[i - 1]).days for i in range(1, len(dates))]
+    diffs = _sorted_intervals(_columns(tuple(all_transactions)).ordinals)
     return float(np.mean(diffs))
 
 
 def std_days_between(all_transactions: list[Transaction]) -> float:
     """Std. dev. of intervals (in days) between successive transactions."""
-    dates = sorted(parse_date(t.date) for t in all_transactions)
-    if len(dates) < 2:
+    if len(all_transactions) < 2:
         return -1.0
-    diffs = [(dates[i] - dates[i - 1]).days for i in range(1, len(dates))]
+    diffs = _sorted_intervals(_columns(tuple(all_transactions)).ordinals)
     try:
         return float(np.std(diffs, ddof=1))
     except Exception:
@@ -202,35 +287,39 @@ def regularity_score(all_transactions: list[Transaction]) -> float:
 
 def days_since_last_same_amount(transaction: Transaction, all_transactions: list[Transaction]) -> float:
     """Days since the previous transaction with the same amount (-1 if none)."""
-    dates = sorted(parse_date(t.date) for t in all_transactions if t.amount == transaction.amount)
-    cur = parse_date(transaction.date)
-    prev = [d for d in dates if d < cur]
-    return (cur - max(prev)).days if prev else -1.0
+    columns = _columns(tuple(all_transactions))
+    ordinals, amounts = columns.ordinals, columns.amounts
+    cur = get_date_ordinal(transaction.date)
+    prev = ordinals[(amounts == transaction.amount) & (ordinals < cur)]
+    return int(cur - prev.max()) if prev.size else -1.0
 
 
 def days_until_next_same_amount(transaction: Transaction, all_transactions: list[Transaction]) -> float:
     """Days until the next transaction with the same amount (-1 if none)."""
-    dates = sorted(parse_date(t.date) for t in all_transactions if t.amount == transaction.amount)
-    cur = parse_date(transaction.date)
-    fut = [d for d in dates if d > cur]
-    return (min(fut) - cur).days if fut else -1.0
+    columns = _columns(tuple(all_transactions))
+    ordinals, amounts = columns.ordinals, columns.amounts
+    cur = get_date_ordinal(transaction.date)
+    fut = ordinals[(amounts == transaction.amount) & (ordinals > cur)]
+    return int(fut.min() - cur) if fut.size else -1.0
 
 
 def mean_days_between_same_amount(transaction: Transaction, all_transactions: list[Transaction]) -> float:
     """Mean interval (in days) between successive transactions with the same amount."""
-    dates = sorted(parse_date(t.date) for t in all_transactions if t.amount == transaction.amount)
-    if len(dates) < 2:
+    columns = _columns(tuple(all_transactions))
+    same_amount_ordinals = columns.ordinals[columns.amounts == transaction.amount]
+    if len(same_amount_ordinals) < 2:
         return -1.0
-    diffs = [(dates[i] - dates[i - 1]).days for i in range(1, len(dates))]
+    diffs = _sorted_intervals(same_amount_ordinals)
     return float(np.mean(diffs))
 
 
 def std_days_between_same_amount(transaction: Transaction, all_transactions: list[Transaction]) -> float:
     """Std. dev. of intervals (in days) between successive transactions with the same amount."""
-    dates = sorted(parse_date(t.date) for t in all_transactions if t.amount == transaction.amount)
-    if len(dates) < 2:
+    columns = _columns(tuple(all_transactions))
+    same_amount_ordinals = columns.ordinals[columns.amounts == transaction.amount]
+    if len(same_amount_ordinals) < 2:
         return -1.0
-    diffs = [(dates[i] - dates[i - 1]).days for i in range(1, len(dates))]
+    diffs = _sorted_intervals(same_amount_ordinals)
     try:
         return float(np.std(diffs, ddof=1))
     except Exception:
@@ -251,8 +340,8 @@ def regularity_score_same_amount(transaction: Transaction, all_transactions: lis
 
 def transaction_span_days(all_transactions: list[Transaction]) -> float:
     """Total span (in days) from first to last transaction."""
-    dates = [parse_date(t.date) for t in all_transactions]
-    return (max(dates) - min(dates)).days if dates else -1.0
+    ordinals = _columns(tuple(all_transactions)).ordinals
+    return int(ordinals.max() - ordinals.min()) if ordinals.size else -1.0
 
 
 # ——— Recency / Frequency ———
@@ -262,9 +351,9 @@ def count_last_n_days(transaction: Transaction, all_transactions: list[Transacti
     """
     Count of transactions in the past n days *before* this transaction.
     """
-    cur = parse_date(transaction.date)
-    prior = [t for t in all_transactions if 0 < (cur - parse_date(t.date)).days <= n]
-    return len(prior)
+    ordinals = _columns(tuple(all_transactions)).ordinals
+    days_before = get_date_ordinal(transaction.date) - ordinals
+    return int(np.count_nonzero((days_before > 0) & (days_before <= n)))
 
 
 def count_last_28_days(transaction: Transaction, all_transactions: list[Transaction]) -> int:
@@ -284,13 +373,13 @@ def count_last_90_days(transaction: Transaction, all_transactions: list[Transact
 
 def mean_amount(all_transactions: list[Transaction]) -> float:
     """Average transaction amount for this group."""
-    amounts = [t.amount for t in all_transactions]
-    return float(np.mean(amounts)) if amounts else -1.0
+    amounts = _columns(tuple(all_transactions)).amounts
+    return float(np.mean(amounts)) if amounts.size else -1.0
 
 
 def std_amount(all_transactions: list[Transaction]) -> float:
     """Std. dev. of transaction amounts."""
-    amounts = [t.amount for t in all_transactions]
+    amounts = _columns(tuple(all_transactions)).amounts
     if len(amounts) <= 1:
         return 0.0
     try:
@@ -344,8 +433,8 @@ def same_day_of_month_count(transaction: Transaction, all_transactions: list[Tra
     How many transactions in this group fall on the same
     day-of-month as the current one.
     """
-    dom = day_of_month(transaction)
-    return sum(1 for t in all_transactions if parse_date(t.date).day == dom)
+    days_of_month = _columns(tuple(all_transactions)).days_of_month
+    return int(np.count_nonzero(days_of_month == day_of_month(transaction)))
 
 
 def fraction_same_day_of_month(transaction: Transaction, all_transactions: list[Transaction]) -> float:
@@ -614,7 +703,7 @@ def position_in_span(txn: Transaction, txns: list[Transaction]) -> float:
 
 def n_small_transactions(all_transactions: list[Transaction], threshold: float = 20) -> int:
     """Number of transactions with amount less than threshold."""
-    return len([t for t in all_transactions if t.amount <= threshold])
+    return int(np.count_nonzero(_columns(tuple(all_transactions)).amounts <= threshold))
 
 
 def pct_small_transactions(all_transactions: list[Transaction], threshold: float = 20) -> float:
@@ -626,7 +715,8 @@ def n_small_transactions_not_this_amount(
     transaction: Transaction, all_transactions: list[Transaction], threshold: float = 20
 ) -> int:
     """Number of transactions with amount less than threshold that are not the same amount as the current tx."""
-    return len([t for t in all_transactions if t.amount <= threshold and t.amount != transaction.amount])
+    amounts = _columns(tuple(all_transactions)).amounts
+    return int(np.count_nonzero((amounts <= threshold) & (amounts != transaction.amount)))
 
 
 def pct_small_transactions_not_this_amount(
@@ -638,154 +728,77 @@ def pct_small_transactions_not_this_amount(
 
 def ends_in_00(transaction: Transaction) -> bool:
     """Check if the transaction amount ends in 00."""
-    return abs((transaction.amount * 100) % 100 - 00) < 0.001
+    return transaction.amount_cents % 100 == 0
 
 
 def is_likely_subscription_amount(transaction: Transaction) -> bool:
     """Check if the transaction amount is likely a subscription amount."""
-    return transaction.amount in [0.99, 1.99, 2.99, 4.99, 5.99, 9.99, 14.99, 19.99, 24.99, 29.99, 34.99, 39.99]
+    return transaction.amount in SUBSCRIPTION_AMOUNTS
 
 
 def is_amazon_prime(transaction: Transaction) -> bool:
     """Check if the transaction is an Amazon Prime payment."""
-    return any(company in transaction.name.lower() for company in ["amazon prime", "amazon.ca prime"])
+    return AMAZON_PRIME_PATTERN.search(transaction.name_lower) is not None
 
 
 def is_amazon_prime_video(transaction: Transaction) -> bool:
     """Check if the transaction is an Amazon Prime Video payment."""
-    return "amazon prime video" in transaction.name.lower()
+    return "amazon prime video" in transaction.name_lower
 
 
 def is_apple(transaction: Transaction) -> bool:
     """Check if the transaction is an Apple payment."""
-    return "apple" in transaction.name.lower()
+    return "apple" in transaction.name_lower
 
 
 def is_loan_company(transaction: Transaction) -> bool:
     """Check if the transaction is a loan company payment."""
-    return any(loan_company in transaction.name.lower() for loan_company in ["lending", "credit ninja", "creditninja"])
+    return LOAN_COMPANY_PATTERN.search(transaction.name_lower) is not None
 
 
 def is_pay_in_four_company(transaction: Transaction) -> bool:
     """Check if the transaction is a loan company payment."""
-    return any(loan_company in transaction.name.lower() for loan_company in ["afterpay", "sezzle"])
+    return PAY_IN_FOUR_COMPANY_PATTERN.search(transaction.name_lower) is not None
 
 
 def is_cash_advance_company(transaction: Transaction) -> bool:
     """Check if the transaction is a loan company payment."""
-    return any(
-        loan_company in transaction.name.lower()
-        for loan_company in [
-            "empower",
-            "brigit",
-            "cleo",
-            "credit genie",
-            "creditgenie",
-            "dave",
-            "albert",
-            "moneylion",
-            "money lion",
-        ]
-    )
+    return CASH_ADVANCE_COMPANY_PATTERN.search(transaction.name_lower) is not None
 
 
 def is_phone_company(transaction: Transaction) -> bool:
     """Check if the transaction is a phone company payment."""
-    return any(
-        phone_company in transaction.name.lower() for phone_company in ["verizon", "t-mobile", "wireless", "sprint"]
-    )
+    return PHONE_COMPANY_PATTERN.search(transaction.name_lower) is not None
 
 
 def is_subscription_company(transaction: Transaction) -> bool:
     """Check if the transaction is a subscription company payment."""
-    return any(
-        subscription_company in transaction.name.lower()
-        for subscription_company in [
-            "spotify",
-            "spectrum",
-            "comcast",
-            "youtube premium",
-            "espn+",
-            "amazon music",
-            "audible",
-            "netflix",
-            "disney+",
-            "bet+",
-            "hulu",
-            "hbo max",
-            "peacock",
-            "paramount+",
-            "showtime",
-            "walmart+",
-            "amazon kids+",
-            "starz",
-            "twitch",
-            "wix",
-            "linkedin",
-            "xfinity",
-        ]
-    )
+    return SUBSCRIPTION_COMPANY_PATTERN.search(transaction.name_lower) is not None
 
 
 def is_usually_subscription_company(transaction: Transaction) -> bool:
     """Check if the transaction is a usually a subscription company payment."""
-    return any(
-        subscription_company in transaction.name.lower()
-        for subscription_company in [
-            "membership",
-            "fitness",
-            "gym",
-            "club",
-            "monthly",
-            "property",
-            "credit",
-            "storage",
-            "amazon digital",
-            "amazon kindle",
-            "disney",
-            "siriusxm",
-            "adobe",
-            "youtube",
-            "patreon",
-            "google",
-            "directv",
-            "rocket money",
-        ]
-    )
+    return USUALLY_SUBSCRIPTION_COMPANY_PATTERN.search(transaction.name_lower) is not None
 
 
 def is_utility_company(transaction: Transaction) -> bool:
     """Check if the transaction is a utility company payment."""
-    return any(
-        utility_company in transaction.name.lower()
-        for utility_company in ["utility", "utilities", "energy", "electric", "water", "pg&e", "municipal"]
-    )
+    return UTILITY_COMPANY_PATTERN.search(transaction.name_lower) is not None
 
 
 def is_insurance_company(transaction: Transaction) -> bool:
     """Check if the transaction is an insurance company payment."""
-    return any(
-        insurance_company in transaction.name.lower()
-        for insurance_company in [
-            "insurance",
-            "geico",
-            "progressive",
-            "allstate",
-            "state farm",
-            "farmers",
-            "liberty mutual",
-        ]
-    )
+    return INSURANCE_COMPANY_PATTERN.search(transaction.name_lower) is not None
 
 
 def is_carwash_company(transaction: Transaction) -> bool:
     """Check if the transaction is a carwash company payment."""
-    return any(carwash_company in transaction.name.lower() for carwash_company in [" wash", "carwash"])
+    return CARWASH_COMPANY_PATTERN.search(transaction.name_lower) is not None
 
 
 def is_rental_company(transaction: Transaction) -> bool:
     """Check if the transaction is a rental company payment."""
-    return any(rentals_company in transaction.name.lower() for rentals_company in ["rent", "property"])
+    return RENTAL_COMPANY_PATTERN.search(transaction.name_lower) is not None
 
 
 def n_monthly_same_amount(transaction: Transaction, all_transactions: list[Transaction]) -> int:
@@ -850,12 +863,9 @@ def pct_consecutive_months_same_amount(transaction: Transaction, all_transaction
 
 def n_same_day_same_amount(transaction: Transaction, all_transactions: list[Transaction], n_days_off: int = 0) -> int:
     """Return the number of transactions in the same day of the month with the same amount as the current tx."""
-    tx_day = day_of_month(transaction)
-    return len([
-        t
-        for t in all_transactions
-        if t.amount == transaction.amount and abs(parse_date(t.date).day - tx_day) <= n_days_off
-    ])
+    columns = _columns(tuple(all_transactions))
+    near_day = np.abs(columns.days_of_month - day_of_month(transaction)) <= n_days_off
+    return int(np.count_nonzero((columns.amounts == transaction.amount) & near_day))
 
 
 def pct_same_day_same_amount(
@@ -877,30 +887,10 @@ def get_n_transactions_days_apart_same_amount(
     Get the number of transactions in all_transactions that are within n_days_off of
     being n_days_apart from transaction and have the same amount as the current tx
     """
-    n_txs = 0
-    transaction_date = parse_date(transaction.date)
-
-    # Pre-calculate bounds for faster checking
-    lower_remainder = n_days_apart - n_days_off
-    upper_remainder = n_days_off
-
-    for t in all_transactions:
-        if t.amount != transaction.amount:
-            continue
-        t_date = parse_date(t.date)
-        days_diff = abs((t_date - transaction_date).days)
-
-        # Skip if the difference is less than minimum required
-        if days_diff < n_days_apart - n_days_off:
-            continue
-
-        # Check if the difference is close to any multiple of n_days_apart
-        remainder = days_diff % n_days_apart
-
-        if remainder <= upper_remainder or remainder >= lower_remainder:
-            n_txs += 1
-
-    return n_txs
+    columns = _columns(tuple(all_transactions))
+    ordinals, amounts = columns.ordinals, columns.amounts
+    days_diff = np.abs(ordinals[amounts == transaction.amount] - get_date_ordinal(transaction.date))
+    return _count_days_apart(days_diff, n_days_apart, n_days_off)
 
 
 def get_pct_transactions_days_apart_same_amount(
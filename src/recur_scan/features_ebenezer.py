@@ -1,26 +1,53 @@
 import statistics
+from collections import defaultdict
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
+
+import numpy as np
 
 from recur_scan.transactions import Transaction
+from recur_scan.utils import count_amounts_between, parse_date
+
+
+@lru_cache(maxsize=128)
+def _transactions_by_name(all_transactions: tuple[Transaction, ...]) -> dict[str, list[Transaction]]:
+    """Bucket transactions by name once per distinct list"""
+    by_name: defaultdict[str, list[Transaction]] = defaultdict(list)
+    for t in all_transactions:
+        by_name[t.name].append(t)
+    return dict(by_name)
+
+
+def _sample_std(amounts: np.ndarray) -> float:
+    """Sample standard deviation (ddof=1), exactly 0.0 for identical amounts as statistics.stdev gives"""
+    if np.all(amounts == amounts[0]):
+        return 0.0
+    return float(amounts.std(ddof=1))
+
+
+def _same_name(transaction: Transaction, all_transactions: list[Transaction]) -> list[Transaction]:
+    """Transactions in all_transactions with the same name as transaction, in list order"""
+    return _transactions_by_name(tuple(all_transactions)).get(transaction.name, [])
 
 
 def get_n_transactions_same_name(transaction: Transaction, all_transactions: list[Transaction]) -> int:
     """Get the number of transactions in all_
     transactions with the same name as transaction"""
-    return len([t for t in all_transactions if t.name == transaction.name])
+    return len(_same_name(transaction, all_transactions))
 
 
 def get_percent_transactions_same_name(transaction: Transaction, all_transactions: list[Transaction]) -> float:
     """Get the percentage of transactions in all_transactions with the same name as transaction"""
     if not all_transactions:
         return 0.0
-    n_same_name = len([t for t in all_transactions if t.name == transaction.name])
+    n_same_name = len(_same_name(transaction, all_transactions))
     return n_same_name / len(all_transactions)
 
 
 def get_avg_amount_same_name(transaction: Transaction, all_transactions: list[Transaction]) -> float:
     """Get the average amount of transactions in all_transactions with the same name as transaction"""
-    same_name_transactions = [t for t in all_transactions if t.name == transaction.name]
+    same_name_transactions = _same_name(transaction, all_transactions)
     if not same_name_transactions:
         return 0.0
     return sum(t.amount for t in same_name_transactions) / len(same_name_transactions)
@@ -40,67 +67,95 @@ def get_std_amount_same_name(transaction: Transaction, all_transactions: list[Tr
                Returns 0.0 if there are fewer than two such transactions.
     """
     # Filter transactions to find those with the same name
-    same_name_transactions = [t for t in all_transactions if t.name == transaction.name]
+    same_name_transactions = _same_name(transaction, all_transactions)
     # If there are fewer than two transactions with the same name, return 0.0
     if len(same_name_transactions) < 2:
         return 0.0
 
     # Calculate and return the standard deviation of the amounts
-    amounts = [t.amount for t in same_name_transactions]
-    try:
-        return statistics.stdev(amounts)
-    except Exception:
-        return 0.0
+    amounts = np.fromiter(
+        (t.amount for t in same_name_transactions), dtype=np.float64, count=len(same_name_transactions)
+    )
+    return _sample_std(amounts)
+
+
+_EPOCH_ORDINAL = 719163  # date(1970, 1, 1).toordinal()
+
+
+@dataclass(frozen=True)
+class _CalendarColumns:
+    """Per-transaction amount and calendar fields as arrays, in list order"""
+
+    amounts: np.ndarray
+    months: np.ndarray
+    weekdays: np.ndarray
+
+
+@lru_cache(maxsize=128)
+def _calendar_columns(all_transactions: tuple[Transaction, ...]) -> _CalendarColumns:
+    """Amounts, months (1-12) and weekdays (0=Monday) of the transactions, derived from datetime64 dates in bulk"""
+    # built from the cached ordinals rather than the date strings, which need not be zero-padded
+    ordinals = np.fromiter((t.date_ordinal for t in all_transactions), dtype=np.int64, count=len(all_transactions))
+    dates = (ordinals - _EPOCH_ORDINAL).astype("datetime64[D]")
+    # datetime64[M] counts months since 1970-01 and 1970-01-01 was a Thursday
+    months = dates.astype("datetime64[M]").astype(np.int64) % 12 + 1
+    weekdays = (dates.astype(np.int64) + 3) % 7
+    amounts = np.fromiter((t.amount for t in all_transactions), dtype=np.float64, count=len(all_transactions))
+    return _CalendarColumns(amounts, months, weekdays)
+
+
+def _same_month_mask(transaction: Transaction, all_transactions: list[Transaction]) -> np.ndarray:
+    """Which of all_transactions fall in the same calendar month (of any year) as transaction"""
+    same_month: np.ndarray = _calendar_columns(tuple(all_transactions)).months == parse_date(transaction.date).month
+    return same_month
+
+
+def _same_weekday_mask(transaction: Transaction, all_transactions: list[Transaction]) -> np.ndarray:
+    """Which of all_transactions fall on the same day of the week as transaction"""
+    weekdays = _calendar_columns(tuple(all_transactions)).weekdays
+    same_weekday: np.ndarray = weekdays == parse_date(transaction.date).weekday()
+    return same_weekday
 
 
 def get_n_transactions_same_month(transaction: Transaction, all_transactions: list[Transaction]) -> int:
     """Get the number of transactions in all_transactions in the same month as transaction"""
-    transaction_month = datetime.strptime(transaction.date, "%Y-%m-%d").month
-    return len([t for t in all_transactions if datetime.strptime(t.date, "%Y-%m-%d").month == transaction_month])
+    return int(np.count_nonzero(_same_month_mask(transaction, all_transactions)))
 
 
 def get_percent_transactions_same_month(transaction: Transaction, all_transactions: list[Transaction]) -> float:
     """Get the percentage of transactions in all_transactions in the same month as transaction"""
     if not all_transactions:
         return 0.0
-    transaction_month = datetime.strptime(transaction.date, "%Y-%m-%d").month
-    n_same_month = len([
-        t for t in all_transactions if datetime.strptime(t.date, "%Y-%m-%d").month == transaction_month
-    ])
+    n_same_month = int(np.count_nonzero(_same_month_mask(transaction, all_transactions)))
     return n_same_month / len(all_transactions)
 
 
 def get_avg_amount_same_month(transaction: Transaction, all_transactions: list[Transaction]) -> float:
     """Get the average amount of transactions in all_transactions
     in the same month as transaction"""
-    transaction_month = datetime.strptime(transaction.date, "%Y-%m-%d").month
-    same_month_transactions = [
-        t for t in all_transactions if datetime.strptime(t.date, "%Y-%m-%d").month == transaction_month
+    same_month_amounts = _calendar_columns(tuple(all_transactions)).amounts[
+        _same_month_mask(transaction, all_transactions)
     ]
-    if not same_month_transactions:
+    if not same_month_amounts.size:
         return 0.0
-    return sum(t.amount for t in same_month_transactions) / len(same_month_transactions)
+    return float(same_month_amounts.mean())
 
 
 def get_std_amount_same_month(transaction: Transaction, all_transactions: list[Transaction]) -> float:
     """Get the standard deviation of amounts for transactions in all_
     transactions in the same month as transaction"""
-    transaction_month = datetime.strptime(transaction.date, "%Y-%m-%d").month
-    same_month_transactions = [
-        t for t in all_transactions if datetime.strptime(t.date, "%Y-%m-%d").month == transaction_month
+    same_month_amounts = _calendar_columns(tuple(all_transactions)).amounts[
+        _same_month_mask(transaction, all_transactions)
     ]
-    if len(same_month_transactions) < 2:
-        return 0.0
-    try:
-        return statistics.stdev(t.amount for t in same_month_transactions)
-    except Exception:
+    if len(same_month_amounts) < 2:
         return 0.0
+    return _sample_std(same_month_amounts)
 
 
 def get_n_transactions_same_user_id(transaction: Transaction, all_transactions: list[Transaction]) -> int:
     """Get the number of transactions in all_
     transactions with the same user_id as transaction"""
-    return len([t for t in all_transactions if t.user_id == transaction.user_id])
+    return sum(1 for t in all_transactions if t.user_id == transaction.user_id)
 
 
 def get_percent_transactions_same_user_id(transaction: Transaction, all_transactions: list[Transaction]) -> float:
@@ -108,7 +163,7 @@ def get_percent_transactions_same_user_id(transaction: Transaction, all_transact
     all_transactions with the same user_id as transaction"""
     if not all_transactions:
         return 0.0
-    n_same_user_id = len([t for t in all_transactions if t.user_id == transaction.user_id])
+    n_same_user_id = sum(1 for t in all_transactions if t.user_id == transaction.user_id)
     return n_same_user_id / len(all_transactions)
 
 
@@ -117,38 +172,30 @@ def get_percent_transactions_same_day_of_week(transaction: Transaction, all_tran
     all_transactions on the same day of the week as transaction"""
     if not all_transactions:
         return 0.0
-    transaction_day_of_week = datetime.strptime(transaction.date, "%Y-%m-%d").weekday()
-    n_same_day_of_week = len([
-        t for t in all_transactions if datetime.strptime(t.date, "%Y-%m-%d").weekday() == transaction_day_of_week
-    ])
+    n_same_day_of_week = int(np.count_nonzero(_same_weekday_mask(transaction, all_transactions)))
     return n_same_day_of_week / len(all_transactions)
 
 
 def get_avg_amount_same_day_of_week(transaction: Transaction, all_transactions: list[Transaction]) -> float:
     """Get the average amount of transactions in
     all_transactions on the same day of the week as transaction"""
-    transaction_day_of_week = datetime.strptime(transaction.date, "%Y-%m-%d").weekday()
-    same_day_of_week_transactions = [
-        t for t in all_transactions if datetime.strptime(t.date, "%Y-%m-%d").weekday() == transaction_day_of_week
+    same_day_of_week_amounts = _calendar_columns(tuple(all_transactions)).amounts[
+        _same_weekday_mask(transaction, all_transactions)
     ]
-    if not same_day_of_week_transactions:
+    if not same_day_of_week_amounts.size:
         return 0.0
-    return sum(t.amount for t in same_day_of_week_transactions) / len(same_day_of_week_transactions)
+    return float(same_day_of_week_amounts.mean())
 
 
 def get_std_amount_same_day_of_week(transaction: Transaction, all_transactions: list[Transaction]) -> float:
     """Get the standard deviation of amounts for transactions in all_transactions
     on the same day of the week as transaction"""
-    transaction_day_of_week = datetime.strptime(transaction.date, "%Y-%m-%d").weekday()
-    same_day_of_week_transactions = [
-        t for t in all_transactions if datetime.strptime(t.date, "%Y-%m-%d").weekday() == transaction_day_of_week
+    same_day_of_week_amounts = _calendar_columns(tuple(all_transactions)).amounts[
+        _same_weekday_mask(transaction, all_transactions)
     ]
-    if len(same_day_of_week_transactions) < 2:
-        return 0.0
-    try:
-        return statistics.stdev(t.amount for t in same_day_of_week_transactions)
-    except Exception:
+    if len(same_day_of_week_amounts) < 2:
         return 0.0
+    return _sample_std(same_day_of_week_amounts)
 
 
 def get_n_transactions_within_amount_range(
@@ -157,7 +204,7 @@ def get_n_transactions_within_amount_range(
     """Get the number of transactions in all_transactions within a certain amount range of transaction"""
     lower_bound = transaction.amount * (1 - percentage)
     upper_bound = transaction.amount * (1 + percentage)
-    return len([t for t in all_transactions if lower_bound <= t.amount <= upper_bound])
+    return count_amounts_between(all_transactions, lower_bound, upper_bound)
 
 
 def get_percent_transactions_within_amount_range(
@@ -168,7 +215,7 @@ def get_percent_transactions_within_amount_range(
         return 0.0
     lower_bound = transaction.amount * (1 - percentage)
     upper_bound = transaction.amount * (1 + percentage)
-    n_within_range = len([t for t in all_transactions if lower_bound <= t.amount <= upper_bound])
+    n_within_range = count_amounts_between(all_transactions, lower_bound, upper_bound)
     return n_within_range / len(all_transactions)
 
 
@@ -177,9 +224,7 @@ def get_percent_transactions_within_amount_range(
 
 def get_avg_time_between_transactions(transaction: Transaction, all_transactions: list[Transaction]) -> float:
     """Get the average time difference (in days) between transactions with the same name."""
-    same_name_transactions = sorted(
-        [t for t in all_transactions if t.name == transaction.name], key=lambda t: datetime.strptime(t.date, "%Y-%m-%d")
-    )
+    same_name_transactions = sorted(_same_name(transaction, all_transactions), key=lambda t: t.date)
     if len(same_name_transactions) < 2:
         return 0.0
     time_differences = [
@@ -194,9 +239,7 @@ def get_avg_time_between_transactions(transaction: Transaction, all_transactions
 
 def get_is_recurring(transaction: Transaction, all_transactions: list[Transaction], threshold: int = 30) -> int:
     """Check if the transaction is recurring within a given threshold (e.g., 30 days)."""
-    same_name_transactions = sorted(
-        [t for t in all_transactions if t.name == transaction.name], key=lambda t: datetime.strptime(t.date, "%Y-%m-%d")
-    )
+    same_name_transactions = sorted(_same_name(transaction, all_transactions), key=lambda t: t.date)
     if len(same_name_transactions) < 2:
         return 0
     time_differences = [
@@ -211,7 +254,7 @@ def get_is_recurring(transaction: Transaction, all_transactions: list[Transactio
 
 def get_median_amount_same_name(transaction: Transaction, all_transactions: list[Transaction]) -> float:
     """Get the median amount of transactions with the same name."""
-    same_name_transactions = [t.amount for t in all_transactions if t.name == transaction.name]
+    same_name_transactions = [t.amount for t in _same_name(transaction, all_transactions)]
     if not same_name_transactions:
         return 0.0
     return statistics.median(same_name_transactions)
@@ -219,7 +262,7 @@ def get_median_amount_same_name(transaction: Transaction, all_transactions: list
 
 def get_amount_range_same_name(transaction: Transaction, all_transactions: list[Transaction]) -> float:
     """Get the range (max - min) of transaction amounts with the same name."""
-    same_name_transactions = [t.amount for t in all_transactions if t.name == transaction.name]
+    same_name_transactions = [t.amount for t in _same_name(transaction, all_transactions)]
     if not same_name_transactions:
         return 0.0
     return max(same_name_transactions) - min(same_name_transactions)
@@ -227,13 +270,12 @@ def get_amount_range_same_name(transaction: Transaction, all_transactions: list[
 
 def get_day_of_week(transaction: Transaction) -> int:
     """Get the day of the week for a transaction (0=Monday, 6=Sunday)."""
-    return datetime.strptime(transaction.date, "%Y-%m-%d").weekday()
+    return parse_date(transaction.date).weekday()
 
 
 def get_is_weekend(transaction: Transaction) -> int:
     """Check if the transaction occurred on a weekend."""
-    day_of_week = datetime.strptime(transaction.date, "%Y-%m-%d").weekday()
-    return int(day_of_week >= 5)
+    return int(get_day_of_week(transaction) >= 5)
 
 
 def get_user_avg_transaction_amount(transaction: Transaction, all_transactions: list[Transaction]) -> float:
@@ -249,7 +291,7 @@ def get_user_avg_transaction_amount(transaction: Transaction, all_transactions:
 
 def get_amount_variance(transaction: Transaction, all_transactions: list[Transaction]) -> float:
     """Calculate the variance of transaction amounts with the same name."""
-    amounts = [t.amount for t in all_transactions if t.name == transaction.name]
+    amounts = [t.amount for t in _same_name(transaction, all_transactions)]
     if len(amounts) < 2:
         return 0.0
     return statistics.variance(amounts)
@@ -281,7 +323,7 @@ def get_user_transaction_frequency(transaction: Transaction, all_transactions: l
 
 def get_is_monthly(transaction: Transaction, all_transactions: list[Transaction]) -> int:
     """Check if the transaction occurs approximately every 30 days."""
-    dates = sorted([datetime.strptime(t.date, "%Y-%m-%d") for t in all_transactions if t.name == transaction.name])
+    dates = sorted([datetime.strptime(t.date, "%Y-%m-%d") for t in _same_name(transaction, all_transactions)])
     if len(dates) < 2:
         return 0
     intervals = [(dates[i + 1] - dates[i]).days for i in range(len(dates) - 1)]
@@ -290,7 +332,7 @@ def get_is_monthly(transaction: Transaction, all_transactions: list[Transaction]
 
 def get_is_weekly(transaction: Transaction, all_transactions: list[Transaction]) -> int:
     """Check if the transaction occurs approximately every 7 days."""
-    dates = sorted([datetime.strptime(t.date, "%Y-%m-%d") for t in all_transactions if t.name == transaction.name])
+    dates = sorted([datetime.strptime(t.date, "%Y-%m-%d") for t in _same_name(transaction, all_transactions)])
     if len(dates) < 2:
         return 0
     intervals = [(dates[i + 1] - dates[i]).days for i in range(len(dates) - 1)]
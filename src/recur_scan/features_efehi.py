@@ -54,7 +54,7 @@ def get_transaction_frequency(transaction: Transaction, all_transactions: list[T
 
 def get_n_same_name_transactions(transaction: Transaction, all_transactions: list[Transaction]) -> int:
     """Count transactions with the same name."""
-    return len([t for t in all_transactions if t.name == transaction.name])
+    return sum(1 for t in all_transactions if t.name == transaction.name)
 
 
 def get_irregular_periodicity(transaction: Transaction, all_transactions: list[Transaction]) -> float:
@@ -116,7 +116,7 @@ def get_vendor_recurring_ratio(transaction: Transaction, all_transactions: list[
     same_name_transactions = [t for t in all_transactions if t.name == transaction.name]
     if not same_name_transactions:
         return 0.0
-    recurring_count = len([t for t in same_name_transactions if t.amount == transaction.amount])
+    recurring_count = sum(1 for t in same_name_transactions if t.amount == transaction.amount)
     return recurring_count / len(same_name_transactions)
 
 
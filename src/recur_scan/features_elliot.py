@@ -1,18 +1,18 @@
 import re
-import statistics
 from collections import defaultdict
 from datetime import datetime
+from functools import lru_cache
 from typing import cast
 
 import dateutil.parser as _du_parser  # type: ignore
 import numpy as np
 import pandas as pd
-from scipy.stats import iqr  # type: ignore
 from thefuzz import fuzz  # type: ignore
 
 from recur_scan.transactions import Transaction
 
 
+@lru_cache(maxsize=65536)
 def parse_date(date_str: str) -> datetime | None:
     """Parse a string into a datetime object, or return None if invalid."""
     try:
@@ -29,79 +29,87 @@ def get_is_near_same_amount(transaction: Transaction, all_transactions: list[Tra
     )
 
 
+UTILITY_KEYWORD_PATTERN = re.compile(
+    r"\b(water|gas|electricity|power|energy|utility|sewage|trash|waste|heating|cable|internet|broadband|tv)\b",
+    re.IGNORECASE,
+)
+UTILITY_PROVIDERS = frozenset({
+    "duke energy",
+    "pg&e",
+    "con edison",
+    "national grid",
+    "xcel energy",
+    "southern california edison",
+    "dominion energy",
+    "centerpoint energy",
+    "peoples gas",
+    "nrg energy",
+    "direct energy",
+    "atmos energy",
+    "comcast",
+    "xfinity",
+    "spectrum",
+    "verizon fios",
+    "centurylink",
+    "at&t",
+    "cox communications",
+})
+
+
 def is_utility_bill(transaction: Transaction) -> bool:
     """Check if the transaction is a utility bill (water, gas, electricity, etc.)."""
-    utility_keywords = (
-        r"\b(water|gas|electricity|power|energy|utility|sewage|trash|waste|heating|cable|internet|broadband|tv)\b"
-    )
-    utility_providers = {
-        "duke energy",
-        "pg&e",
-        "con edison",
-        "national grid",
-        "xcel energy",
-        "southern california edison",
-        "dominion energy",
-        "centerpoint energy",
-        "peoples gas",
-        "nrg energy",
-        "direct energy",
-        "atmos energy",
-        "comcast",
-        "xfinity",
-        "spectrum",
-        "verizon fios",
-        "centurylink",
-        "at&t",
-        "cox communications",
-    }
     name_lower = transaction.name.lower()
-    return bool(re.search(utility_keywords, name_lower, re.IGNORECASE)) or any(
-        provider in name_lower for provider in utility_providers
+    return bool(UTILITY_KEYWORD_PATTERN.search(name_lower)) or any(
+        provider in name_lower for provider in UTILITY_PROVIDERS
     )
 
 
+ALWAYS_RECURRING_VENDORS = frozenset({
+    "google storage",
+    "netflix",
+    "hulu",
+    "spotify",
+    "apple music",
+    "apple arcade",
+    "apple tv+",
+    "apple fitness+",
+    "apple icloud",
+    "apple one",
+    "amazon prime",
+    "adobe creative cloud",
+    "microsoft 365",
+    "dropbox",
+    "youtube premium",
+    "discord nitro",
+    "playstation plus",
+    "xbox game pass",
+    "comcast xfinity",
+    "spectrum",
+    "verizon fios",
+    "centurylink",
+    "cox communications",
+    "at&t internet",
+    "t-mobile home internet",
+})
+
+
 def get_is_always_recurring(transaction: Transaction) -> bool:
     """Check if the transaction is always recurring using fuzzy matching."""
-    always_recurring_vendors = {
-        "google storage",
-        "netflix",
-        "hulu",
-        "spotify",
-        "apple music",
-        "apple arcade",
-        "apple tv+",
-        "apple fitness+",
-        "apple icloud",
-        "apple one",
-        "amazon prime",
-        "adobe creative cloud",
-        "microsoft 365",
-        "dropbox",
-        "youtube premium",
-        "discord nitro",
-        "playstation plus",
-        "xbox game pass",
-        "comcast xfinity",
-        "spectrum",
-        "verizon fios",
-        "centurylink",
-        "cox communications",
-        "at&t internet",
-        "t-mobile home internet",
-    }
-    return any(fuzz.partial_ratio(transaction.name.lower(), vendor) > 85 for vendor in always_recurring_vendors)
+    return any(fuzz.partial_ratio(transaction.name.lower(), vendor) > 85 for vendor in ALWAYS_RECURRING_VENDORS)
+
+
+AUTO_PAY_PATTERN = re.compile(r"\b(auto\s?pay|autopayment|automatic payment)\b", re.IGNORECASE)
+MEMBERSHIP_PATTERN = re.compile(r"\b(membership|subscription|club|gym|association|society)\b", re.IGNORECASE)
 
 
 def is_auto_pay(transaction: Transaction) -> bool:
     """Check if the transaction is an automatic recurring payment."""
-    return bool(re.search(r"\b(auto\s?pay|autopayment|automatic payment)\b", transaction.name, re.IGNORECASE))
+    return bool(AUTO_PAY_PATTERN.search(transaction.name))
 
 
 def is_membership(transaction: Transaction) -> bool:
     """Check if the transaction is a membership payment."""
-    membership_keywords = r"\b(membership|subscription|club|gym|association|society)\b"
-    return bool(re.search(membership_keywords, transaction.name, re.IGNORECASE))
+    return bool(MEMBERSHIP_PATTERN.search(transaction.name))
 
 
 def is_recurring_based_on_99(transaction: Transaction, all_transactions: list[Transaction]) -> bool:
@@ -185,7 +193,7 @@ def get_time_regularity_score(txn: dict, txns: list[dict]) -> float:
         intervals = [(dates[i] - dates[i - 1]).days for i in range(1, len(dates))]
         if len(intervals) <= 1:
             return 0.0
-        stddev = statistics.stdev(intervals)
+        stddev = float(np.std(intervals, ddof=1))
         return 1.0 / (1.0 + stddev / 5.0)
     except Exception:
         return 0.0
@@ -196,10 +204,10 @@ def get_transaction_amount_variance(txn: dict, txns: list[dict]) -> float:
     vals = [t["amount"] for t in txns if t["name"] == txn["name"]]
     if len(vals) <= 1:
         return 0.0
-    try:
-        return float(statistics.stdev(vals))
-    except Exception:
+    amounts = np.asarray(vals, dtype=np.float64)
+    if np.all(amounts == amounts[0]):
         return 0.0
+    return float(amounts.std(ddof=1))
 
 
 def most_common_interval(all_transactions: list[Transaction]) -> int:
@@ -218,7 +226,8 @@ def amount_variability_ratio(all_transactions: list[Transaction]) -> float:
 
     df = pd.DataFrame([{"amount": t.amount} for t in all_transactions])
     med = float(np.median(df["amount"]))
-    return float(iqr(df["amount"])) / med if med != 0 else 0.0
+    q75, q25 = np.percentile(df["amount"], [75, 25])
+    return float(q75 - q25) / med if med != 0 else 0.0
 
 
 def amount_similarity(all_transactions: list[Transaction], tolerance: float = 0.1) -> float:
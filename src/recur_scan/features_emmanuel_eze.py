@@ -1,5 +1,7 @@
 import statistics
 
+import numpy as np
+
 from recur_scan.transactions import Transaction
 from recur_scan.utils import parse_date
 
@@ -34,7 +36,7 @@ def detect_sequence_patterns(
         return {"sequence_confidence": 0.0, "sequence_pattern": -1, "sequence_length": 0}
     try:
         avg_interval = statistics.mean(intervals)
-        stdev_interval = statistics.stdev(intervals) if len(intervals) > 1 else 0
+        stdev_interval = float(np.std(intervals, ddof=1)) if len(intervals) > 1 else 0
     except Exception:
         return {"sequence_confidence": 0.0, "sequence_pattern": -1, "sequence_length": 0}
 
@@ -95,7 +97,8 @@ def get_recurring_transaction_confidence(transaction: Transaction, all_transacti
     else:
         try:
             mean = sum(similar_transactions) / len(similar_transactions)
-            stdev = statistics.stdev(similar_transactions)
+            amounts = np.array(similar_transactions)
+            stdev = 0.0 if np.all(amounts == amounts[0]) else float(amounts.std(ddof=1))
             amount_stability = stdev / mean if mean != 0 else 1.0
         except Exception:
             amount_stability = 1.0
@@ -110,18 +113,18 @@ def get_recurring_transaction_confidence(transaction: Transaction, all_transacti
         try:
             intervals = [(similar_dates[i] - similar_dates[i - 1]).days for i in range(1, len(similar_dates))]
             interval_regularities = (
-                -1.0 if len(intervals) < 2 else statistics.stdev(intervals)
+                -1.0 if len(intervals) < 2 else float(np.std(intervals, ddof=1))
             )  # Default value for insufficient data
         except Exception:
             interval_regularities = -1.0
 
     # 3. Transaction Frequency
     transaction_date = parse_date(transaction.date)
-    transaction_frequency = len([
-        t
+    transaction_frequency = sum(
+        1
         for t in all_transactions
         if t.name == transaction.name and abs((parse_date(t.date) - transaction_date).days) <= 30
-    ])
+    )
 
     # 4. Metadata Similarity
     def _jaccard_similarity(set1: set, set2: set) -> float:
@@ -1,93 +1,114 @@
 import re
+from collections import Counter
+from functools import lru_cache
 from typing import Any
 
 from recur_scan.transactions import Transaction
-from recur_scan.utils import parse_date
+from recur_scan.utils import get_date_ordinal, parse_date
+
+INSURANCE_PATTERN = re.compile(
+    r"\b(insurance|insur|insuranc|geico|allstate|progressive|state farm|liberty mutual)\b", re.IGNORECASE
+)
+UTILITY_PATTERN = re.compile(
+    r"\b(utility|utilit|energy|water|gas|electric|comcast|xfinity|verizon fios|at&t u-verse|spectrum)\b", re.IGNORECASE
+)
+PHONE_PATTERN = re.compile(r"\b(at&t|t-mobile|verizon|sprint|boost|cricket|metro pcs|straight talk)\b", re.IGNORECASE)
+RECURRING_KEYWORD_PATTERN = re.compile(
+    r"\b(sub|membership|renewal|monthly|annual|premium|bill|plan|fee|auto|pay|service|"
+    r"recurring|subscription|auto-renew|recurr|autopay|rec|month|year|quarterly|weekly|due)\b",
+    re.IGNORECASE,
+)
+CONVENIENCE_STORE_PATTERN = re.compile(
+    r"\b(7-eleven|cvs|walgreens|rite aid|circle k|quiktrip|speedway|ampm|7 eleven|seven eleven|sheetz)\b",
+    re.IGNORECASE,
+)
+
+ALWAYS_RECURRING_VENDORS = frozenset({
+    "google storage",
+    "netflix",
+    "hulu",
+    "spotify",
+    "amazon prime",
+    "disney+",
+    "apple music",
+    "xbox live",
+    "playstation plus",
+    "adobe",
+    "microsoft 365",
+    "audible",
+    "dropbox",
+    "zoom",
+    "grammarly",
+    "nordvpn",
+    "expressvpn",
+    "patreon",
+    "onlyfans",
+    "youtube premium",
+    "apple tv",
+    "hbo max",
+    "paramount+",
+    "peacock",
+    "crunchyroll",
+    "masterclass",
+})
 
 
 def get_is_always_recurring(transaction: Transaction) -> bool:
-    always_recurring_vendors = {
-        "google storage",
-        "netflix",
-        "hulu",
-        "spotify",
-        "amazon prime",
-        "disney+",
-        "apple music",
-        "xbox live",
-        "playstation plus",
-        "adobe",
-        "microsoft 365",
-        "audible",
-        "dropbox",
-        "zoom",
-        "grammarly",
-        "nordvpn",
-        "expressvpn",
-        "patreon",
-        "onlyfans",
-        "youtube premium",
-        "apple tv",
-        "hbo max",
-        "paramount+",
-        "peacock",
-        "crunchyroll",
-        "masterclass",
-    }
-    return transaction.name.lower() in always_recurring_vendors
+    return transaction.name.lower() in ALWAYS_RECURRING_VENDORS
 
 
 def get_is_insurance(transaction: Transaction) -> bool:
-    match = re.search(
-        r"\b(insurance|insur|insuranc|geico|allstate|progressive|state farm|liberty mutual)\b",
-        transaction.name,
-        re.IGNORECASE,
-    )
-    return bool(match)
+    return bool(INSURANCE_PATTERN.search(transaction.name))
 
 
 def get_is_utility(transaction: Transaction) -> bool:
-    match = re.search(
-        r"\b(utility|utilit|energy|water|gas|electric|comcast|xfinity|verizon fios|at&t u-verse|spectrum)\b",
-        transaction.name,
-        re.IGNORECASE,
-    )
-    return bool(match)
+    return bool(UTILITY_PATTERN.search(transaction.name))
 
 
 def get_is_phone(transaction: Transaction) -> bool:
-    match = re.search(
-        r"\b(at&t|t-mobile|verizon|sprint|boost|cricket|metro pcs|straight talk)\b", transaction.name, re.IGNORECASE
-    )
-    return bool(match)
+    return bool(PHONE_PATTERN.search(transaction.name))
 
 
 def get_n_transactions_days_apart(
     transaction: Transaction, all_transactions: list[Transaction], n_days_apart: int, n_days_off: int
 ) -> int:
     n_txs = 0
-    transaction_date = parse_date(transaction.date)
+    ref_ordinal = get_date_ordinal(transaction.date)
     user_transactions = [t for t in all_transactions if t.user_id == transaction.user_id]
     effective_days_off = max(n_days_off, 1) if n_days_off == 0 else n_days_off
     for t in user_transactions:
-        t_date = parse_date(t.date)
-        days_diff = abs((t_date - transaction_date).days)
+        days_diff = abs(get_date_ordinal(t.date) - ref_ordinal)
         if n_days_apart - effective_days_off <= days_diff <= n_days_apart + effective_days_off:
             n_txs += 1
     return n_txs
 
 
+@lru_cache(maxsize=128)
+def _user_amount_counts(transactions: tuple[Transaction, ...]) -> tuple[Counter[tuple[str, float]], Counter[str]]:
+    """Count transactions per (user_id, amount) and per user_id in one pass over the list"""
+    user_amount_counts: Counter[tuple[str, float]] = Counter()
+    user_counts: Counter[str] = Counter()
+    for t in transactions:
+        user_amount_counts[(t.user_id, t.amount)] += 1
+        user_counts[t.user_id] += 1
+    return user_amount_counts, user_counts
+
+
 def get_n_transactions_same_amount(transaction: Transaction, all_transactions: list[Transaction]) -> int:
-    user_transactions = [t for t in all_transactions if t.user_id == transaction.user_id]
-    return len([t for t in user_transactions if t.amount == transaction.amount])
+    user_amount_counts, _ = _user_amount_counts(tuple(all_transactions))
+    return user_amount_counts[(transaction.user_id, transaction.amount)]
 
 
 def get_percent_transactions_same_amount(transaction: Transaction, all_transactions: list[Transaction]) -> float:
     if not all_transactions:
         return 0.0
-    n_same_amount = get_n_transactions_same_amount(transaction, all_transactions)
-    user_transactions = [t for t in all_transactions if t.user_id == transaction.user_id]
-    return n_same_amount / len(user_transactions) if user_transactions else 0.0
+    user_amount_counts, user_counts = _user_amount_counts(tuple(all_transactions))
+    n_user_transactions = user_counts[transaction.user_id]
+    return (
+        user_amount_counts[(transaction.user_id, transaction.amount)] / n_user_transactions
+        if n_user_transactions
+        else 0.0
+    )
 
 
 # def get_days_between_std(
@@ -113,24 +134,11 @@ def get_percent_transactions_same_amount(transaction: Transaction, all_transacti
 
 
 def get_has_recurring_keyword(transaction: Transaction) -> int:
-    recurring_keywords = (
-        r"\b(sub|membership|renewal|monthly|annual|premium|bill|plan|fee|auto|pay|service|"
-        r"recurring|subscription|auto-renew|recurr|autopay|rec|month|year|quarterly|weekly|due)\b"
-    )
-    return int(bool(re.search(recurring_keywords, transaction.name, re.IGNORECASE)))
+    return int(bool(RECURRING_KEYWORD_PATTERN.search(transaction.name)))
 
 
 def get_is_convenience_store(transaction: Transaction) -> int:
-    return int(
-        bool(
-            re.search(
-                r"\b(7-eleven|cvs|walgreens|rite aid|circle k|quiktrip|speedway|ampm|"
-                r"7 eleven|seven eleven|sheetz)\b",
-                transaction.name,
-                re.IGNORECASE,
-            )
-        )
-    )
+    return int(bool(CONVENIENCE_STORE_PATTERN.search(transaction.name)))
 
 
 def get_pct_transactions_days_apart(
@@ -1,6 +1,8 @@
-from datetime import datetime
-from statistics import mean, stdev
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from functools import lru_cache
 
+import numpy as np
 from fuzzywuzzy import process
 
 from recur_scan.transactions import Transaction
@@ -88,19 +90,64 @@ RECURRING_VENDORS = {
 }
 
 
+@dataclass(frozen=True)
+class _FeatureContext:
+    """Per-list lookups shared by every transaction in the same list of transactions"""
+
+    # each name's transactions and amounts, in list order, and its date ordinals in ascending order
+    by_name: dict[str, list[Transaction]]
+    amounts_by_name: dict[str, np.ndarray]
+    sorted_ordinals_by_name: dict[str, np.ndarray]
+    # keyed by amount in cents, so equal amounts match exactly
+    amount_counts: Counter[int]
+    ordinals_by_amount: dict[int, list[int]]
+    spent_by_user: dict[str, float]
+    spent_by_month: dict[str, float]
+
+
+@lru_cache(maxsize=128)
+def _build_context(transactions: tuple[Transaction, ...]) -> _FeatureContext:
+    """Build the context in one pass, once per distinct list of transactions"""
+    by_name: defaultdict[str, list[Transaction]] = defaultdict(list)
+    ordinals_by_amount: defaultdict[int, list[int]] = defaultdict(list)
+    amounts_by_user: defaultdict[str, list[float]] = defaultdict(list)
+    amounts_by_month: defaultdict[str, list[float]] = defaultdict(list)
+    for t in transactions:
+        by_name[t.name].append(t)
+        ordinals_by_amount[t.amount_cents].append(t.date_ordinal)
+        amounts_by_user[t.user_id].append(t.amount)
+        amounts_by_month[t.date[:7]].append(t.amount)
+    return _FeatureContext(
+        by_name=dict(by_name),
+        amounts_by_name={
+            name: np.fromiter((t.amount for t in txns), dtype=np.float64, count=len(txns))
+            for name, txns in by_name.items()
+        },
+        sorted_ordinals_by_name={
+            name: np.sort(np.fromiter((t.date_ordinal for t in txns), dtype=np.int64, count=len(txns)))
+            for name, txns in by_name.items()
+        },
+        amount_counts=Counter(t.amount_cents for t in transactions),
+        ordinals_by_amount=dict(ordinals_by_amount),
+        # totals are summed in list order with sum(), exactly as a per-call sum over the list would be
+        spent_by_user={user_id: sum(amounts) for user_id, amounts in amounts_by_user.items()},
+        spent_by_month={month: sum(amounts) for month, amounts in amounts_by_month.items()},
+    )
+
+
 def count_transactions_by_amount(transaction: Transaction, transactions: list[Transaction]) -> tuple[int, float]:
     """Returns count and percentage of transactions with the same amount."""
     if not transactions:
         return 0, 0.0
-    same_amount_count = sum(1 for t in transactions if t.amount == transaction.amount)
+    same_amount_count = _build_context(tuple(transactions)).amount_counts[transaction.amount_cents]
     return same_amount_count, same_amount_count / len(transactions)
 
 
 def get_recurrence_patterns(transaction: Transaction, transactions: list[Transaction]) -> dict:
     """Determines time-based recurrence patterns from past transactions."""
-    merchant_txns = [t for t in transactions if t.name == transaction.name]
+    ordinals = _build_context(tuple(transactions)).sorted_ordinals_by_name.get(transaction.name)
 
-    if len(merchant_txns) < 2:
+    if ordinals is None or len(ordinals) < 2:
         return {
             key: 0
             for key in [
@@ -116,14 +163,13 @@ def get_recurrence_patterns(transaction: Transaction, transactions: list[Transac
             ]
         }
 
-    dates = sorted(datetime.strptime(t.date, "%Y-%m-%d") for t in merchant_txns)
-    date_diffs = [(dates[i + 1] - dates[i]).days for i in range(len(dates) - 1)]
+    date_diffs = np.diff(ordinals)
 
-    avg_days_between = mean(date_diffs)
-    # std_days_between = stdev(date_diffs) if len(date_diffs) > 1 else 0.0
+    avg_days_between = float(date_diffs.mean())
+    # std_days_between = float(date_diffs.std(ddof=1)) if len(date_diffs) > 1 else 0.0
 
     # Weighted recurrence score
-    recurrence_score = sum(1 / (1 + abs(diff - avg_days_between)) for diff in date_diffs) / len(date_diffs)
+    recurrence_score = float((1 / (1 + np.abs(date_diffs - avg_days_between))).mean())
 
     # recurrence_flags = {
     # "is_biweekly_emmanuel2": int(14 in date_diffs),
@@ -144,28 +190,28 @@ def get_recurrence_patterns(transaction: Transaction, transactions: list[Transac
 
 def get_recurring_consistency_score(transaction: Transaction, transactions: list[Transaction]) -> dict:
     """Computes a consistency score to minimize bias errors in recurring transaction detection."""
+    context = _build_context(tuple(transactions))
+    ordinals = context.sorted_ordinals_by_name.get(transaction.name)
 
-    merchant_txns = [t for t in transactions if t.name == transaction.name]
-
-    if len(merchant_txns) < 2:
+    if ordinals is None or len(ordinals) < 2:
         return {"recurring_consistency_score_emmanuel2": 0.0}  # Not enough data to determine recurrence
 
-    dates = sorted(datetime.strptime(t.date, "%Y-%m-%d") for t in merchant_txns)
-    date_diffs = [(dates[i + 1] - dates[i]).days for i in range(len(dates) - 1)]
+    date_diffs = np.diff(ordinals)
 
-    avg_days_between = mean(date_diffs)
-    std_days_between = stdev(date_diffs) if len(date_diffs) > 1 else 0.0
+    avg_days_between = float(date_diffs.mean())
+    std_days_between = float(date_diffs.std(ddof=1)) if len(date_diffs) > 1 else 0.0
 
-    amount_variations = [t.amount for t in merchant_txns]
-    amount_stability = 1 - (stdev(amount_variations) / (mean(amount_variations) + 1e-6))  # Normalize stability score
+    amount_variations = context.amounts_by_name[transaction.name]
+    # Normalize stability score
+    amount_stability = 1 - (float(amount_variations.std(ddof=1)) / (float(amount_variations.mean()) + 1e-6))
 
     # Frequency-based confidence (e.g., monthly = strong, yearly = weaker)
     recurrence_flags = {
-        "biweekly_emmanuel2": int(14 in date_diffs),
-        "monthly_emmanuel2": int(any(27 <= d <= 31 for d in date_diffs)),
-        "bimonthly_emmanuel2": int(any(55 <= d <= 65 for d in date_diffs)),
-        "quarterly_emmanuel2": int(any(85 <= d <= 95 for d in date_diffs)),
-        "annual_emmanuel2": int(any(360 <= d <= 370 for d in date_diffs)),
+        "biweekly_emmanuel2": int((date_diffs == 14).any()),
+        "monthly_emmanuel2": int(((date_diffs >= 27) & (date_diffs <= 31)).any()),
+        "bimonthly_emmanuel2": int(((date_diffs >= 55) & (date_diffs <= 65)).any()),
+        "quarterly_emmanuel2": int(((date_diffs >= 85) & (date_diffs <= 95)).any()),
+        "annual_emmanuel2": int(((date_diffs >= 360) & (date_diffs <= 370)).any()),
     }
 
     # Weight factors based on common recurrence patterns
@@ -187,10 +233,9 @@ def get_recurring_consistency_score(transaction: Transaction, transactions: list
     return {"recurring_consistency_score_emmanuel2": round(max(0, min(consistency_score, 1)), 2)}
 
 
-def validate_recurring_transaction(transaction: Transaction, threshold: int = 80) -> bool:
-    """Determines if a transaction should be classified as recurring based on vendor trends."""
-    vendor_name = transaction.name.lower()
-
+@lru_cache(maxsize=8192)
+def _validate_vendor(vendor_name: str, threshold: int) -> bool:
+    """Fuzzy-match a lowercased vendor name against the known recurring vendors, once per name and threshold"""
     # Fuzzy Matching for Vendor Detection
     match_result: tuple[str, int] | None = process.extractOne(vendor_name, RECURRING_VENDORS)
 
@@ -205,6 +250,12 @@ def validate_recurring_transaction(transaction: Transaction, threshold: int = 80
     return score > threshold
 
 
+def validate_recurring_transaction(transaction: Transaction, threshold: int = 80) -> bool:
+    """Determines if a transaction should be classified as recurring based on vendor trends."""
+    # the match depends only on the name, so the fuzzy scoring runs once per distinct name
+    return _validate_vendor(transaction.name_lower, threshold)
+
+
 def classify_subscription_tier(transaction: Transaction) -> int:
     """Dynamically classifies a transaction's subscription tier."""
     subscription_tiers = {
@@ -221,28 +272,20 @@ def classify_subscription_tier(transaction: Transaction) -> int:
 
 def get_amount_features(transaction: Transaction, transactions: list[Transaction]) -> dict:
     """Extracts features related to amount stability using clustering."""
-    vendor_txns = [t.amount for t in transactions if t.name == transaction.name]
+    vendor_amounts = _build_context(tuple(transactions)).amounts_by_name.get(transaction.name)
 
-    if not vendor_txns:
+    if vendor_amounts is None:
         return {"is_fixed_amount_recurring": 0, "amount_fluctuation": 0.0, "price_cluster": -1}
 
-    price_fluctuation = max(vendor_txns) - min(vendor_txns)
-
-    # Handle edge cases for KMeans clustering
-    if len(vendor_txns) < 3 or len(set(vendor_txns)) == 1:
-        return {
-            # "is_fixed_amount_recurring_emmanuel2": int(max(vendor_txns) <= min(vendor_txns) * 1.02),
-            "amount_fluctuation_emmanuel2": price_fluctuation,
-            # "price_cluster_emmanuel2": -1,  # Indicates clustering was not performed
-        }
+    price_fluctuation = float(vendor_amounts.max() - vendor_amounts.min())
 
-    # Perform KMeans clustering
-    # amounts = np.array(vendor_txns).reshape(-1, 1)
-    # kmeans = KMeans(n_clusters=min(3, len(set(vendor_txns))), random_state=42).fit(amounts)
+    # Perform KMeans clustering (needs at least 3 transactions and 2 distinct amounts, else price_cluster is -1)
+    # amounts = vendor_amounts.reshape(-1, 1)
+    # kmeans = KMeans(n_clusters=min(3, len(np.unique(vendor_amounts))), random_state=42).fit(amounts)
     # price_cluster = kmeans.predict([[transaction.amount]])[0]
 
     return {
-        # "is_fixed_amount_recurring_emmanuel2": int(max(vendor_txns) <= min(vendor_txns) * 1.02),
+        # "is_fixed_amount_recurring_emmanuel2": int(vendor_amounts.max() <= vendor_amounts.min() * 1.02),
         "amount_fluctuation_emmanuel2": price_fluctuation,
         # "price_cluster_emmanuel2": price_cluster,
     }
@@ -250,9 +293,9 @@ def get_amount_features(transaction: Transaction, transactions: list[Transaction
 
 def get_user_behavior_features(transaction: Transaction, transactions: list[Transaction]) -> dict:
     """Extracts user-level spending behavior."""
-    user_txns = [t.amount for t in transactions if t.user_id == transaction.user_id]
+    user_total_spent = _build_context(tuple(transactions)).spent_by_user.get(transaction.user_id)
 
-    if not user_txns:
+    if user_total_spent is None:
         return {
             # "user_avg_spent_emmanuel2": 0.0,
             "user_total_spent_emmanuel2": 0.0,
@@ -265,34 +308,34 @@ def get_user_behavior_features(transaction: Transaction, transactions: list[Tran
 
     return {
         # "user_avg_spent_emmanuel2": mean(user_txns),
-        "user_total_spent_emmanuel2": sum(user_txns),
+        "user_total_spent_emmanuel2": user_total_spent,
         # "user_subscription_count_emmanuel2": user_subscription_count,
     }
 
 
 def get_refund_features(transaction: Transaction, transactions: list[Transaction]) -> dict:
     """Extracts refund-related features."""
-    refunds = [t for t in transactions if t.amount == -transaction.amount]
+    refund_ordinals = _build_context(tuple(transactions)).ordinals_by_amount.get(-transaction.amount_cents)
 
-    if not refunds:
+    if not refund_ordinals:
         return {
             # "refund_rate_emmanuel2": 0.0,
             "avg_refund_time_lag_emmanuel2": 0.0,
         }
 
-    refund_time_lags = [
-        (datetime.strptime(t.date, "%Y-%m-%d") - datetime.strptime(transaction.date, "%Y-%m-%d")).days for t in refunds
-    ]
+    # the lags are whole days, so their sum is exact and the division rounds just like statistics.mean
+    total_refund_time_lag = sum(refund_ordinals) - len(refund_ordinals) * transaction.date_ordinal
+    avg_refund_time_lag = total_refund_time_lag / len(refund_ordinals)
 
     return {
         # "refund_rate_emmanuel2": len(refunds) / len(transactions),
-        "avg_refund_time_lag_emmanuel2": mean(refund_time_lags) if refund_time_lags else 0.0,
+        "avg_refund_time_lag_emmanuel2": avg_refund_time_lag,
     }
 
 
 def get_monthly_spending_trend(transaction: Transaction, transactions: list[Transaction]) -> dict:
     """Calculates the total spending for the transaction's month."""
     month_year = transaction.date[:7]  # Extracts YYYY-MM
-    monthly_spending = sum(t.amount for t in transactions if t.date.startswith(month_year))
+    monthly_spending = _build_context(tuple(transactions)).spent_by_month.get(month_year, 0)
 
     return {"monthly_spending_trend_emmanuel2": monthly_spending}
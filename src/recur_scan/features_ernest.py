@@ -1,46 +1,89 @@
 import statistics
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 import numpy as np
 
 from recur_scan.transactions import Transaction
-from recur_scan.utils import get_day, parse_date
+from recur_scan.utils import get_date_ordinal, get_day, parse_date
+
+
+@dataclass(frozen=True)
+class _VendorColumns:
+    """Per-transaction arrays with each name encoded as a small int id."""
+
+    name_codes: dict[str, int]
+    name_ids: np.ndarray
+    ordinals: np.ndarray
+    amounts: np.ndarray
+    days_of_month: np.ndarray
+
+
+@lru_cache(maxsize=128)
+def _columns(transactions: tuple[Transaction, ...]) -> _VendorColumns:
+    """Build the columns and name codebook once per distinct list of transactions."""
+    n = len(transactions)
+    name_codes: dict[str, int] = {}
+    name_ids = np.fromiter(
+        (name_codes.setdefault(t.name, len(name_codes)) for t in transactions), dtype=np.int32, count=n
+    )
+    return _VendorColumns(
+        name_codes=name_codes,
+        name_ids=name_ids,
+        ordinals=np.fromiter((get_date_ordinal(t.date) for t in transactions), dtype=np.int64, count=n),
+        amounts=np.fromiter((t.amount for t in transactions), dtype=np.float64, count=n),
+        days_of_month=np.fromiter((get_day(t.date) for t in transactions), dtype=np.int64, count=n),
+    )
+
+
+def _vendor_columns(transaction: Transaction, all_transactions: list[Transaction]) -> tuple[_VendorColumns, np.ndarray]:
+    """Return the columns and a mask selecting the transactions with the same name."""
+    columns = _columns(tuple(all_transactions))
+    return columns, columns.name_ids == columns.name_codes.get(transaction.name, -1)
+
+
+def _vendor_gaps(transaction: Transaction, all_transactions: list[Transaction]) -> np.ndarray:
+    """Day gaps between consecutive dates of the vendor's transactions, in date order."""
+    columns, same_name = _vendor_columns(transaction, all_transactions)
+    return np.diff(np.sort(columns.ordinals[same_name]))
+
+
+def _vendor_gaps_unsorted(transaction: Transaction, all_transactions: list[Transaction]) -> np.ndarray:
+    """Absolute day gaps between the vendor's transactions, in list order."""
+    columns, same_name = _vendor_columns(transaction, all_transactions)
+    gaps: np.ndarray = np.abs(np.diff(columns.ordinals[same_name]))
+    return gaps
 
 
 def get_is_weekly(transaction: Transaction, all_transactions: list[Transaction]) -> bool:
     """Check if the transaction occurs approximately weekly (allowing some variance)."""
-    transaction_dates = sorted([parse_date(t.date) for t in all_transactions if t.name == transaction.name])
-    if len(transaction_dates) < 2:
-        return False
-    date_diffs = [abs((transaction_dates[i] - transaction_dates[i - 1]).days) for i in range(1, len(transaction_dates))]
-    return any(6 <= diff <= 8 for diff in date_diffs)
+    date_diffs = _vendor_gaps(transaction, all_transactions)
+    return bool(np.any((date_diffs >= 6) & (date_diffs <= 8)))
 
 
 def get_is_monthly(transaction: Transaction, all_transactions: list[Transaction]) -> bool:
     """Check if the transaction occurs approximately monthly (allowing some variance)."""
-    transaction_dates = sorted([parse_date(t.date) for t in all_transactions if t.name == transaction.name])
-    if len(transaction_dates) < 2:
-        return False
-    date_diffs = [abs((transaction_dates[i] - transaction_dates[i - 1]).days) for i in range(1, len(transaction_dates))]
-    return any(28 <= diff <= 32 for diff in date_diffs)
+    date_diffs = _vendor_gaps(transaction, all_transactions)
+    return bool(np.any((date_diffs >= 28) & (date_diffs <= 32)))
 
 
 def get_is_biweekly(transaction: Transaction, all_transactions: list[Transaction]) -> bool:
     """Check if the transaction occurs biweekly."""
-    transaction_dates = [parse_date(t.date) for t in all_transactions if t.name == transaction.name]
-    date_diffs = [abs((transaction_dates[i] - transaction_dates[i - 1]).days) for i in range(1, len(transaction_dates))]
-    return any(diff == 14 for diff in date_diffs)
+    return bool(np.any(_vendor_gaps_unsorted(transaction, all_transactions) == 14))
 
 
 def get_vendor_transaction_count(transaction: Transaction, all_transactions: list[Transaction]) -> int:
     """Get the total number of transactions for the vendor."""
-    return len([t for t in all_transactions if t.name == transaction.name])
+    _, same_name = _vendor_columns(transaction, all_transactions)
+    return int(np.count_nonzero(same_name))
 
 
 def get_vendor_amount_variance(transaction: Transaction, all_transactions: list[Transaction]) -> float:
     """Calculate the variance of transaction amounts for the vendor."""
-    amounts = [t.amount for t in all_transactions if t.name == transaction.name]
-    return float(np.var(amounts)) if amounts else 0.0
+    columns, same_name = _vendor_columns(transaction, all_transactions)
+    amounts = columns.amounts[same_name]
+    return float(amounts.var()) if amounts.size else 0.0
 
 
 def get_is_round_amount(transaction: Transaction) -> bool:
@@ -58,11 +101,10 @@ def get_transaction_gap_stats(transaction: Transaction, all_transactions: list[T
     Calculate the mean and variance of gaps (in days) between consecutive transactions for the same vendor.
     Returns (mean_gap, variance_gap).
     """
-    transaction_dates = sorted([parse_date(t.date) for t in all_transactions if t.name == transaction.name])
-    if len(transaction_dates) < 2:
+    gaps = _vendor_gaps(transaction, all_transactions)
+    if gaps.size == 0:
         return 0.0, 0.0
-    gaps = [(transaction_dates[i] - transaction_dates[i - 1]).days for i in range(1, len(transaction_dates))]
-    return float(np.mean(gaps)), float(np.var(gaps))
+    return float(gaps.mean()), float(gaps.var())
 
 
 def get_transaction_frequency(transaction: Transaction, all_transactions: list[Transaction]) -> float:
@@ -70,11 +112,10 @@ def get_transaction_frequency(transaction: Transaction, all_transactions: list[T
     Calculate the average frequency (in days) of transactions for the same vendor.
     Returns the average number of days between consecutive transactions.
     """
-    transaction_dates = sorted([parse_date(t.date) for t in all_transactions if t.name == transaction.name])
-    if len(transaction_dates) < 2:
+    gaps = _vendor_gaps(transaction, all_transactions)
+    if gaps.size == 0:
         return 0.0  # Not enough transactions to calculate frequency
-    gaps = [(transaction_dates[i] - transaction_dates[i - 1]).days for i in range(1, len(transaction_dates))]
-    return float(np.mean(gaps))
+    return float(gaps.mean())
 
 
 def get_is_quarterly(transaction: Transaction, all_transactions: list[Transaction]) -> bool:
@@ -82,17 +123,21 @@ def get_is_quarterly(transaction: Transaction, all_transactions: list[Transactio
     Check if the transaction occurs quarterly.
     A transaction is considered quarterly if the difference between consecutive transactions is approximately 90 days.
     """
-    transaction_dates = [parse_date(t.date) for t in all_transactions if t.name == transaction.name]
-    date_diffs = [abs((transaction_dates[i] - transaction_dates[i - 1]).days) for i in range(1, len(transaction_dates))]
-    return any(85 <= diff <= 95 for diff in date_diffs)
+    date_diffs = _vendor_gaps_unsorted(transaction, all_transactions)
+    return bool(np.any((date_diffs >= 85) & (date_diffs <= 95)))
 
 
 def get_average_transaction_amount(transaction: Transaction, all_transactions: list[Transaction]) -> float:
     """
     Calculate the average transaction amount for the vendor.
     """
-    amounts = [t.amount for t in all_transactions if t.name == transaction.name]
-    return float(np.mean(amounts)) if amounts else 0.0
+    columns, same_name = _vendor_columns(transaction, all_transactions)
+    amounts = columns.amounts[same_name]
+    return float(amounts.mean()) if amounts.size else 0.0
+
+
+SUBSCRIPTION_KEYWORDS = frozenset({"subscription", "membership", "monthly", "annual", "recurring"})
+RECURRING_VENDORS = frozenset({"netflix", "spotify", "hulu", "amazon prime", "google storage"})
 
 
 def get_is_subscription_based(transaction: Transaction) -> bool:
@@ -100,24 +145,22 @@ def get_is_subscription_based(transaction: Transaction) -> bool:
     Check if the transaction is related to subscription services.
     This is determined by matching the transaction name against a predefined list of subscription-related keywords.
     """
-    subscription_keywords = {"subscription", "membership", "monthly", "annual", "recurring"}
-    return any(keyword in transaction.name.lower() for keyword in subscription_keywords)
+    return any(keyword in transaction.name_lower for keyword in SUBSCRIPTION_KEYWORDS)
 
 
 def get_is_recurring_vendor(transaction: Transaction) -> bool:
     """
     Check if the vendor is in a predefined list of vendors known for recurring transactions.
     """
-    recurring_vendors = {"netflix", "spotify", "hulu", "amazon prime", "google storage"}
-    return bool(transaction.name.lower() in recurring_vendors)
+    return transaction.name_lower in RECURRING_VENDORS
 
 
 def get_is_fixed_amount(transaction: Transaction, all_transactions: list[Transaction]) -> bool:
     """
     Check if the transaction amount is consistent across all transactions for the vendor.
     """
-    amounts = [t.amount for t in all_transactions if t.name == transaction.name]
-    return len(set(amounts)) == 1 if amounts else False
+    columns, same_name = _vendor_columns(transaction, all_transactions)
+    return np.unique(columns.amounts[same_name]).size == 1
 
 
 def get_recurring_interval_score(transaction: Transaction, all_transactions: list[Transaction]) -> float:
@@ -125,11 +168,10 @@ def get_recurring_interval_score(transaction: Transaction, all_transactions: lis
     Calculate the variance of intervals (in days) between transactions for the vendor.
     A lower variance indicates a more consistent recurring pattern.
     """
-    transaction_dates = sorted([parse_date(t.date) for t in all_transactions if t.name == transaction.name])
-    if len(transaction_dates) < 2:
+    intervals = _vendor_gaps(transaction, all_transactions)
+    if intervals.size == 0:
         return 0.0  # Return 0.0 instead of infinity when there are insufficient data points
-    intervals = [(transaction_dates[i] - transaction_dates[i - 1]).days for i in range(1, len(transaction_dates))]
-    return float(np.var(intervals))
+    return float(intervals.var())
 
 
 def get_is_weekend_transaction(transaction: Transaction) -> bool:
@@ -144,11 +186,10 @@ def get_is_high_frequency_vendor(transaction: Transaction, all_transactions: lis
     """
     Check if the vendor has a high transaction frequency (e.g., daily or weekly).
     """
-    transaction_dates = sorted([parse_date(t.date) for t in all_transactions if t.name == transaction.name])
-    if len(transaction_dates) < 2:
+    intervals = _vendor_gaps(transaction, all_transactions)
+    if intervals.size == 0:
         return False
-    intervals = [(transaction_dates[i] - transaction_dates[i - 1]).days for i in range(1, len(transaction_dates))]
-    average_interval = np.mean(intervals)
+    average_interval = intervals.mean()
     return bool(average_interval <= 7)  # Explicitly cast to bool
 
 
@@ -156,8 +197,8 @@ def get_is_same_day_of_month(transaction: Transaction, all_transactions: list[Tr
     """
     Check if the transaction consistently occurs on the same day of the month.
     """
-    days = [get_day(t.date) for t in all_transactions if t.name == transaction.name]
-    return len(set(days)) == 1 if days else False
+    columns, same_name = _vendor_columns(transaction, all_transactions)
+    return np.unique(columns.days_of_month[same_name]).size == 1
 
 
 # New Features
@@ -214,7 +255,8 @@ def get_is_same_day_of_month(transaction: Transaction, all_transactions: list[Tr
 
 def get_amount_consistency_score(transaction: Transaction, all_transactions: list[Transaction]) -> float:
     """Return consistency score of transaction amounts (lower is better)."""
-    amounts = [t.amount for t in all_transactions if t.name == transaction.name]
+    columns, same_name = _vendor_columns(transaction, all_transactions)
+    amounts: list[float] = columns.amounts[same_name].tolist()
     if not amounts:
         return 0.0
     mean_amount = sum(amounts) / len(amounts)
@@ -224,11 +266,11 @@ def get_amount_consistency_score(transaction: Transaction, all_transactions: lis
 
 def get_median_days_between(transaction: Transaction, all_transactions: list[Transaction]) -> float:
     """Get median number of days between transactions of the same name."""
-    transaction_dates = sorted([parse_date(t.date) for t in all_transactions if t.name == transaction.name])
-    if len(transaction_dates) < 2:
+    date_diffs = _vendor_gaps(transaction, all_transactions)
+    if date_diffs.size == 0:
         return 0.0
-    date_diffs = [(transaction_dates[i] - transaction_dates[i - 1]).days for i in range(1, len(transaction_dates))]
-    return statistics.median(date_diffs)
+    gaps: list[int] = date_diffs.tolist()
+    return statistics.median(gaps)
 
 
 # def get_std_dev_days_between(transaction: Transaction, all_transactions: list[Transaction]) -> float:
@@ -2,11 +2,21 @@ import math
 import re
 import statistics
 from datetime import datetime
-from statistics import mean
+from functools import lru_cache
 
 import numpy as np
 
 from recur_scan.transactions import Transaction
+from recur_scan.utils import get_date_ordinal, parse_date
+
+ALWAYS_RECURRING_PATTERN = re.compile(
+    r"\b(netflix|spotify|google play|hulu|disney\+|youtube|adobe|microsoft|walmart\+|amazon prime)\b", re.IGNORECASE
+)
+INSURANCE_PATTERN = re.compile(r"\b(insur|geico|allstate|state farm|progressive|insur|insuranc)\b", re.IGNORECASE)
+MOBILE_COMPANIES = frozenset({"t-mobile", "at&t", "verizon", "boost mobile", "tello mobile", "spectrum"})
+UTILITY_PATTERN = re.compile(
+    r"\b(water|electricity|gas|internet|cable|energy|utilit|utility|cable|electric|light|phone)\b", re.IGNORECASE
+)
 
 # Helper function to get the number of days since the epoch
 
@@ -113,72 +123,68 @@ def get_is_always_recurring(transaction: Transaction) -> bool:
     All transactions from these vendors are considered recurring.
     """
     # Use a regular expression with boundaries to match case-insensitive company names
-    match = re.search(
-        r"\b(netflix|spotify|google play|hulu|disney\+|youtube|adobe|microsoft|walmart\+|amazon prime)\b",
-        transaction.name,
-        re.IGNORECASE,
-    )
-    return bool(match)
+    return bool(ALWAYS_RECURRING_PATTERN.search(transaction.name))
 
 
 def get_is_insurance(transaction: Transaction) -> bool:
     """Check if the transaction is from a known insurance company."""
     # Use a regular expression with boundaries to match case-insensitive company names
-    match = re.search(
-        r"\b(insur|geico|allstate|state farm|progressive|insur|insuranc)\b", transaction.name, re.IGNORECASE
-    )
-    return bool(match)
+    return bool(INSURANCE_PATTERN.search(transaction.name))
 
 
 def get_is_utility(transaction: Transaction) -> bool:
     """Check if the transaction is from a known utility company."""
     # Use a regular expression with boundaries to match case-insensitive company names
-    match = re.search(
-        r"\b(water|electricity|gas|internet|cable|energy|utilit|utility|cable|electric|light|phone)\b",
-        transaction.name,
-        re.IGNORECASE,
-    )
-    return bool(match)
+    return bool(UTILITY_PATTERN.search(transaction.name))
 
 
-def get_year(transaction: Transaction) -> int:
-    """Get the year for the transaction date."""
+@lru_cache(maxsize=65536)
+def _date_parts(date: str) -> tuple[int, int, int]:
+    """Get the (year, month, day) of a date string, or -1 for each part if it is invalid."""
     try:
-        return datetime.strptime(transaction.date, "%Y-%m-%d").year
+        parsed = parse_date(date)
     except ValueError:
-        return -1
+        return -1, -1, -1
+    return parsed.year, parsed.month, parsed.day
+
+
+def get_year(transaction: Transaction) -> int:
+    """Get the year for the transaction date."""
+    return _date_parts(transaction.date)[0]
 
 
 def get_month(transaction: Transaction) -> int:
     """Get the month for the transaction date."""
-    try:
-        return datetime.strptime(transaction.date, "%Y-%m-%d").month
-    except ValueError:
-        return -1
+    return _date_parts(transaction.date)[1]
 
 
 def get_day(transaction: Transaction) -> int:
     """Get the day for the transaction date."""
-    try:
-        return datetime.strptime(transaction.date, "%Y-%m-%d").day
-    except ValueError:
-        return -1
+    return _date_parts(transaction.date)[2]
 
 
 def get_is_phone(transaction: Transaction) -> bool:
     """Check if the transaction is from a known mobile company."""
-    mobile_companies = {"t-mobile", "at&t", "verizon", "boost mobile", "tello mobile", "spectrum"}
-    return transaction.name.lower() in mobile_companies
+    return transaction.name.lower() in MOBILE_COMPANIES
+
+
+@lru_cache(maxsize=128)
+def _amount_bounds(transactions: tuple[Transaction, ...]) -> tuple[float, float]:
+    """Get the (min, max) transaction amount in one pass, once per distinct list of transactions."""
+    amounts = [t.amount for t in transactions]
+    if not amounts:
+        return 0.0, 0.0
+    return min(amounts), max(amounts)
 
 
 def get_min_transaction_amount(all_transactions: list[Transaction]) -> float:
     """Get the minimum transaction amount."""
-    return min((t.amount for t in all_transactions), default=0.0)
+    return _amount_bounds(tuple(all_transactions))[0]
 
 
 def get_max_transaction_amount(all_transactions: list[Transaction]) -> float:
     """Get the maximum transaction amount."""
-    return max((t.amount for t in all_transactions), default=0.0)
+    return _amount_bounds(tuple(all_transactions))[1]
 
 
 def get_transaction_intervals(transactions: list[Transaction]) -> dict[str, float]:
@@ -190,6 +196,13 @@ def get_transaction_intervals(transactions: list[Transaction]) -> dict[str, floa
     - Identifies if transactions occur on the same weekday.
     - Checks if payment amounts are within ±5% of each other.
     """
+    # these depend only on the list, so compute them once per list and hand out copies
+    return dict(_transaction_intervals(tuple(transactions)))
+
+
+@lru_cache(maxsize=128)
+def _transaction_intervals(transactions: tuple[Transaction, ...]) -> dict[str, float]:
+    """Compute get_transaction_intervals once per distinct list of transactions."""
     if len(transactions) < 2:
         return {
             "avg_days_between_transactions_felix": 0.0,
@@ -198,39 +211,27 @@ def get_transaction_intervals(transactions: list[Transaction]) -> dict[str, floa
             # "same_weekday_felix": 0,
             "same_amount_felix": 0,
         }
-    # Sort transactions by date
-    dates = sorted([
-        datetime.strptime(trans.date, "%Y-%m-%d") if isinstance(trans.date, str) else trans.date
-        for trans in transactions
-    ])
+    # Sort transaction dates as day ordinals
+    ordinals = np.sort(np.fromiter((get_date_ordinal(trans.date) for trans in transactions), dtype=np.int64))
 
     # calculate days between each consecutive grouped transactions
-    intervals = [(dates[i] - dates[i - 1]).days for i in range(1, len(dates))]
+    intervals = np.diff(ordinals)
 
     # compute average and standard deviation of transaction intervals
-    avg_days = mean(intervals) if intervals else 0.0
-    # std_dev_days = stdev(intervals) if len(intervals) > 1 else 0.0
+    avg_days = float(intervals.mean())
+    # std_dev_days = float(intervals.std(ddof=1)) if len(intervals) > 1 else 0.0
 
     # check for flexible monthly recurrence (±7 days)
-    monthly_count = sum(
-        1
-        for gap in intervals
-        if 23 <= gap <= 38  # 30 ± 7 days
-    )
-    monthly_recurrence = monthly_count / len(intervals) if intervals else 0.0
+    monthly_recurrence = float(((intervals >= 23) & (intervals <= 38)).mean())  # 30 ± 7 days
 
     # check if transactions occur on the same weekday
-    # weekdays = [date.weekday() for date in dates]  # Monday = 0, Sunday = 6
-    # same_weekday = 1 if len(set(weekdays)) == 1 else 0  # 1 if all transactions happen on the same weekday
+    # same_weekday = 1 if np.ptp(ordinals % 7) == 0 else 0  # 1 if all transactions happen on the same weekday
 
     # check if payment amounts are within ±5% of each other
-    amounts = [trans.amount for trans in transactions]
+    amounts = np.fromiter((trans.amount for trans in transactions), dtype=np.float64)
 
     base_amount = amounts[0]
-    if base_amount == 0:
-        consistent_amount = 0.0
-    else:
-        consistent_amount = sum(1 for amt in amounts if abs(amt - base_amount) / base_amount <= 0.05) / len(amounts)
+    consistent_amount = 0.0 if base_amount == 0 else float((np.abs(amounts - base_amount) / base_amount <= 0.05).mean())
 
     return {
         "avg_days_between_transactions_felix": avg_days,
@@ -249,7 +250,7 @@ def get_transactions_interval_stability(transaction: Transaction, transactions:
         return 0.0  # No intervals to calculate
 
     # Sort transactions by date (convert date strings to datetime objects)
-    vendor_transactions.sort(key=lambda t: datetime.strptime(t.date, "%Y-%m-%d"))
+    vendor_transactions.sort(key=lambda t: t.date)
 
     # Calculate intervals in days
     intervals = [
@@ -308,7 +309,7 @@ def get_vendor_transaction_recurring(transaction: Transaction, all_transactions:
         return 0  # Can't detect a pattern with fewer than 3 transactions
 
     # Sort by date
-    relevant = sorted(relevant, key=lambda t: datetime.strptime(t.date, "%Y-%m-%d"))
+    relevant = sorted(relevant, key=lambda t: t.date)
     dates = [datetime.strptime(t.date, "%Y-%m-%d") for t in relevant]
 
     # Find if dates occur approximately monthly (30 days ± 2 days)
@@ -344,7 +345,7 @@ def get_likelihood_of_recurrence(transaction: Transaction, all_transactions: lis
     if len(vendor_transactions) < n:
         return 0.0
 
-    vendor_transactions.sort(key=lambda t: datetime.strptime(t.date, "%Y-%m-%d"))
+    vendor_transactions.sort(key=lambda t: t.date)
     intervals = [
         (
             datetime.strptime(vendor_transactions[i + 1].date, "%Y-%m-%d")
@@ -376,7 +377,7 @@ def get_transaction_recency(transaction: Transaction, all_transactions: list[Tra
     vendor_transactions = [
         t for t in all_transactions if t.name == transaction.name and t.user_id == transaction.user_id
     ]
-    vendor_transactions.sort(key=lambda t: datetime.strptime(t.date, "%Y-%m-%d"))
+    vendor_transactions.sort(key=lambda t: t.date)
 
     # Find the index of our transaction
     try:
@@ -2,14 +2,15 @@ import itertools
 import re
 from collections import Counter, defaultdict
 from collections.abc import Sequence
-from datetime import date, timedelta
+from datetime import date
 from difflib import SequenceMatcher
+from functools import lru_cache
 from statistics import StatisticsError, mean, median, stdev
 
 import numpy as np
 
 from recur_scan.transactions import Transaction
-from recur_scan.utils import parse_date
+from recur_scan.utils import count_amounts_between, get_date_ordinal, parse_date
 
 
 def transactions_per_month(all_transactions: list[Transaction]) -> float:
@@ -161,6 +162,26 @@ def vendor_recurrence_trend(all_transactions: list[Transaction]) -> float:
     return max(float(slope), 0.0)  # Ensure non-negative slope
 
 
+# date.toordinal() of 1970-01-01, the datetime64 epoch
+_EPOCH_ORDINAL = 719163
+
+
+def _weekdays(ordinals: np.ndarray) -> np.ndarray:
+    """Day of the week (0=Monday) of each date ordinal, as date.weekday() gives"""
+    # ordinal 1 (0001-01-01) was a Monday
+    weekdays: np.ndarray = (ordinals - 1) % 7
+    return weekdays
+
+
+def _iso_week_numbers(ordinals: np.ndarray) -> np.ndarray:
+    """ISO 8601 week number of each date ordinal, as date.isocalendar()[1] gives, computed for the whole array"""
+    # an ISO week belongs to the year its Thursday falls in, and week 1 holds that year's first Thursday
+    thursdays = (ordinals - _weekdays(ordinals) + 3 - _EPOCH_ORDINAL).astype("datetime64[D]")
+    first_days_of_year = thursdays.astype("datetime64[Y]").astype("datetime64[D]")
+    week_numbers: np.ndarray = (thursdays - first_days_of_year).astype(np.int64) // 7 + 1
+    return week_numbers
+
+
 def weekly_spending_cycle(all_transactions: list[Transaction]) -> float:
     """
     Measures how much transaction amounts vary on a weekly basis with a flexible 2-3 day shift.
@@ -174,9 +195,10 @@ def weekly_spending_cycle(all_transactions: list[Transaction]) -> float:
 
     weekly_amounts = defaultdict(list)
 
-    for t in all_transactions:
-        week_number = (parse_date(t.date) - timedelta(days=parse_date(t.date).weekday() % 3)).isocalendar()[1]
-        # This adjusts week grouping, allowing slight shifts in weekday alignment (±2-3 days)
+    ordinals = np.fromiter((get_date_ordinal(t.date) for t in all_transactions), dtype=np.int64)
+    # This adjusts week grouping, allowing slight shifts in weekday alignment (±2-3 days)
+    week_numbers = _iso_week_numbers(ordinals - _weekdays(ordinals) % 3)
+    for week_number, t in zip(week_numbers.tolist(), all_transactions, strict=True):
         weekly_amounts[week_number].append(t.amount)
 
     weekly_avgs = [mean(amounts) for amounts in weekly_amounts.values() if amounts]
@@ -247,7 +269,7 @@ def get_same_amount_ratio(
     upper_bound = current_amount * (1 + tolerance)
 
     # Count transactions within the acceptable range
-    n_similar_amounts = sum(1 for t in all_transactions if lower_bound <= t.amount <= upper_bound)
+    n_similar_amounts = count_amounts_between(all_transactions, lower_bound, upper_bound)
 
     # Calculate the ratio
     return n_similar_amounts / len(all_transactions)
@@ -572,7 +594,18 @@ UTILITY_PATTERN = re.compile(
     r"\b(" + "|".join(re.escape(keyword) for keyword in UTILITY_KEYWORDS) + r")\b", re.IGNORECASE
 )
 
+# Known recurring company names appearing anywhere in the cleaned name (case-sensitive, like `in`)
+KNOWN_RECURRING_SUBSTRING_PATTERN = re.compile("|".join(re.escape(keyword) for keyword in KNOWN_RECURRING_COMPANIES))
 
+# recurring_score tiers, highest score first, so the first matching pattern gives the score
+RECURRING_SCORE_TIERS = (
+    (RECURRING_PATTERN, 1.0),
+    (UTILITY_PATTERN, 0.8),  # Utilities are highly likely to be recurring
+    (KNOWN_RECURRING_SUBSTRING_PATTERN, 0.7),  # Partial match confidence
+)
+
+
+@lru_cache(maxsize=4096)
 def clean_company_name(name: str) -> str:
     """Normalize company name for better matching."""
     return re.sub(r"[^a-zA-Z0-9\s]", "", name).strip().lower()
@@ -596,17 +629,9 @@ def recurring_score(company_name: str) -> float:
     whether a company is likely offering recurring payments.
     """
     cleaned_name = clean_company_name(company_name)
-
-    if RECURRING_PATTERN.search(cleaned_name):
-        return 1.0
-    if UTILITY_PATTERN.search(cleaned_name):
-        return 0.8  # Utilities are highly likely to be recurring
-
-    # Check for partial matches with known recurring companies
-    for keyword in KNOWN_RECURRING_COMPANIES:
-        if keyword in cleaned_name:
-            return 0.7  # Partial match confidence
-
+    for pattern, score in RECURRING_SCORE_TIERS:
+        if pattern.search(cleaned_name):
+            return score
     return 0.0
 
 
@@ -635,9 +660,9 @@ def get_subscription_score(all_transactions: list[Transaction]) -> float:
     # Find the closest cycle
     detected_cycle = min(
         base_cycles,
-        key=lambda c: abs(median_interval - c)
-        if cycle_ranges[c][0] <= median_interval <= cycle_ranges[c][1]
-        else float("inf"),
+        key=lambda c: (
+            abs(median_interval - c) if cycle_ranges[c][0] <= median_interval <= cycle_ranges[c][1] else float("inf")
+        ),
     )
 
     # Interval consistency (adaptive threshold)
@@ -793,7 +818,7 @@ def amount_similarity(transaction: Transaction, transactions: list[Transaction],
     current_amount = transaction.amount
     lower_bound = current_amount * (1 - tolerance)
     upper_bound = current_amount * (1 + tolerance)
-    similar_count = sum(1 for t in transactions if lower_bound <= t.amount <= upper_bound)
+    similar_count = count_amounts_between(transactions, lower_bound, upper_bound)
     return float(similar_count) / float(len(transactions))
 
 
@@ -1112,7 +1137,7 @@ def is_brigit_subscription_like(transactions: list[Transaction]) -> float:
     if not transactions or not any("brigit" in t.name.lower() for t in transactions):
         return 0.0
 
-    subscription_txns = [t for t in transactions if 8.0 <= t.amount <= 15.5 and round(t.amount % 1, 2) == 0.99]
+    subscription_txns = [t for t in transactions if 8.0 <= t.amount <= 15.5 and t.amount_cents % 100 == 99]
 
     if len(subscription_txns) < 2:
         return 0.0
@@ -6,14 +6,14 @@ from recur_scan.utils import get_day, parse_date
 
 def get_n_transactions_same_description(transaction: Transaction, all_transactions: list[Transaction]) -> int:
     """Get the number of transactions in all_transactions with the same description as transaction"""
-    return len([t for t in all_transactions if t.name == transaction.name])  # type: ignore
+    return sum(1 for t in all_transactions if t.name == transaction.name)  # type: ignore
 
 
 def get_percent_transactions_same_description(transaction: Transaction, all_transactions: list[Transaction]) -> float:
     """Get the percentage of transactions in all_transactions with the same description as transaction"""
     if not all_transactions:
         return 0.0
-    n_same_description = len([t for t in all_transactions if t.name == transaction.name])  # type: ignore
+    n_same_description = sum(1 for t in all_transactions if t.name == transaction.name)  # type: ignore
     return n_same_description / len(all_transactions)
 
 
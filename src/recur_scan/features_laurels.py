@@ -1,7 +1,6 @@
 from datetime import date, datetime
 
 import numpy as np
-from scipy.stats import entropy
 
 from recur_scan.transactions import Transaction
 from recur_scan.utils import parse_date
@@ -32,6 +31,19 @@ def _aggregate_transactions(transactions: list[Transaction]) -> dict[str, dict[s
     return user_merchant_groups
 
 
+def _entropy(probabilities: np.ndarray) -> float:
+    """Compute the Shannon entropy (natural log) of a probability distribution, as scipy.stats.entropy does.
+
+    Args:
+        probabilities (np.ndarray): Probabilities summing to 1; zero entries contribute nothing.
+
+    Returns:
+        float: The entropy in nats.
+    """
+    nonzero = probabilities[probabilities > 0]
+    return float(-(nonzero * np.log(nonzero)).sum())
+
+
 def _calculate_intervals(dates: list[date]) -> list[int]:
     """Calculate the number of days between consecutive dates in a sorted list.
 
@@ -387,7 +399,9 @@ def transaction_pattern_complexity(merchant_trans: list[Transaction], interval_s
     # Component 1: Interval entropy (distribution complexity)
     bins = [min(max(1, int(i / 7)), 52) for i in intervals]
     value_counts = np.bincount(bins, minlength=53)[1:]
-    interval_entropy = float(entropy(value_counts / value_counts.sum()) / np.log(52) if value_counts.sum() > 0 else 0.0)
+    interval_entropy = float(
+        _entropy(value_counts / value_counts.sum()) / np.log(52) if value_counts.sum() > 0 else 0.0
+    )
 
     # Component 2: Interval variability (std/mean from interval_stats)
     mean_interval = interval_stats["mean"]
@@ -434,7 +448,7 @@ def date_irregularity_dominance(
 
     bins = [min(max(1, int(i / 7)), 52) for i in intervals]
     value_counts = np.bincount(bins, minlength=53)[1:]
-    entropy_score = float(entropy(value_counts / value_counts.sum()) / np.log(52) if value_counts.sum() > 0 else 0.0)
+    entropy_score = float(_entropy(value_counts / value_counts.sum()) / np.log(52) if value_counts.sum() > 0 else 0.0)
     mean = interval_stats["mean"]
     deviation = min(abs(mean - target) / target for target in [7, 30, 365])
     deviation_score = float(min(deviation * 3, 1.0))
@@ -1,44 +1,84 @@
+import re
+from collections import defaultdict
 from datetime import date, datetime
-from statistics import mean, stdev
+from functools import lru_cache
 from typing import TypedDict
 
+import numpy as np
 import pandas as pd
 
 from recur_scan.transactions import Transaction
-from recur_scan.utils import parse_date
+from recur_scan.utils import get_date_ordinal
+
+ALWAYS_RECURRING_VENDORS = frozenset({"netflix", "spotify", "disney+", "hulu", "amazon prime"})
+
+# Subscription keywords matched anywhere in the lowercased name, in a single scan
+SUBSCRIPTION_KEYWORD_PATTERN = re.compile("premium|monthly|plan|subscription")
+
+
+@lru_cache(maxsize=128)
+def _ordinals_by_name(transactions: tuple[Transaction, ...]) -> dict[str, np.ndarray]:
+    """Group date ordinals by name once per distinct list of transactions, each sorted."""
+    by_name: defaultdict[str, list[int]] = defaultdict(list)
+    for t in transactions:
+        by_name[t.name].append(get_date_ordinal(t.date))
+    return {name: np.sort(np.array(ordinals, dtype=np.int64)) for name, ordinals in by_name.items()}
+
+
+def _sorted_ordinals(name: str, transactions: list[Transaction]) -> np.ndarray:
+    """Sorted date ordinals of the transactions with the given name."""
+    ordinals = _ordinals_by_name(tuple(transactions)).get(name)
+    return ordinals if ordinals is not None else np.empty(0, dtype=np.int64)
+
+
+def _interval_regularity(ordinals: np.ndarray) -> float:
+    """Score how evenly spaced sorted date ordinals are, from the mean absolute deviation of their intervals."""
+    intervals = np.diff(ordinals)
+    avg_interval = float(intervals.mean())
+    deviation = float(np.abs(intervals - avg_interval).mean())
+    return max(0.0, 1.0 - (3 * deviation / max(avg_interval, 1)))
+
+
+def _abs_zscore(amounts: np.ndarray, amount: float) -> float:
+    """Absolute z-score of amount against amounts, using the sample standard deviation."""
+    # constant amounts have no spread; checked exactly since np.mean of repeated floats can be off by an ulp
+    if np.all(amounts == amounts[0]):
+        return 0.0
+    std = float(amounts.std(ddof=1))
+    return abs(amount - float(amounts.mean())) / std if std > 0 else 0.0
 
 
 def get_is_monthly_recurring(transaction: Transaction, transactions: list[Transaction]) -> bool:
     """Check if the transaction recurs monthly."""
-    same_name_txns = [t for t in transactions if t.name == transaction.name and t.date != transaction.date]
-    if len(same_name_txns) < 2:  # Require at least 2 prior transactions
+    ref_ordinal = get_date_ordinal(transaction.date)
+    ordinals = _sorted_ordinals(transaction.name, transactions)
+    ordinals = ordinals[ordinals != ref_ordinal]
+    if len(ordinals) < 2:  # Require at least 2 prior transactions
         return False
-    ref_date = parse_date(transaction.date)
-    intervals = sorted([abs((parse_date(t.date) - ref_date).days) for t in same_name_txns])
+    intervals = np.abs(ordinals - ref_ordinal)
     # Check if at least two intervals are approximately monthly (28-31 days)
-    monthly_count = sum(1 for i in intervals if 28 <= i <= 31)
+    monthly_count = int(np.count_nonzero((intervals >= 28) & (intervals <= 31)))
     return monthly_count >= 2  # Require at least 2 monthly intervals
 
 
 def get_is_similar_amount(transaction: Transaction, transactions: list[Transaction]) -> bool:
     """Check if the amount is similar to others (within 5%)."""
-    same_name_txns = [t for t in transactions if t.name == transaction.name]
-    if not same_name_txns:
+    amounts = [t.amount for t in transactions if t.name == transaction.name]
+    if not amounts:
         return False
-    avg_amount = mean([t.amount for t in same_name_txns])
+    # plain float mean: statistics.mean sums exactly through Fractions, far slower and not needed for a 5% check
+    avg_amount = sum(amounts) / len(amounts)
     return abs(transaction.amount - avg_amount) / (avg_amount or 1.0) <= 0.05  # Avoid division by zero
 
 
 def get_transaction_interval_consistency(transaction: Transaction, transactions: list[Transaction]) -> float:
     """Measure consistency of transaction intervals."""
-    same_name_txns = sorted([t for t in transactions if t.name == transaction.name], key=lambda x: parse_date(x.date))
-    if len(same_name_txns) < 3:  # Need at least 2 intervals (3 transactions)
-        return 0.0 if len(same_name_txns) <= 1 else 0.5
-    intervals = [
-        (parse_date(same_name_txns[i].date) - parse_date(same_name_txns[i - 1].date)).days
-        for i in range(1, len(same_name_txns))
-    ]
-    return 1.0 - (stdev(intervals) / mean(intervals) if intervals and mean(intervals) > 0 else 0.0)
+    ordinals = _sorted_ordinals(transaction.name, transactions)
+    if len(ordinals) < 3:  # Need at least 2 intervals (3 transactions)
+        return 0.0 if len(ordinals) <= 1 else 0.5
+    intervals = np.diff(ordinals)
+    avg_interval = float(intervals.mean())
+    return 1.0 - (float(intervals.std(ddof=1)) / avg_interval if avg_interval > 0 else 0.0)
 
 
 def get_cluster_label(transaction: Transaction, transactions: list[Transaction]) -> int:
@@ -50,51 +90,40 @@ def get_cluster_label(transaction: Transaction, transactions: list[Transaction])
 def get_subscription_keyword_score(transaction: Transaction) -> float:
     """Score based on subscription-related keywords."""
     name_lower = transaction.name.lower()
-    always_recurring = {"netflix", "spotify", "disney+", "hulu", "amazon prime"}
-    keywords = {"premium", "monthly", "plan", "subscription"}
-    if name_lower in always_recurring:
+    if name_lower in ALWAYS_RECURRING_VENDORS:
         return 1.0
-    if any(kw in name_lower for kw in keywords):
+    if SUBSCRIPTION_KEYWORD_PATTERN.search(name_lower):
         return 0.8
     return 0.0
 
 
 def get_recurring_confidence_score(transaction: Transaction, transactions: list[Transaction]) -> float:
     """Calculate a confidence score for recurrence."""
-    same_name_txns = [t for t in transactions if t.name == transaction.name]
-    if not same_name_txns:
+    ordinals = _sorted_ordinals(transaction.name, transactions)
+    count = len(ordinals)
+    if count == 0:
         return 0.0
-    time_score = get_time_regularity_score(transaction, transactions)
+    # a once-seen name has no intervals, so skip the regularity pass entirely
+    time_score = _interval_regularity(ordinals) if count >= 2 else 0.0
     amount_score = 1.0 if get_is_similar_amount(transaction, transactions) else 0.5
-    freq_score = min(1.0, len(same_name_txns) * 0.4)
+    freq_score = min(1.0, count * 0.4)
     return max(0.0, min(1.0, (time_score * 0.5 + amount_score * 0.3 + freq_score * 0.2)))
 
 
 def get_time_regularity_score(transaction: Transaction, transactions: list[Transaction]) -> float:
     """Score based on regularity of transaction timing."""
-    same_name_txns = sorted([t for t in transactions if t.name == transaction.name], key=lambda x: parse_date(x.date))
-    if len(same_name_txns) < 2:
+    ordinals = _sorted_ordinals(transaction.name, transactions)
+    if len(ordinals) < 2:
         return 0.0
-    intervals = [
-        (parse_date(same_name_txns[i].date) - parse_date(same_name_txns[i - 1].date)).days
-        for i in range(1, len(same_name_txns))
-    ]
-    if not intervals:
-        return 0.0
-    avg_interval = mean(intervals)
-    variance = sum(abs(x - avg_interval) for x in intervals) / len(intervals)
-    return max(0.0, 1.0 - (3 * variance / max(avg_interval, 1)))
+    return _interval_regularity(ordinals)
 
 
 def get_outlier_score(transaction: Transaction, transactions: list[Transaction]) -> float:
     """Calculate z-score to detect outliers."""
-    same_name_txns = [t for t in transactions if t.name == transaction.name]
-    if len(same_name_txns) < 2:
+    amounts = np.fromiter((t.amount for t in transactions if t.name == transaction.name), dtype=np.float64)
+    if len(amounts) < 2:
         return 0.0
-    amounts = [t.amount for t in same_name_txns]
-    avg = mean(amounts)
-    std = stdev(amounts) if len(amounts) > 1 else 0.0  # Avoid stdev on single value
-    return abs(transaction.amount - avg) / std if std > 0 else 0.0
+    return _abs_zscore(amounts, transaction.amount)
 
 
 # New features are below
@@ -168,7 +197,7 @@ def get_avg_amount_same_name(transaction: Transaction, transactions: list[Transa
 
 def get_empower_twice_monthly_count(transactions: list[Transaction]) -> int:
     """Count months with at least two Empower transactions."""
-    df = pd.DataFrame([t.__dict__ for t in transactions])
+    df = pd.DataFrame([{"name": t.name, "date": t.date} for t in transactions])
     df_empower = df[df["name"].str.contains("Empower", case=False, na=False)].copy()
     if df_empower.empty:
         return 0
@@ -1,65 +1,98 @@
 import re
-from datetime import datetime
+from collections import defaultdict
+from functools import lru_cache
 
 import numpy as np
 
 from recur_scan.transactions import Transaction
+from recur_scan.utils import get_date_ordinal
+
+
+@lru_cache(maxsize=128)
+def _group_transactions(
+    transactions: tuple[Transaction, ...],
+) -> tuple[dict[float, list[Transaction]], dict[str, list[Transaction]]]:
+    """Bucket transactions by amount and by name once per distinct list, so each feature is a dict lookup"""
+    by_amount: defaultdict[float, list[Transaction]] = defaultdict(list)
+    by_name: defaultdict[str, list[Transaction]] = defaultdict(list)
+    for t in transactions:
+        by_amount[t.amount].append(t)
+        by_name[t.name].append(t)
+    return dict(by_amount), dict(by_name)
+
+
+def _same_amount(transaction: Transaction, all_transactions: list[Transaction]) -> list[Transaction]:
+    """Transactions in all_transactions with the same amount as transaction, in list order"""
+    return _group_transactions(tuple(all_transactions))[0].get(transaction.amount, [])
+
+
+def _same_vendor(transaction: Transaction, all_transactions: list[Transaction]) -> list[Transaction]:
+    """Transactions in all_transactions with the same name as transaction, in list order"""
+    return _group_transactions(tuple(all_transactions))[1].get(transaction.name, [])
+
+
+@lru_cache(maxsize=128)
+def _amounts_by_name(transactions: tuple[Transaction, ...]) -> dict[str, np.ndarray]:
+    """Per-vendor amounts as read-only contiguous arrays, built once per distinct list"""
+    amounts_by_name: dict[str, np.ndarray] = {}
+    for name, group in _group_transactions(transactions)[1].items():
+        amounts = np.fromiter((t.amount for t in group), dtype=float, count=len(group))
+        amounts.flags.writeable = False  # shared between calls through the cache
+        amounts_by_name[name] = amounts
+    return amounts_by_name
+
+
+def _vendor_amounts(transaction: Transaction, all_transactions: list[Transaction]) -> np.ndarray:
+    """Amounts of the transactions with the same name as transaction, in list order"""
+    return _amounts_by_name(tuple(all_transactions)).get(transaction.name, np.empty(0))
+
+
+def _mean_interval(transactions: list[Transaction]) -> float:
+    """Mean gap in days between consecutive transactions, in the order given"""
+    # consecutive gaps telescope, so their sum is just the last date minus the first
+    total_days = get_date_ordinal(transactions[-1].date) - get_date_ordinal(transactions[0].date)
+    return total_days / (len(transactions) - 1)
 
 
 def get_time_interval_between_transactions(transaction: Transaction, all_transactions: list[Transaction]) -> float:
     """Get the average time interval (in days) between transactions with the same amount"""
     same_amount_transactions = sorted(
-        [t for t in all_transactions if t.amount == transaction.amount],  # Filter transactions with the same amount
-        key=lambda t: datetime.strptime(t.date, "%Y-%m-%d"),  # Sort by date
+        _same_amount(transaction, all_transactions),  # Transactions with the same amount
+        key=lambda t: t.date,  # Sort by date
     )
     if len(same_amount_transactions) < 2:
         return 365.0  # Return a large number if there are less than 2 transactions
-    intervals = [
-        (
-            datetime.strptime(same_amount_transactions[i + 1].date, "%Y-%m-%d")
-            - datetime.strptime(same_amount_transactions[i].date, "%Y-%m-%d")
-        ).days
-        for i in range(len(same_amount_transactions) - 1)  # Calculate intervals between consecutive transactions
-    ]
-    return sum(intervals) / len(intervals)  # Return the average interval
+    return _mean_interval(same_amount_transactions)  # Return the average interval
+
+
+MOBILE_COMPANIES = frozenset({
+    "T-Mobile",
+    "AT&T",
+    "Verizon",
+    "Boost Mobile",
+    "Tello Mobile",
+})
 
 
 def get_mobile_transaction(transaction: Transaction) -> bool:
     """Check if the transaction is from a mobile company (T-Mobile, AT&T, Verizon)"""
-    mobile_companies = {
-        "T-Mobile",
-        "AT&T",
-        "Verizon",
-        "Boost Mobile",
-        "Tello Mobile",
-    }  # Define a set of mobile companies
-    return transaction.name in mobile_companies  # Check if the transaction name is in the set
+    return transaction.name in MOBILE_COMPANIES  # Check if the transaction name is in the set
 
 
 def get_transaction_frequency(transaction: Transaction, all_transactions: list[Transaction]) -> float:
     """Calculate the frequency of transactions for the same vendor"""
-    vendor_transactions = [
-        t for t in all_transactions if t.name == transaction.name
-    ]  # Filter transactions by vendor name
+    vendor_transactions = _same_vendor(transaction, all_transactions)  # Transactions with the same vendor name
     if len(vendor_transactions) < 2:
         return 0.0  # Return 0 if there are less than 2 transactions
-    intervals = [
-        (
-            datetime.strptime(vendor_transactions[i + 1].date, "%Y-%m-%d")
-            - datetime.strptime(vendor_transactions[i].date, "%Y-%m-%d")
-        ).days
-        for i in range(len(vendor_transactions) - 1)  # Calculate intervals between consecutive transactions
-    ]
-    if not intervals or sum(intervals) == 0:
-        return 0.0  # Return 0 if there are no intervals or the sum is 0
-    return 1 / (sum(intervals) / len(intervals))  # Return the frequency
+    mean_interval = _mean_interval(vendor_transactions)
+    if mean_interval == 0:
+        return 0.0  # Return 0 if the intervals sum to 0
+    return 1 / mean_interval  # Return the frequency
 
 
 def get_dispersion_transaction_amount(transaction: Transaction, all_transactions: list[Transaction]) -> float:
     """Calculate the dispersion in transaction amounts for the same vendor"""
-    vendor_transactions = [
-        t.amount for t in all_transactions if t.name == transaction.name
-    ]  # Get amounts for the same vendor
+    vendor_transactions = _vendor_amounts(transaction, all_transactions)  # Amounts for the vendor
     if len(vendor_transactions) < 2:
         return 0.0  # Return 0 if there are less than 2 transactions
     return float(np.var(vendor_transactions))  # Return the dispersion
@@ -67,21 +100,17 @@ def get_dispersion_transaction_amount(transaction: Transaction, all_transactions
 
 def get_mad_transaction_amount(transaction: Transaction, all_transactions: list[Transaction]) -> float:
     """Calculate the median absolute deviation (MAD) of transaction amounts for the same vendor"""
-    vendor_transactions = [
-        t.amount for t in all_transactions if t.name == transaction.name
-    ]  # Get amounts for the same vendor
+    vendor_transactions = _vendor_amounts(transaction, all_transactions)  # Amounts for the vendor
     if len(vendor_transactions) < 2:
         return 0.0  # Return 0 if there are less than 2 transactions
     median = np.median(vendor_transactions)  # Calculate the median
-    mad = np.median([abs(amount - median) for amount in vendor_transactions])  # Calculate MAD
+    mad = np.median(np.abs(vendor_transactions - median))  # Calculate MAD
     return float(mad)  # Return the MAD
 
 
 def get_coefficient_of_variation(transaction: Transaction, all_transactions: list[Transaction]) -> float:
     """Calculate the coefficient of variation (CV) of transaction amounts for the same vendor"""
-    vendor_transactions = [
-        t.amount for t in all_transactions if t.name == transaction.name
-    ]  # Get amounts for the same vendor
+    vendor_transactions = _vendor_amounts(transaction, all_transactions)  # Amounts for the vendor
     if len(vendor_transactions) < 2:
         return 0.0  # Return 0 if there are less than 2 transactions
     mean = np.mean(vendor_transactions)  # Calculate the mean
@@ -96,24 +125,13 @@ def get_coefficient_of_variation(transaction: Transaction, all_transactions: lis
 
 def get_transaction_interval_consistency(transaction: Transaction, transactions: list[Transaction]) -> float:
     """Calculate the average interval between transactions for the same vendor."""
-    # Filter transactions for the same vendor
-    vendor_transactions = [t for t in transactions if t.name == transaction.name]
+    # Transactions for the same vendor, sorted by date
+    vendor_transactions = sorted(_same_vendor(transaction, transactions), key=lambda t: t.date)
     if len(vendor_transactions) < 2:
         return 0.0  # No intervals to calculate
 
-    # Sort transactions by date (convert date strings to datetime objects)
-    vendor_transactions.sort(key=lambda t: datetime.strptime(t.date, "%Y-%m-%d"))
-
-    # Calculate intervals in days
-    intervals = [
-        (
-            datetime.strptime(vendor_transactions[i + 1].date, "%Y-%m-%d")
-            - datetime.strptime(vendor_transactions[i].date, "%Y-%m-%d")
-        ).days
-        for i in range(len(vendor_transactions) - 1)
-    ]
     # Return the average interval
-    return sum(intervals) / len(intervals)
+    return _mean_interval(vendor_transactions)
 
 
 def get_average_transaction_amount(transaction: Transaction, all_transactions: list[Transaction]) -> float:
@@ -127,10 +145,8 @@ def get_average_transaction_amount(transaction: Transaction, all_transactions: l
     Returns:
         float: The average transaction amount for the vendor.
     """
-    vendor_transactions = [
-        t.amount for t in all_transactions if t.name == transaction.name
-    ]  # Filter transactions by vendor name
-    if not vendor_transactions:
+    vendor_transactions = _vendor_amounts(transaction, all_transactions)  # Amounts for the vendor
+    if not len(vendor_transactions):
         return 0.0  # Return 0 if there are no transactions for the vendor
     return float(np.mean(vendor_transactions))  # Return the average amount
 
@@ -481,11 +497,10 @@ def is_monthly_apple_storage(transaction: Transaction, all_transactions: list[Tr
     if len(vendor_transactions) < 2:
         return False
 
-    vendor_transactions.sort(key=lambda t: datetime.strptime(t.date, "%Y-%m-%d"))
+    vendor_transactions.sort(key=lambda t: t.date)
     for i in range(len(vendor_transactions) - 1):
-        current_date = datetime.strptime(vendor_transactions[i].date, "%Y-%m-%d")
-        next_date = datetime.strptime(vendor_transactions[i + 1].date, "%Y-%m-%d")
-        if not (28 <= (next_date - current_date).days <= 31):
+        days = get_date_ordinal(vendor_transactions[i + 1].date) - get_date_ordinal(vendor_transactions[i].date)
+        if not (28 <= days <= 31):
             return False
 
     return True
@@ -515,12 +530,9 @@ def get_cobblestone_recurrence_score(transaction: Transaction, all_transactions:
         return 0.0
 
     # Sort by date
-    recurring_transactions.sort(key=lambda t: datetime.strptime(t.date, "%Y-%m-%d"))
+    recurring_transactions.sort(key=lambda t: t.date)
     intervals = [
-        (
-            datetime.strptime(recurring_transactions[i + 1].date, "%Y-%m-%d")
-            - datetime.strptime(recurring_transactions[i].date, "%Y-%m-%d")
-        ).days
+        get_date_ordinal(recurring_transactions[i + 1].date) - get_date_ordinal(recurring_transactions[i].date)
         for i in range(len(recurring_transactions) - 1)
     ]
 
@@ -538,8 +550,8 @@ def is_consistent_transaction_amount(
     """
     Check if the transaction amounts for the same vendor are consistent.
     """
-    # Filter transactions for the same vendor
-    vendor_transactions = [t.amount for t in all_transactions if t.name == transaction.name]
+    # Amounts for the same vendor
+    vendor_transactions = _vendor_amounts(transaction, all_transactions)
     if len(vendor_transactions) < 2:
         return True  # Not enough data to determine inconsistency
 
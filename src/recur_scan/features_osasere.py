@@ -5,6 +5,119 @@ import numpy as np  # type: ignore
 from recur_scan.transactions import Transaction
 from recur_scan.utils import get_day, parse_date
 
+# Keyword lists compiled into one alternation each, so a name is scanned once rather than once per keyword.
+# The keywords are matched anywhere in the lowercased name.
+INSTALLMENT_SERVICE_PATTERN = re.compile(
+    "|".join(
+        re.escape(keyword)
+        for keyword in (
+            "afterpay",
+            "klarna",
+            "affirm",
+            "splitit",
+            "sezzle",
+            "quadpay",
+            "zip",
+        )
+    )
+)
+FINANCIAL_SERVICE_PATTERN = re.compile(
+    "|".join(
+        re.escape(keyword)
+        for keyword in (
+            "albert",
+            "floatme",
+            "earnin",
+            "dave",
+            "brigit",
+            "empower",
+            "moneyLion",
+            "vola",
+            "chime",
+        )
+    )
+)
+HOUSING_KEYWORD_PATTERN = re.compile(
+    "|".join(
+        re.escape(keyword)
+        for keyword in (
+            "rent",
+            "lease",
+            "apartment",
+            "apt",
+            "condo",
+            "townhome",
+            "housing",
+            "mortgage",
+            "property",
+            "realty",
+            "real estate",
+            # "waterford",  # too specific
+            # "grove",  # too specific
+            "residence",
+            "home",
+        )
+    )
+)
+STREAMING_SERVICE_PATTERN = re.compile(
+    "|".join(
+        re.escape(keyword)
+        for keyword in (
+            "netflix",
+            "hulu",
+            "disney+",
+            "disney plus",
+            "hbo max",
+            "paramount+",
+            "peacock",
+            "apple tv",
+            "amazon prime video",
+            "youtube premium",
+            "spotify",
+            "pandora",
+            "tidal",
+            "apple music",
+            "amazon music",
+            "deezer",
+            "youtube music",
+            "amazon kids+",
+        )
+    )
+)
+INSURANCE_KEYWORD_PATTERN = re.compile(
+    "|".join(
+        re.escape(keyword)
+        for keyword in (
+            "insurance",
+            "geico",
+            "progressive",
+            "allstate",
+            "state farm",
+            "farmers",
+            "liberty mutual",
+            "nationwide",
+            "root insurance",
+            "national general",
+            "usaa",
+        )
+    )
+)
+RECURRING_MERCHANT_PATTERN = re.compile(
+    "|".join(
+        re.escape(keyword)
+        for keyword in (
+            "kikoff",
+            "albert",
+            "amazon kids+",
+            "amazon music",
+            "microsoft xbox",
+            "apple",
+            "floatme",
+            "sezzle",
+        )
+    )
+)
+
 
 def has_min_recurrence_period(
     transaction: Transaction,
@@ -12,7 +125,7 @@ def has_min_recurrence_period(
     min_days: int = 60,
 ) -> bool:
     """Check if transactions from the same vendor span at least `min_days`."""
-    vendor_txs = [t for t in all_transactions if t.name.lower() == transaction.name.lower()]
+    vendor_txs = [t for t in all_transactions if t.name_lower == transaction.name_lower]
     if len(vendor_txs) < 2:
         return False
     dates = sorted([parse_date(t.date) for t in vendor_txs])
@@ -25,7 +138,7 @@ def get_day_of_month_consistency(
     tolerance_days: int = 7,
 ) -> float:
     """Calculate the fraction of transactions within `tolerance_days` of the target day."""
-    vendor_txs = [t for t in all_transactions if t.name.lower() == transaction.name.lower()]
+    vendor_txs = [t for t in all_transactions if t.name_lower == transaction.name_lower]
     if len(vendor_txs) < 2:
         return 0.0
     target_day = get_day(transaction.date)
@@ -42,7 +155,7 @@ def get_day_of_month_variability(
     all_transactions: list[Transaction],
 ) -> float:
     """Measure consistency of day-of-month (lower = more consistent)."""
-    vendor_txs = [t for t in all_transactions if t.name.lower() == transaction.name.lower()]
+    vendor_txs = [t for t in all_transactions if t.name_lower == transaction.name_lower]
     if len(vendor_txs) < 2:
         return 31.0  # Max possible variability
 
@@ -67,7 +180,7 @@ def get_recurrence_confidence(
 ) -> float:
     """Calculate a confidence score (0-1) based on weighted historical recurrences."""
     vendor_txs = sorted(
-        [t for t in all_transactions if t.name.lower() == transaction.name.lower()],
+        [t for t in all_transactions if t.name_lower == transaction.name_lower],
         key=lambda x: x.date,
     )
     if len(vendor_txs) < 2:
@@ -83,13 +196,13 @@ def get_recurrence_confidence(
 
 
 def is_weekday_consistent(transaction: Transaction, all_transactions: list[Transaction]) -> bool:
-    vendor_txs = [t for t in all_transactions if t.name.lower() == transaction.name.lower()]
+    vendor_txs = [t for t in all_transactions if t.name_lower == transaction.name_lower]
     weekdays = [parse_date(t.date).weekday() for t in vendor_txs]  # Monday=0, Sunday=6
     return len(set(weekdays)) <= 2  # Allow minor drift (e.g., weekend vs. Monday)
 
 
 def get_median_period(transaction: Transaction, all_transactions: list[Transaction]) -> float:
-    vendor_txs = [t for t in all_transactions if t.name.lower() == transaction.name.lower()]
+    vendor_txs = [t for t in all_transactions if t.name_lower == transaction.name_lower]
     dates = sorted([parse_date(t.date) for t in vendor_txs])
     if len(dates) < 2:
         return 0.0
@@ -103,7 +216,7 @@ def get_median_period(transaction: Transaction, all_transactions: list[Transacti
 def get_fixed_recurring(name: str, transaction: Transaction) -> bool:
     """Check if the transaction is a fixed recurring payment."""
     # Check if the transaction name contains the specified name (case-insensitive)
-    return name.lower() in transaction.name.lower()
+    return name.lower() in transaction.name_lower
 
 
 # def is_att_recurring_pattern(
@@ -159,24 +272,14 @@ def detect_installment_payments(
     Returns:
         True if the transaction appears to be an installment payment, False otherwise
     """
-    # List of common installment payment services
-    installment_services = [
-        "afterpay",
-        "klarna",
-        "affirm",
-        "splitit",
-        "sezzle",
-        "quadpay",
-        "zip",
-    ]
     # Get all transactions from the same vendor
-    vendor_txs = [t for t in all_transactions if t.name.lower() == transaction.name.lower()]
+    vendor_txs = [t for t in all_transactions if t.name_lower == transaction.name_lower]
     # Installment payments typically have at least 2 payments
     if len(vendor_txs) < 2:
         return False
 
     # Check if transaction is from an installment service
-    if not any(service in transaction.name.lower() for service in installment_services):
+    if INSTALLMENT_SERVICE_PATTERN.search(transaction.name_lower) is None:
         return False
 
     # Analyze date patterns - installments often happen every 2-4 weeks
@@ -207,25 +310,12 @@ def detect_financial_service_fees(
     Returns:
         True if the transaction appears to be a financial service fee, False otherwise
     """
-    # Common financial service apps
-    financial_services = [
-        "albert",
-        "floatme",
-        "earnin",
-        "dave",
-        "brigit",
-        "empower",
-        "moneyLion",
-        "vola",
-        "chime",
-    ]
-
     # Check if transaction is from a financial service
-    if not any(service in transaction.name.lower() for service in financial_services):
+    if FINANCIAL_SERVICE_PATTERN.search(transaction.name_lower) is None:
         return False
 
     # Get all transactions from the same vendor
-    vendor_txs = [t for t in all_transactions if t.name.lower() == transaction.name.lower()]
+    vendor_txs = [t for t in all_transactions if t.name_lower == transaction.name_lower]
 
     # If we have 3+ transactions from the same financial service with the same amount,
     # it's likely a recurring service fee
@@ -357,27 +447,8 @@ def detect_housing_payments(
     Returns:
         True if the transaction appears to be housing/rent related, False otherwise
     """
-    # Housing-related keywords
-    housing_keywords = [
-        "rent",
-        "lease",
-        "apartment",
-        "apt",
-        "condo",
-        "townhome",
-        "housing",
-        "mortgage",
-        "property",
-        "realty",
-        "real estate",
-        # "waterford",  # too specific
-        # "grove",  # too specific
-        "residence",
-        "home",
-    ]
-
     # Check if transaction name contains housing keywords
-    if not any(keyword in transaction.name.lower() for keyword in housing_keywords):
+    if HOUSING_KEYWORD_PATTERN.search(transaction.name_lower) is None:
         return False
 
     # Normalize the vendor name
@@ -457,28 +528,7 @@ def detect_streaming_services(transaction: Transaction) -> bool:
     Returns:
         True if it's a streaming service, False otherwise
     """
-    streaming_services = [
-        "netflix",
-        "hulu",
-        "disney+",
-        "disney plus",
-        "hbo max",
-        "paramount+",
-        "peacock",
-        "apple tv",
-        "amazon prime video",
-        "youtube premium",
-        "spotify",
-        "pandora",
-        "tidal",
-        "apple music",
-        "amazon music",
-        "deezer",
-        "youtube music",
-        "amazon kids+",
-    ]
-
-    return any(service in transaction.name.lower() for service in streaming_services)
+    return STREAMING_SERVICE_PATTERN.search(transaction.name_lower) is not None
 
 
 def detect_insurance_payments(transaction: Transaction) -> bool:
@@ -491,21 +541,7 @@ def detect_insurance_payments(transaction: Transaction) -> bool:
     Returns:
         True if it's an insurance payment, False otherwise
     """
-    insurance_keywords = [
-        "insurance",
-        "geico",
-        "progressive",
-        "allstate",
-        "state farm",
-        "farmers",
-        "liberty mutual",
-        "nationwide",
-        "root insurance",
-        "national general",
-        "usaa",
-    ]
-
-    return any(keyword in transaction.name.lower() for keyword in insurance_keywords)
+    return INSURANCE_KEYWORD_PATTERN.search(transaction.name_lower) is not None
 
 
 # def detect_subscription_box(transaction: Transaction) -> bool:
@@ -688,18 +724,7 @@ def is_likely_recurring_by_merchant(transaction: Transaction) -> bool:
     Returns:
         True if this merchant is likely to be a recurring subscription
     """
-    recurring_merchants = [
-        "kikoff",
-        "albert",
-        "amazon kids+",
-        "amazon music",
-        "microsoft xbox",
-        "apple",
-        "floatme",
-        "sezzle",
-    ]
-
-    return any(merchant.lower() in transaction.name.lower() for merchant in recurring_merchants)
+    return RECURRING_MERCHANT_PATTERN.search(transaction.name_lower) is not None
 
 
 def has_consistent_amount(
@@ -718,7 +743,7 @@ def has_consistent_amount(
     Returns:
         True if the amount is consistent with other transactions from this merchant
     """
-    merchant_txs = [t for t in all_transactions if t.name.lower() == transaction.name.lower()]
+    merchant_txs = [t for t in all_transactions if t.name_lower == transaction.name_lower]
     if len(merchant_txs) <= 1:
         return False
 
@@ -781,7 +806,7 @@ def has_regular_interval(
     Returns:
         True if transactions occur at regular intervals
     """
-    merchant_txs = [t for t in all_transactions if t.name.lower() == transaction.name.lower()]
+    merchant_txs = [t for t in all_transactions if t.name_lower == transaction.name_lower]
     if len(merchant_txs) < 3:
         return False
 
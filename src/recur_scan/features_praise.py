@@ -1,87 +1,225 @@
-import itertools
+import math
+import re
 import statistics
-from collections import Counter, defaultdict
-from datetime import datetime, timedelta
-from itertools import pairwise
-from statistics import mean
+from collections import Counter
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import date, timedelta
+from functools import lru_cache
+from itertools import chain, pairwise
 
 import numpy as np
 
 from recur_scan.transactions import Transaction
+from recur_scan.utils import get_date_ordinal, parse_date
+
+# Day gaps accepted by is_recurring: weekly, biweekly, monthly and bimonthly, each with a little slack
+_RECURRING_INTERVAL_DAYS = frozenset(chain(range(6, 9), range(13, 16), range(28, 32), range(58, 63)))
+_RECURRING_INTERVAL_DAYS_ARRAY = np.array(sorted(_RECURRING_INTERVAL_DAYS), dtype=np.int64)
+
+# Merchants known to bill on a subscription basis, matched anywhere in the lowercased name
+RECURRING_MERCHANT_PATTERN = re.compile(
+    "|".join(
+        re.escape(keyword)
+        for keyword in (
+            "at&t",
+            "google play",
+            "verizon",
+            "vz wireless",
+            "t-mobile",
+            "apple",
+            "disney+",
+            "amazon prime",
+        )
+    )
+)
+
+
+@dataclass(frozen=True)
+class GroupContext:
+    """Group-level values shared by every transaction in the same list of transactions."""
+
+    n: int
+    # struct-of-arrays view of the group, aligned with the input order
+    amounts: np.ndarray
+    ordinals: np.ndarray
+    names: np.ndarray
+    user_ids: np.ndarray
+    sum_amount: float
+    min_amount: float
+    max_amount: float
+    # (name, amount) buckets are keyed by amount in whole cents
+    name_amount_counts: Counter[tuple[str, int]]
+    ordinals_by_name_amount: dict[tuple[str, int], np.ndarray]
+    avg_days_by_name_amount: dict[tuple[str, int], float]
+    most_frequent_names: tuple[str, ...]
+    recurring_names: frozenset[str]
+
+
+def _has_recurring_gap(ordinals: np.ndarray, cents: np.ndarray) -> bool:
+    """Check whether consecutive transactions repeat on a recurring interval with a matching or typical amount.
+
+    ordinals and cents describe the transactions in date order.
+    """
+    if len(ordinals) < 2:
+        return False
+    ends_in_99 = np.abs(cents) % 100 == 99
+    # compare each transaction with the one before it
+    gap_ok = np.isin(np.diff(ordinals), _RECURRING_INTERVAL_DAYS_ARRAY)
+    amount_ok = (cents[1:] == cents[:-1]) | (cents[1:] == 100) | ends_in_99[1:]
+    return bool(np.any(gap_ok & amount_ok))
+
+
+def _group_indices(*keys: np.ndarray) -> list[np.ndarray]:
+    """Split row indices into groups of equal keys with one sort, in order of each group's first row.
+
+    Indices within a group stay in ascending order.
+    """
+    n = len(keys[0])
+    if n == 0:
+        return []
+    # lexsort treats its last key as primary; the row index as the final tie-breaker keeps the sort stable
+    order = np.lexsort((np.arange(n), *reversed(keys)))
+    changed = np.zeros(n - 1, dtype=bool)
+    for key in keys:
+        sorted_key = key[order]
+        changed |= sorted_key[1:] != sorted_key[:-1]
+    groups = np.split(order, np.flatnonzero(changed) + 1)
+    groups.sort(key=lambda indices: indices[0])
+    return groups
+
+
+@lru_cache(maxsize=128)
+def _build_context(transactions: tuple[Transaction, ...]) -> GroupContext:
+    """Build the group context once per distinct list of transactions."""
+    # group by sorting integer codes for the keys rather than appending to per-key Python lists
+    n = len(transactions)
+    amounts = np.fromiter((t.amount for t in transactions), dtype=np.float64, count=n)
+    cents = np.fromiter((t.amount_cents for t in transactions), dtype=np.int64, count=n)
+    ordinals = np.fromiter((get_date_ordinal(t.date) for t in transactions), dtype=np.int64, count=n)
+    names = np.array([t.name for t in transactions], dtype=object)
+    user_ids = np.array([t.user_id for t in transactions], dtype=object)
+    name_codes = np.unique(names, return_inverse=True)[1]
+    user_codes = np.unique(user_ids, return_inverse=True)[1]
+    # position of each transaction after a stable sort by date
+    date_rank = np.empty(n, dtype=np.int64)
+    date_rank[sorted(range(n), key=lambda i: transactions[i].date)] = np.arange(n)
+
+    # sorted date ordinals per (name, amount) bucket; the mean gap telescopes to (last - first) / (n - 1)
+    name_amount_counts: Counter[tuple[str, int]] = Counter()
+    ordinals_by_name_amount = {}
+    avg_days_by_name_amount = {}
+    for indices in _group_indices(name_codes, cents):
+        key = (names[indices[0]], int(cents[indices[0]]))
+        bucket_ordinals = np.sort(ordinals[indices])
+        name_amount_counts[key] = len(indices)
+        ordinals_by_name_amount[key] = bucket_ordinals
+        if len(bucket_ordinals) >= 2:
+            avg_days_by_name_amount[key] = int(bucket_ordinals[-1] - bucket_ordinals[0]) / (len(bucket_ordinals) - 1)
+
+    most_frequent_names = []
+    recurring_names = set()
+    for indices in _group_indices(user_codes, name_codes):
+        name = names[indices[0]]
+        if np.unique(cents[indices], return_counts=True)[1].max() > 1:
+            most_frequent_names.append(name)
+        by_date = indices[np.argsort(date_rank[indices])]
+        if _has_recurring_gap(ordinals[by_date], cents[by_date]):
+            recurring_names.add(name)
+
+    return GroupContext(
+        n=n,
+        amounts=amounts,
+        ordinals=ordinals,
+        names=names,
+        user_ids=user_ids,
+        sum_amount=float(amounts.sum()),
+        min_amount=float(amounts.min()) if len(amounts) else 0.0,
+        max_amount=float(amounts.max()) if len(amounts) else 0.0,
+        name_amount_counts=name_amount_counts,
+        ordinals_by_name_amount=ordinals_by_name_amount,
+        avg_days_by_name_amount=avg_days_by_name_amount,
+        most_frequent_names=tuple(most_frequent_names),
+        recurring_names=frozenset(recurring_names),
+    )
+
+
+def precompute(all_transactions: list[Transaction]) -> GroupContext:
+    """Compute the group context for all_transactions; repeated calls with the same transactions are cached."""
+    return _build_context(tuple(all_transactions))
+
+
+def _mean_stdev(values: Sequence[float]) -> tuple[float, float]:
+    """Sample mean and standard deviation in two plain passes (no Fraction arithmetic as in statistics).
+
+    Constant data gives back its value and exactly zero spread, as statistics.mean/stdev do.
+    """
+    first = values[0]
+    if all(v == first for v in values):
+        return float(first), 0.0
+    n = len(values)
+    mean = sum(values) / n
+    return mean, math.sqrt(sum((v - mean) * (v - mean) for v in values) / (n - 1))
+
+
+def _same_merchant_amount_ordinals(transaction: Transaction, all_transactions: list[Transaction]) -> np.ndarray:
+    """Sorted date ordinals of the transactions sharing this transaction's name and amount."""
+    ordinals = precompute(all_transactions).ordinals_by_name_amount.get((transaction.name, transaction.amount_cents))
+    return ordinals if ordinals is not None else np.empty(0, dtype=np.int64)
+
+
+def _merchant_amounts(transaction: Transaction, all_transactions: list[Transaction]) -> np.ndarray:
+    """Amounts of the transactions sharing this transaction's name, in group order."""
+    ctx = precompute(all_transactions)
+    amounts: np.ndarray = ctx.amounts[ctx.names == transaction.name]
+    return amounts
+
+
+def _same_merchant_amount_intervals(transaction: Transaction, all_transactions: list[Transaction]) -> list[int]:
+    """Day gaps between consecutive transactions sharing this transaction's name and amount."""
+    intervals: list[int] = np.diff(_same_merchant_amount_ordinals(transaction, all_transactions)).tolist()
+    return intervals
 
 
 def get_average_transaction_amount(all_transactions: list[Transaction]) -> float:
-    return sum(t.amount for t in all_transactions) / len(all_transactions)
+    ctx = precompute(all_transactions)
+    return ctx.sum_amount / ctx.n
 
 
 def get_max_transaction_amount(all_transactions: list[Transaction]) -> float:
-    return max(t.amount for t in all_transactions)
+    if not all_transactions:
+        raise ValueError("all_transactions is empty")
+    return precompute(all_transactions).max_amount
 
 
 def get_min_transaction_amount(all_transactions: list[Transaction]) -> float:
-    return min(t.amount for t in all_transactions)
+    if not all_transactions:
+        raise ValueError("all_transactions is empty")
+    return precompute(all_transactions).min_amount
 
 
 def get_most_frequent_names(all_transactions: list[Transaction]) -> list[str]:
-    grouped_transactions = defaultdict(list)
-    for transaction in all_transactions:
-        grouped_transactions[(transaction.user_id, transaction.name)].append(transaction)
-    return [
-        name
-        for (_user_id, name), transactions in grouped_transactions.items()
-        if any(count > 1 for count in Counter(t.amount for t in transactions).values())
-    ]
+    return list(precompute(all_transactions).most_frequent_names)
 
 
 def is_recurring(transaction: Transaction, all_transactions: list[Transaction]) -> bool:
-    grouped_transactions = defaultdict(list)
-    for t in all_transactions:
-        grouped_transactions[(t.user_id, t.name)].append(t)
-    for (_user_id, name), transactions in grouped_transactions.items():
-        if transaction.name == name:
-            transactions.sort(key=lambda x: datetime.strptime(x.date, "%Y-%m-%d"))
-            for i in range(1, len(transactions)):
-                date_diff = datetime.strptime(transactions[i].date, "%Y-%m-%d") - datetime.strptime(
-                    transactions[i - 1].date, "%Y-%m-%d"
-                )
-                if (
-                    transactions[i].amount == transactions[i - 1].amount
-                    or transactions[i].amount == 1
-                    or str(transactions[i].amount).endswith(".99")
-                ) and (
-                    (timedelta(days=6) <= date_diff <= timedelta(days=8))
-                    or (timedelta(days=13) <= date_diff <= timedelta(days=15))
-                    or (timedelta(days=28) <= date_diff <= timedelta(days=31))
-                    or (timedelta(days=58) <= date_diff <= timedelta(days=62))
-                ):
-                    return True
-    return False
+    return transaction.name in precompute(all_transactions).recurring_names
 
 
 def amount_ends_in_99(transaction: Transaction) -> bool:
-    return round(transaction.amount % 1, 2) == 0.99
+    return transaction.amount_cents % 100 == 99
 
 
 def amount_ends_in_00(transaction: Transaction) -> bool:
-    return round(transaction.amount % 1, 2) == 0.00
+    return transaction.amount_cents % 100 == 0
 
 
 def is_recurring_merchant(transaction: Transaction) -> bool:
-    recurring_keywords = {
-        "at&t",
-        "google play",
-        "verizon",
-        "vz wireless",
-        "t-mobile",
-        "apple",
-        "disney+",
-        "amazon prime",
-    }
-    return any(keyword in transaction.name.lower() for keyword in recurring_keywords)
+    return RECURRING_MERCHANT_PATTERN.search(transaction.name_lower) is not None
 
 
 def get_n_transactions_same_merchant_amount(transaction: Transaction, all_transactions: list[Transaction]) -> int:
-    return sum(1 for t in all_transactions if t.name == transaction.name and t.amount == transaction.amount)
+    return precompute(all_transactions).name_amount_counts[(transaction.name, transaction.amount_cents)]
 
 
 def get_percent_transactions_same_merchant_amount(
@@ -92,109 +230,61 @@ def get_percent_transactions_same_merchant_amount(
 
 def get_interval_variance_coefficient(transaction: Transaction, all_transactions: list[Transaction]) -> float:
     """Calculate the coefficient of variation for transaction intervals to measure consistency."""
-    same_transactions = sorted(
-        [t for t in all_transactions if t.name == transaction.name and t.amount == transaction.amount],
-        key=lambda x: datetime.strptime(x.date, "%Y-%m-%d"),
-    )
-    if len(same_transactions) < 3:  # Need at least 3 to establish a pattern
+    ordinals = _same_merchant_amount_ordinals(transaction, all_transactions)
+    if len(ordinals) < 3:  # Need at least 3 to establish a pattern
         return 1.0  # High variance (low consistency)
-    intervals = [
-        (datetime.strptime(t2.date, "%Y-%m-%d") - datetime.strptime(t1.date, "%Y-%m-%d")).days
-        for t1, t2 in pairwise(same_transactions)
-    ]
+    intervals = _same_merchant_amount_intervals(transaction, all_transactions)
     if len(intervals) <= 1:
         return 1.0
-    try:
-        mean_interval = statistics.mean(intervals)
-        if mean_interval == 0:
-            return 1.0
-        # Lower value means more consistent intervals
-        return statistics.stdev(intervals) / mean_interval if mean_interval > 0 else 1.0
-    except statistics.StatisticsError:
+    mean_interval, stdev_interval = _mean_stdev(intervals)
+    if mean_interval == 0:
         return 1.0
+    # Lower value means more consistent intervals
+    return stdev_interval / mean_interval if mean_interval > 0 else 1.0
 
 
 def get_avg_days_between_same_merchant_amount(transaction: Transaction, all_transactions: list[Transaction]) -> float:
-    same_transactions = sorted(
-        (t for t in all_transactions if t.name == transaction.name and t.amount == transaction.amount),
-        key=lambda x: x.date,
-    )
-    if len(same_transactions) < 2:
-        return 0.0
-    intervals = [
-        (datetime.strptime(t2.date, "%Y-%m-%d").date() - datetime.strptime(t1.date, "%Y-%m-%d").date()).days
-        for t1, t2 in pairwise(same_transactions)
-    ]
-    return sum(intervals) / len(intervals) if intervals else 0.0
+    return precompute(all_transactions).avg_days_by_name_amount.get((transaction.name, transaction.amount_cents), 0.0)
 
 
 def get_stddev_days_between_same_merchant_amount(
     transaction: Transaction, all_transactions: list[Transaction]
 ) -> float:
-    same_transactions = sorted(
-        (t for t in all_transactions if t.name == transaction.name and t.amount == transaction.amount),
-        key=lambda x: x.date,
-    )
-    if len(same_transactions) < 2:
-        return 0.0
-    intervals = [
-        (datetime.strptime(t2.date, "%Y-%m-%d").date() - datetime.strptime(t1.date, "%Y-%m-%d").date()).days
-        for t1, t2 in pairwise(same_transactions)
-    ]
-    if len(intervals) <= 1:
-        return 0.0
-    try:
-        return statistics.stdev(intervals)
-    except statistics.StatisticsError:
+    ordinals = _same_merchant_amount_ordinals(transaction, all_transactions)
+    if len(ordinals) < 3:
         return 0.0
+    return _mean_stdev(_same_merchant_amount_intervals(transaction, all_transactions))[1]
 
 
 def get_days_since_last_same_merchant_amount(transaction: Transaction, all_transactions: list[Transaction]) -> int:
-    same_transactions = [
-        t
-        for t in all_transactions
-        if t.name == transaction.name and t.amount == transaction.amount and t.date < transaction.date
-    ]
-    if not same_transactions:
+    ordinals = _same_merchant_amount_ordinals(transaction, all_transactions)
+    current_date = get_date_ordinal(transaction.date)
+    n_prior = int(np.searchsorted(ordinals, current_date))
+    if n_prior == 0:
         return 0
-    last_date = max(datetime.strptime(t.date, "%Y-%m-%d").date() for t in same_transactions)
-    return (datetime.strptime(transaction.date, "%Y-%m-%d").date() - last_date).days
+    return current_date - int(ordinals[n_prior - 1])
 
 
 def is_expected_transaction_date(transaction: Transaction, all_transactions: list[Transaction]) -> bool:
     """Check if transaction occurs on an expected date based on previous patterns"""
-    same_transactions = sorted(
-        [
-            t
-            for t in all_transactions
-            if t.name == transaction.name and t.amount == transaction.amount and t.date < transaction.date
-        ],
-        key=lambda x: x.date,
-    )
+    ordinals = _same_merchant_amount_ordinals(transaction, all_transactions)
+    current_date = get_date_ordinal(transaction.date)
+    prior = ordinals[: np.searchsorted(ordinals, current_date)]
 
-    if len(same_transactions) < 2:
+    if len(prior) < 2:
         return False
 
     # Calculate average interval
-    intervals = [
-        (datetime.strptime(t2.date, "%Y-%m-%d").date() - datetime.strptime(t1.date, "%Y-%m-%d").date()).days
-        for t1, t2 in itertools.pairwise(same_transactions)
-    ]
-
-    if not intervals:
-        return False
-
-    avg_interval = sum(intervals) / len(intervals)
+    avg_interval = int(prior[-1] - prior[0]) / (len(prior) - 1)
 
     # Get the last transaction date before the current one
-    last_date = datetime.strptime(same_transactions[-1].date, "%Y-%m-%d").date()
-    current_date = datetime.strptime(transaction.date, "%Y-%m-%d").date()
+    last_date = int(prior[-1])
 
     # Calculate expected date
-    expected_date = last_date + timedelta(days=round(avg_interval))
+    expected_date = last_date + round(avg_interval)
 
     # Allow for a window of +/- 3 days
-    return abs((current_date - expected_date).days) <= 3
+    return abs(current_date - expected_date) <= 3
 
 
 def has_incrementing_numbers(transaction: Transaction, all_transactions: list[Transaction]) -> bool:
@@ -208,8 +298,6 @@ def has_incrementing_numbers(transaction: Transaction, all_transactions: list[Tr
         return False
 
     # Extract numbers from transaction names in order of date
-    import re
-
     number_patterns = []
     for t in same_merchant_transactions:
         numbers = re.findall(r"\d+", t.name)
@@ -225,19 +313,17 @@ def has_incrementing_numbers(transaction: Transaction, all_transactions: list[Tr
 
 def has_consistent_reference_codes(transaction: Transaction, all_transactions: list[Transaction]) -> bool:
     """Check if transaction descriptions contain consistent reference codes"""
-    same_merchant_transactions = [t for t in all_transactions if t.name.lower() == transaction.name.lower()]
+    same_merchant_transactions = [t for t in all_transactions if t.name_lower == transaction.name_lower]
 
     if len(same_merchant_transactions) < 2:
         return False
 
     # Extract potential reference codes (alphanumeric sequences)
-    import re
-
     ref_codes = []
     for t in same_merchant_transactions:
         # Look for patterns like REF:12345 or ID-ABC123
         pattern: str = r"(?:ref|id|no)[-:]\s*([a-zA-Z0-9]+)"
-        matches = re.findall(pattern, t.name.lower())
+        matches = re.findall(pattern, t.name_lower)
         if matches:
             ref_codes.extend(matches)
 
@@ -260,7 +346,7 @@ def calculate_markovian_probability(transaction: Transaction, all_transactions:
         return 0.0  # Not enough data to calculate probability
 
     # Extract the last n transactions
-    same_merchant_transactions.sort(key=lambda x: datetime.strptime(x.date, "%Y-%m-%d"))
+    same_merchant_transactions.sort(key=lambda x: x.date)
     recent_transactions = same_merchant_transactions[-(n + 1) :]
 
     # Check if the pattern of the last n transactions matches the current transaction
@@ -274,15 +360,14 @@ def calculate_streaks(transaction: Transaction, all_transactions: list[Transacti
     """Calculate the number of consecutive transactions within expected intervals."""
     same_merchant_transactions = sorted(
         [t for t in all_transactions if t.name == transaction.name],
-        key=lambda x: datetime.strptime(x.date, "%Y-%m-%d"),
+        key=lambda x: x.date,
     )
     if len(same_merchant_transactions) < 2:
         return 0  # Not enough data to calculate streaks
 
     # Calculate intervals between transactions
     intervals = [
-        (datetime.strptime(t2.date, "%Y-%m-%d") - datetime.strptime(t1.date, "%Y-%m-%d")).days
-        for t1, t2 in pairwise(same_merchant_transactions)
+        get_date_ordinal(t2.date) - get_date_ordinal(t1.date) for t1, t2 in pairwise(same_merchant_transactions)
     ]
 
     # Count consecutive intervals within expected ranges (e.g., weekly, monthly)
@@ -313,18 +398,13 @@ def get_ewma_interval_deviation(
     if len(same_transactions) < 3:
         return 1.0
 
-    intervals = [
-        (datetime.strptime(t2.date, "%Y-%m-%d") - datetime.strptime(t1.date, "%Y-%m-%d")).days
-        for t1, t2 in pairwise(same_transactions)
-    ]
+    intervals = [get_date_ordinal(t2.date) - get_date_ordinal(t1.date) for t1, t2 in pairwise(same_transactions)]
 
     ewma = float(intervals[0])
     for interval in intervals[1:]:
         ewma = alpha * interval + (1 - alpha) * ewma
 
-    last_interval = (
-        datetime.strptime(transaction.date, "%Y-%m-%d") - datetime.strptime(same_transactions[-1].date, "%Y-%m-%d")
-    ).days
+    last_interval = get_date_ordinal(transaction.date) - get_date_ordinal(same_transactions[-1].date)
 
     return abs(last_interval - ewma) / ewma if ewma else 1.0
 
@@ -343,8 +423,7 @@ def get_hurst_exponent(transaction: Transaction, all_transactions: list[Transact
         return 0.5  # Default to random-walk-like
 
     intervals: list[float] = [
-        (datetime.strptime(t2.date, "%Y-%m-%d") - datetime.strptime(t1.date, "%Y-%m-%d")).days
-        for t1, t2 in pairwise(same_transactions)
+        get_date_ordinal(t2.date) - get_date_ordinal(t1.date) for t1, t2 in pairwise(same_transactions)
     ]
 
     n = len(intervals)
@@ -353,10 +432,7 @@ def get_hurst_exponent(transaction: Transaction, all_transactions: list[Transact
     r = max(cumulative_deviation) - min(cumulative_deviation)
     if len(intervals) <= 1:
         return 0.0
-    try:
-        s = statistics.stdev(intervals)
-    except Exception:
-        return 0.0
+    s = _mean_stdev(intervals)[1]
 
     if s == 0:
         return 0.5
@@ -380,10 +456,7 @@ def get_fourier_periodicity_score(transaction: Transaction, all_transactions: li
         return 0.0
 
     intervals = np.array(
-        [
-            (datetime.strptime(t2.date, "%Y-%m-%d") - datetime.strptime(t1.date, "%Y-%m-%d")).days
-            for t1, t2 in pairwise(same_transactions)
-        ],
+        [get_date_ordinal(t2.date) - get_date_ordinal(t1.date) for t1, t2 in pairwise(same_transactions)],
         dtype=float,
     )
 
@@ -402,10 +475,7 @@ def is_recurring_through_past_transactions(transaction: Transaction, all_transac
         return False
 
     # Check if the transaction occurs at regular intervals (weekly, monthly, etc.)
-    intervals = [
-        (datetime.strptime(t2.date, "%Y-%m-%d") - datetime.strptime(t1.date, "%Y-%m-%d")).days
-        for t1, t2 in pairwise(same_transactions)
-    ]
+    intervals = [get_date_ordinal(t2.date) - get_date_ordinal(t1.date) for t1, t2 in pairwise(same_transactions)]
 
     # Check for regular intervals (e.g., weekly or monthly)
     return any(6 <= interval <= 8 or 28 <= interval <= 31 for interval in intervals)
@@ -416,12 +486,8 @@ def get_amount_zscore(transaction: Transaction, all_transactions: list[Transacti
     user_amounts = [t.amount for t in all_transactions if t.user_id == transaction.user_id]
     if len(user_amounts) < 2:
         return 0.0
-    try:
-        mean = statistics.mean(user_amounts)
-        stdev = statistics.stdev(user_amounts)
-        return (transaction.amount - mean) / stdev if stdev > 0 else 0.0
-    except Exception:
-        return 0.0
+    mean, stdev = _mean_stdev(user_amounts)
+    return (transaction.amount - mean) / stdev if stdev > 0 else 0.0
 
 
 def is_amount_outlier(transaction: Transaction, all_transactions: list[Transaction]) -> bool:
@@ -434,49 +500,43 @@ def get_stddev_amount_same_merchant(transaction: Transaction, all_transactions:
     same = [t.amount for t in all_transactions if t.user_id == transaction.user_id and t.name == transaction.name]
     if len(same) <= 1:
         return 0.0
-    try:
-        return statistics.stdev(same)
-    except Exception:
-        return 0.0
+    return _mean_stdev(same)[1]
 
 
 def get_avg_days_between_same_merchant(transaction: Transaction, all_transactions: list[Transaction]) -> float:
     """Average gap in days between transactions at this merchant (ignoring amount)."""
     same = sorted(
         [
-            datetime.strptime(t.date, "%Y-%m-%d").date()
+            get_date_ordinal(t.date)
             for t in all_transactions
             if t.user_id == transaction.user_id and t.name == transaction.name
         ],
     )
     if len(same) < 2:
         return 0.0
-    intervals = [(t2 - t1).days for t1, t2 in pairwise(same)]
+    intervals = [t2 - t1 for t1, t2 in pairwise(same)]
     return sum(intervals) / len(intervals)
 
 
 def is_weekend_transaction(transaction: Transaction) -> bool:
     """Did this fall on a Saturday or Sunday?"""
-    dow = datetime.strptime(transaction.date, "%Y-%m-%d").weekday()
+    dow = parse_date(transaction.date).weekday()
     return dow >= 5
 
 
 def is_end_of_month_transaction(transaction: Transaction) -> bool:
     """Is the date the last day of its month?"""
-    d = datetime.strptime(transaction.date, "%Y-%m-%d").date()
+    d = parse_date(transaction.date)
     return (d + timedelta(days=1)).month != d.month
 
 
 def get_days_since_first_transaction(transaction: Transaction, all_transactions: list[Transaction]) -> int:
     """Number of days between the user's very first transaction and this one."""
-    user_dates = [
-        datetime.strptime(t.date, "%Y-%m-%d").date() for t in all_transactions if t.user_id == transaction.user_id
-    ]
-    if not user_dates:
+    ctx = precompute(all_transactions)
+    user_dates = ctx.ordinals[ctx.user_ids == transaction.user_id]
+    if not len(user_dates):
         return 0
-    first = min(user_dates)
-    current = datetime.strptime(transaction.date, "%Y-%m-%d").date()
-    return (current - first).days
+    return get_date_ordinal(transaction.date) - int(user_dates.min())
 
 
 def get_amount_coefficient_of_variation(transaction: Transaction, all_transactions: list[Transaction]) -> float:
@@ -484,23 +544,21 @@ def get_amount_coefficient_of_variation(transaction: Transaction, all_transactio
     user_amounts = [t.amount for t in all_transactions if t.user_id == transaction.user_id]
     if len(user_amounts) < 2:
         return 0.0
-    try:
-        mean = statistics.mean(user_amounts)
-        stdev = statistics.stdev(user_amounts)
-        return (stdev / mean) if mean > 0 else 0.0
-    except Exception:
-        return 0.0
+    mean, stdev = _mean_stdev(user_amounts)
+    return (stdev / mean) if mean > 0 else 0.0
 
 
 def get_unique_merchants_count(transaction: Transaction, all_transactions: list[Transaction]) -> int:
     """How many distinct merchants has this user transacted with?"""
-    return len({t.name for t in all_transactions if t.user_id == transaction.user_id})
+    ctx = precompute(all_transactions)
+    return len(set(ctx.names[ctx.user_ids == transaction.user_id]))
 
 
 def get_amount_quantile(transaction: Transaction, all_transactions: list[Transaction]) -> float:
     """Position of this amount in the user's distribution (0-1)."""
-    user_amounts = sorted(t.amount for t in all_transactions if t.user_id == transaction.user_id)
-    rank = sum(1 for a in user_amounts if a <= transaction.amount)
+    ctx = precompute(all_transactions)
+    user_amounts = ctx.amounts[ctx.user_ids == transaction.user_id]
+    rank = int(np.count_nonzero(user_amounts <= transaction.amount))
     return rank / len(user_amounts)
 
 
@@ -513,7 +571,7 @@ def is_consistent_weekday_pattern(transaction: Transaction, all_transactions: li
     ]
     if len(same) < 3:
         return False
-    weekdays = {datetime.strptime(t.date, "%Y-%m-%d").weekday() for t in same}
+    weekdays = {parse_date(t.date).weekday() for t in same}
     return len(weekdays) == 1
 
 
@@ -535,18 +593,14 @@ def get_recurrence_score_by_amount(
         return 0.0  # Not enough data to infer recurrence
 
     # Sort transactions by date
-    dates = sorted(datetime.strptime(t.date, "%Y-%m-%d").date() for t in similar_transactions)
-    gaps = [(dates[i] - dates[i - 1]).days for i in range(1, len(dates))]
+    dates = sorted(get_date_ordinal(t.date) for t in similar_transactions)
+    gaps = [dates[i] - dates[i - 1] for i in range(1, len(dates))]
 
     if len(gaps) <= 1:
         return 0.0
 
     # Basic statistics
-    try:
-        mean_gap = statistics.mean(gaps)
-        std_dev = statistics.stdev(gaps) if len(gaps) > 1 else 0.0
-    except Exception:
-        return 0.0
+    mean_gap, std_dev = _mean_stdev(gaps)
 
     # Compare mean gap to common frequencies
     common_frequencies = [7, 14, 28, 30, 31]
@@ -577,11 +631,7 @@ def compare_recent_to_historical_average(transaction: Transaction, all_transacti
 
     # Calculate historical mean and standard deviation
     amounts = [t.amount for t in past_transactions]
-    mean = statistics.mean(amounts)
-    try:
-        stdev = statistics.stdev(amounts)
-    except Exception:
-        stdev = 0.0
+    mean, stdev = _mean_stdev(amounts)
 
     # If standard deviation is very low (i.e., consistent values), check for closeness
     if stdev == 0:
@@ -600,15 +650,15 @@ def get_days_since_last_transaction(transaction: Transaction, all_transactions:
     A larger value means more “stale” activity before this one.
     """
     user_past = [
-        datetime.strptime(t.date, "%Y-%m-%d").date()
+        get_date_ordinal(t.date)
         for t in all_transactions
         if t.user_id == transaction.user_id and t.date < transaction.date
     ]
     if not user_past:
         return 0  # no prior history
     last = max(user_past)
-    current = datetime.strptime(transaction.date, "%Y-%m-%d").date()
-    return (current - last).days
+    current = get_date_ordinal(transaction.date)
+    return current - last
 
 
 def get_normalized_recency(transaction: Transaction, all_transactions: list[Transaction]) -> float:
@@ -618,15 +668,13 @@ def get_normalized_recency(transaction: Transaction, all_transactions: list[Tran
     Values ≫1 indicate unusually long gaps, ≪1 unusually tight.
     """
     # collect and sort all dates for this user
-    dates = sorted(
-        datetime.strptime(t.date, "%Y-%m-%d").date() for t in all_transactions if t.user_id == transaction.user_id
-    )
+    dates = sorted(get_date_ordinal(t.date) for t in all_transactions if t.user_id == transaction.user_id)
     if len(dates) < 2:
         return 0.0
 
     # compute all inter transaction gaps
-    gaps = [(b - a).days for a, b in pairwise(dates)]
-    avg_gap = mean(gaps) if gaps else 0
+    gaps = [b - a for a, b in pairwise(dates)]
+    avg_gap = sum(gaps) / len(gaps)
 
     days_since = get_days_since_last_transaction(transaction, all_transactions)
     return days_since / avg_gap if avg_gap > 0 else 0.0
@@ -643,9 +691,8 @@ def get_transaction_recency_score(transaction: Transaction, all_transactions: li
         return 0.0
 
     # Convert dates and sort
-    user_transactions = sorted(user_transactions, key=lambda t: datetime.strptime(t.date, "%Y-%m-%d"))
-    dates = [datetime.strptime(t.date, "%Y-%m-%d") for t in user_transactions]
-    target_date = datetime.strptime(transaction.date, "%Y-%m-%d")
+    dates = sorted(get_date_ordinal(t.date) for t in user_transactions)
+    target_date = get_date_ordinal(transaction.date)
 
     earliest = dates[0]
     latest = dates[-1]
@@ -653,7 +700,7 @@ def get_transaction_recency_score(transaction: Transaction, all_transactions: li
     if latest == earliest:
         return 1.0  # Only one transaction exists
 
-    return (target_date - earliest).days / (latest - earliest).days
+    return (target_date - earliest) / (latest - earliest)
 
 
 def get_n_transactions_last_30_days(
@@ -661,15 +708,11 @@ def get_n_transactions_last_30_days(
 ) -> int:
     """Count how many transactions this user made in the `window_days` before this transaction (excluding it)."""
     user_id = transaction.user_id
-    window_start = datetime.strptime(transaction.date, "%Y-%m-%d").date() - timedelta(days=window_days)
+    current = get_date_ordinal(transaction.date)
+    window_start = current - window_days
 
     return sum(
-        1
-        for t in all_transactions
-        if t.user_id == user_id
-        and window_start
-        <= datetime.strptime(t.date, "%Y-%m-%d").date()
-        < datetime.strptime(transaction.date, "%Y-%m-%d").date()
+        1 for t in all_transactions if t.user_id == user_id and window_start <= get_date_ordinal(t.date) < current
     )
 
 
@@ -695,12 +738,10 @@ def afterpay_has_3_similar_in_6_weeks(transaction: Transaction, all_transactions
     same_amount_txns = [
         t
         for t in all_transactions
-        if t.user_id == transaction.user_id
-        and "afterpay" in t.name.lower()
-        and abs(t.amount - transaction.amount) < 0.01
+        if t.user_id == transaction.user_id and "afterpay" in t.name_lower and abs(t.amount - transaction.amount) < 0.01
     ]
-    dates = sorted(datetime.strptime(t.date, "%Y-%m-%d").date() for t in same_amount_txns)
-    return any((dates[i + 2] - dates[i]).days <= 42 for i in range(len(dates) - 2))
+    dates = sorted(get_date_ordinal(t.date) for t in same_amount_txns)
+    return any(dates[i + 2] - dates[i] <= 42 for i in range(len(dates) - 2))
 
 
 def afterpay_is_first_of_series(transaction: Transaction, all_transactions: list[Transaction]) -> bool:
@@ -710,16 +751,14 @@ def afterpay_is_first_of_series(transaction: Transaction, all_transactions: list
     same_amount_txns = [
         t
         for t in all_transactions
-        if t.user_id == transaction.user_id
-        and "afterpay" in t.name.lower()
-        and abs(t.amount - transaction.amount) < 0.01
+        if t.user_id == transaction.user_id and "afterpay" in t.name_lower and abs(t.amount - transaction.amount) < 0.01
     ]
     if len(same_amount_txns) < 3:
         return False
-    dates = sorted(datetime.strptime(t.date, "%Y-%m-%d").date() for t in same_amount_txns)
-    if datetime.strptime(transaction.date, "%Y-%m-%d").date() != dates[0]:
+    dates = sorted(get_date_ordinal(t.date) for t in same_amount_txns)
+    if get_date_ordinal(transaction.date) != dates[0]:
         return False
-    gaps = [(dates[i + 1] - dates[i]).days for i in range(len(dates) - 1)]
+    gaps = [dates[i + 1] - dates[i] for i in range(len(dates) - 1)]
     return any(12 <= g <= 16 for g in gaps)
 
 
@@ -730,14 +769,11 @@ def afterpay_likely_payment(transaction: Transaction, all_transactions: list[Tra
     same_amount_txns = [
         t
         for t in all_transactions
-        if t.user_id == transaction.user_id
-        and "afterpay" in t.name.lower()
-        and abs(t.amount - transaction.amount) < 0.01
-    ]
-    dates = sorted(datetime.strptime(t.date, "%Y-%m-%d").date() for t in same_amount_txns)
-    recent_matches = [
-        d for d in dates if abs((datetime.strptime(transaction.date, "%Y-%m-%d").date() - d).days) in [14, 28]
+        if t.user_id == transaction.user_id and "afterpay" in t.name_lower and abs(t.amount - transaction.amount) < 0.01
     ]
+    current = get_date_ordinal(transaction.date)
+    dates = sorted(get_date_ordinal(t.date) for t in same_amount_txns)
+    recent_matches = [d for d in dates if abs(current - d) in [14, 28]]
     return len(recent_matches) >= 2
 
 
@@ -750,7 +786,7 @@ def afterpay_prev_same_amount_count(transaction: Transaction, all_transactions:
         for t in all_transactions
         if (
             t.user_id == transaction.user_id
-            and "afterpay" in t.name.lower()
+            and "afterpay" in t.name_lower
             and abs(t.amount - transaction.amount) < 0.01
             and t.date < transaction.date
         )
@@ -763,7 +799,7 @@ def afterpay_future_same_amount_exists(transaction: Transaction, all_transaction
     """
     return any(
         t.user_id == transaction.user_id
-        and "afterpay" in t.name.lower()
+        and "afterpay" in t.name_lower
         and abs(t.amount - transaction.amount) < 0.01
         and t.date > transaction.date
         for t in all_transactions
@@ -774,7 +810,7 @@ def afterpay_recurrence_score(transaction: Transaction, all_transactions: list[T
     """
     Computes a recurrence score (0 to 1) for Afterpay transactions based on timing, amount patterns, and frequency.
     """
-    if "afterpay" not in transaction.name.lower():
+    if "afterpay" not in transaction.name_lower:
         return 0.0
 
     score = 0.0
@@ -804,9 +840,7 @@ def is_moneylion_common_amount(transaction: Transaction, all_transactions: list[
     """
     Returns True if the transaction amount is among the user's top 3 most frequent MoneyLion amounts.
     """
-    relevant = [
-        t.amount for t in all_transactions if t.user_id == transaction.user_id and "moneylion" in t.name.lower()
-    ]
+    relevant = [t.amount for t in all_transactions if t.user_id == transaction.user_id and "moneylion" in t.name_lower]
     if len(relevant) < 3:
         return False
     freq = Counter(relevant).most_common(3)
@@ -822,7 +856,7 @@ def moneylion_days_since_last_same_amount(transaction: Transaction, all_transact
         for t in all_transactions
         if (
             t.user_id == transaction.user_id
-            and "moneylion" in t.name.lower()
+            and "moneylion" in t.name_lower
             and t.amount == transaction.amount
             and t.date < transaction.date
         )
@@ -831,9 +865,7 @@ def moneylion_days_since_last_same_amount(transaction: Transaction, all_transact
         return -1
     last = max(t.date for t in prior)
     try:
-        d1 = datetime.strptime(transaction.date, "%Y-%m-%d")
-        d2 = datetime.strptime(last, "%Y-%m-%d")
-        return (d1 - d2).days
+        return get_date_ordinal(transaction.date) - get_date_ordinal(last)
     except Exception:
         return -1
 
@@ -845,14 +877,14 @@ def moneylion_is_biweekly(transaction: Transaction, all_transactions: list[Trans
     relevant = [
         t
         for t in all_transactions
-        if t.user_id == transaction.user_id and "moneylion" in t.name.lower() and t.date < transaction.date
+        if t.user_id == transaction.user_id and "moneylion" in t.name_lower and t.date < transaction.date
     ]
     if len(relevant) < 2:
         return False
     relevant_sorted = sorted(relevant, key=lambda x: x.date)
     try:
-        dates = [datetime.strptime(t.date, "%Y-%m-%d") for t in relevant_sorted]
-        diffs = [(dates[i] - dates[i - 1]).days for i in range(1, len(dates))]
+        dates = [get_date_ordinal(t.date) for t in relevant_sorted]
+        diffs = [dates[i] - dates[i - 1] for i in range(1, len(dates))]
         count = sum(12 <= d <= 16 for d in diffs)
         return count >= 2
     except Exception:
@@ -866,12 +898,12 @@ def moneylion_weekday_pattern(transaction: Transaction, all_transactions: list[T
     relevant = [
         t
         for t in all_transactions
-        if t.user_id == transaction.user_id and "moneylion" in t.name.lower() and t.date < transaction.date
+        if t.user_id == transaction.user_id and "moneylion" in t.name_lower and t.date < transaction.date
     ]
     if len(relevant) < 3:
         return False
     try:
-        weekdays = [datetime.strptime(t.date, "%Y-%m-%d").weekday() for t in relevant]
+        weekdays = [parse_date(t.date).weekday() for t in relevant]
         common_day, count = Counter(weekdays).most_common(1)[0]
         return count >= 3
     except Exception:
@@ -882,7 +914,7 @@ def apple_amount_close_to_median(transaction: Transaction, all_transactions: lis
     """
     Returns True if the transaction amount is within $1 of the user's median Apple transaction amount.
     """
-    relevant = [t.amount for t in all_transactions if t.user_id == transaction.user_id and "apple" in t.name.lower()]
+    relevant = [t.amount for t in all_transactions if t.user_id == transaction.user_id and "apple" in t.name_lower]
     if len(relevant) < 3:
         return False
     try:
@@ -897,16 +929,16 @@ def apple_total_same_amount_past_6m(transaction: Transaction, all_transactions:
     Returns the number of times the user paid the same amount to Apple in the past 180 days.
     """
     try:
-        txn_date = datetime.strptime(transaction.date, "%Y-%m-%d")
+        txn_date = get_date_ordinal(transaction.date)
         prior = [
             t
             for t in all_transactions
             if (
                 t.user_id == transaction.user_id
-                and "apple" in t.name.lower()
+                and "apple" in t.name_lower
                 and t.amount == transaction.amount
                 and t.date < transaction.date
-                and (txn_date - datetime.strptime(t.date, "%Y-%m-%d")).days <= 180
+                and txn_date - get_date_ordinal(t.date) <= 180
             )
         ]
         return len(prior)
@@ -921,14 +953,11 @@ def apple_std_dev_amounts(transaction: Transaction, all_transactions: list[Trans
     relevant = [
         t.amount
         for t in all_transactions
-        if t.user_id == transaction.user_id and "apple" in t.name.lower() and t.date < transaction.date
+        if t.user_id == transaction.user_id and "apple" in t.name_lower and t.date < transaction.date
     ]
     if len(relevant) < 3:
         return -1.0
-    try:
-        return round(statistics.stdev(relevant), 2)
-    except Exception:
-        return -1.0
+    return round(_mean_stdev(relevant)[1], 2)
 
 
 def apple_is_low_value_txn(transaction: Transaction) -> bool:
@@ -946,14 +975,12 @@ def apple_days_since_first_seen_amount(transaction: Transaction, all_transaction
         relevant = [
             t.date
             for t in all_transactions
-            if t.user_id == transaction.user_id and "apple" in t.name.lower() and t.amount == transaction.amount
+            if t.user_id == transaction.user_id and "apple" in t.name_lower and t.amount == transaction.amount
         ]
         if not relevant:
             return -1
         first_seen = min(relevant)
-        d1 = datetime.strptime(transaction.date, "%Y-%m-%d")
-        d2 = datetime.strptime(first_seen, "%Y-%m-%d")
-        return (d1 - d2).days
+        return get_date_ordinal(transaction.date) - get_date_ordinal(first_seen)
     except Exception:
         return -1
 
@@ -962,7 +989,7 @@ def get_rolling_mean_amount(transaction: Transaction, all_transactions: list[Tra
     """Calculate rolling mean of last n amounts for this user+merchant combination."""
     same_user_merchant = sorted(
         [t for t in all_transactions if t.user_id == transaction.user_id and t.name == transaction.name],
-        key=lambda t: datetime.strptime(t.date, "%Y-%m-%d"),
+        key=lambda t: t.date,
     )
     last_n = [t.amount for t in same_user_merchant if t.date <= transaction.date][-window:]
     return float(np.mean(last_n)) if last_n else 0.0
@@ -970,33 +997,19 @@ def get_rolling_mean_amount(transaction: Transaction, all_transactions: list[Tra
 
 def get_interval_variance_ratio(transaction: Transaction, all_transactions: list[Transaction]) -> float:
     """Calculate the ratio of standard deviation to mean of transaction intervals."""
-    merchant_transactions = [t for t in all_transactions if t.name == transaction.name]
-    same_amt = [t for t in merchant_transactions if t.amount == transaction.amount]
-    same_amt_sorted = sorted(same_amt, key=lambda t: t.date)
-
-    intervals = []
-    for t1, t2 in pairwise(same_amt_sorted):
-        d1 = datetime.strptime(t1.date, "%Y-%m-%d").date()
-        d2 = datetime.strptime(t2.date, "%Y-%m-%d").date()
-        intervals.append((d2 - d1).days)
+    intervals = _same_merchant_amount_intervals(transaction, all_transactions)
 
     if not intervals:
         return 0.0
 
-    try:
-        avg_interval = statistics.mean(intervals)
-        std_interval = statistics.stdev(intervals) if len(intervals) > 1 else 0.0
-        return std_interval / avg_interval if avg_interval else 0.0
-    except Exception:
-        return 0.0
+    avg_interval, std_interval = _mean_stdev(intervals)
+    return std_interval / avg_interval if avg_interval else 0.0
 
 
 def get_day_of_month_consistency(transaction: Transaction, all_transactions: list[Transaction]) -> bool:
     """Check if same-amount transactions consistently occur around the same day of month."""
-    merchant_transactions = [t for t in all_transactions if t.name == transaction.name]
-    same_amt = [t for t in merchant_transactions if t.amount == transaction.amount]
-    same_amt_sorted = sorted(same_amt, key=lambda t: t.date)
-    doms = [datetime.strptime(t.date, "%Y-%m-%d").day for t in same_amt_sorted]
+    ordinals = _same_merchant_amount_ordinals(transaction, all_transactions)
+    doms = [date.fromordinal(o).day for o in ordinals.tolist()]
     if not doms:
         return False
 
@@ -1009,15 +1022,7 @@ def get_day_of_month_consistency(transaction: Transaction, all_transactions: lis
 
 def get_seasonality_score(transaction: Transaction, all_transactions: list[Transaction]) -> float:
     """Calculate seasonality score based on weekly/monthly interval patterns."""
-    merchant_transactions = [t for t in all_transactions if t.name == transaction.name]
-    same_amt = [t for t in merchant_transactions if t.amount == transaction.amount]
-    same_amt_sorted = sorted(same_amt, key=lambda t: t.date)
-
-    intervals = []
-    for t1, t2 in pairwise(same_amt_sorted):
-        d1 = datetime.strptime(t1.date, "%Y-%m-%d").date()
-        d2 = datetime.strptime(t2.date, "%Y-%m-%d").date()
-        intervals.append((d2 - d1).days)
+    intervals = _same_merchant_amount_intervals(transaction, all_transactions)
 
     if not intervals:
         return 0.0
@@ -1032,7 +1037,7 @@ def get_amount_drift_slope(transaction: Transaction, all_transactions: list[Tran
     same_amt_sorted = sorted(merchant_transactions, key=lambda t: t.date)
     if len(same_amt_sorted) <= 1:
         return 0.0
-    dates_ord = [datetime.strptime(t.date, "%Y-%m-%d").toordinal() for t in same_amt_sorted]
+    dates_ord = [get_date_ordinal(t.date) for t in same_amt_sorted]
     amounts = [t.amount for t in same_amt_sorted]
     if len(dates_ord) <= 1 or len(set(amounts)) == 1:
         return 0.0
@@ -1044,41 +1049,25 @@ def get_amount_drift_slope(transaction: Transaction, all_transactions: list[Tran
 
 def get_burstiness_ratio(transaction: Transaction, all_transactions: list[Transaction]) -> float:
     """Calculate ratio of recent transactions (last 3 months) to previous 3 months."""
-    trans_date = datetime.strptime(transaction.date, "%Y-%m-%d").date()
-    three_m_ago = trans_date - timedelta(days=90)
+    trans_date = get_date_ordinal(transaction.date)
+    three_m_ago = trans_date - 90
 
-    merchant_transactions = [t for t in all_transactions if t.name == transaction.name]
-    same_amt = [t for t in merchant_transactions if t.amount == transaction.amount]
-    same_amt_sorted = sorted(same_amt, key=lambda t: t.date)
+    ordinals = _same_merchant_amount_ordinals(transaction, all_transactions)
 
-    last_3m = sum(
-        1 for t in same_amt_sorted if three_m_ago <= datetime.strptime(t.date, "%Y-%m-%d").date() <= trans_date
-    )
-    prior_3m = sum(
-        1
-        for t in same_amt_sorted
-        if (three_m_ago - timedelta(days=90)) <= datetime.strptime(t.date, "%Y-%m-%d").date() < three_m_ago
-    )
+    last_3m = int(np.count_nonzero((three_m_ago <= ordinals) & (ordinals <= trans_date)))
+    prior_3m = int(np.count_nonzero((three_m_ago - 90 <= ordinals) & (ordinals < three_m_ago)))
 
     return (last_3m / prior_3m) if prior_3m else float(last_3m)
 
 
 def get_serial_autocorrelation(transaction: Transaction, all_transactions: list[Transaction]) -> float:
     """Calculate first-order autocorrelation of transaction intervals."""
-    merchant_transactions = [t for t in all_transactions if t.name == transaction.name]
-    same_amt = [t for t in merchant_transactions if t.amount == transaction.amount]
-    same_amt_sorted = sorted(same_amt, key=lambda t: t.date)
-
-    intervals = []
-    for t1, t2 in pairwise(same_amt_sorted):
-        d1 = datetime.strptime(t1.date, "%Y-%m-%d").date()
-        d2 = datetime.strptime(t2.date, "%Y-%m-%d").date()
-        intervals.append((d2 - d1).days)
+    intervals = _same_merchant_amount_intervals(transaction, all_transactions)
 
     if len(intervals) <= 1:
         return 0.0
 
-    mean_iv = statistics.mean(intervals)
+    mean_iv = sum(intervals) / len(intervals)
     num = sum((intervals[i] - mean_iv) * (intervals[i - 1] - mean_iv) for i in range(1, len(intervals)))
     den = sum((iv - mean_iv) ** 2 for iv in intervals)
     return num / den if den else 0.0
@@ -1086,11 +1075,8 @@ def get_serial_autocorrelation(transaction: Transaction, all_transactions: list[
 
 def get_weekday_concentration(transaction: Transaction, all_transactions: list[Transaction]) -> float:
     """Calculate concentration of transactions on most common weekday."""
-    merchant_transactions = [t for t in all_transactions if t.name == transaction.name]
-    same_amt = [t for t in merchant_transactions if t.amount == transaction.amount]
-    same_amt_sorted = sorted(same_amt, key=lambda t: t.date)
-
-    weekdays = [datetime.strptime(t.date, "%Y-%m-%d").weekday() for t in same_amt_sorted]
+    ordinals = _same_merchant_amount_ordinals(transaction, all_transactions)
+    weekdays = [date.fromordinal(o).weekday() for o in ordinals.tolist()]
     if not weekdays:
         return 0.0
 
@@ -1100,15 +1086,7 @@ def get_weekday_concentration(transaction: Transaction, all_transactions: list[T
 
 def get_interval_consistency_ratio(transaction: Transaction, all_transactions: list[Transaction]) -> float:
     """Calculate ratio of intervals within 10% of median interval."""
-    merchant_transactions = [t for t in all_transactions if t.name == transaction.name]
-    same_amt = [t for t in merchant_transactions if t.amount == transaction.amount]
-    same_amt_sorted = sorted(same_amt, key=lambda t: t.date)
-
-    intervals = []
-    for t1, t2 in pairwise(same_amt_sorted):
-        d1 = datetime.strptime(t1.date, "%Y-%m-%d").date()
-        d2 = datetime.strptime(t2.date, "%Y-%m-%d").date()
-        intervals.append((d2 - d1).days)
+    intervals = _same_merchant_amount_intervals(transaction, all_transactions)
 
     if not intervals:
         return 0.0
@@ -1120,26 +1098,22 @@ def get_interval_consistency_ratio(transaction: Transaction, all_transactions: l
 
 def get_median_amount(transaction: Transaction, all_transactions: list[Transaction]) -> float:
     """Return median amount for this merchant's transactions."""
-    merchant_transactions = [t for t in all_transactions if t.name == transaction.name]
-    amounts = [t.amount for t in merchant_transactions]
-    return float(statistics.median(amounts)) if amounts else 0.0
+    amounts = _merchant_amounts(transaction, all_transactions)
+    return float(np.median(amounts)) if len(amounts) else 0.0
 
 
 def get_amount_mad(transaction: Transaction, all_transactions: list[Transaction]) -> float:
     """Return Median Absolute Deviation (MAD) of amounts for this merchant."""
-    merchant_transactions = [t for t in all_transactions if t.name == transaction.name]
-    amounts = [t.amount for t in merchant_transactions]
-    if not amounts:
+    amounts = _merchant_amounts(transaction, all_transactions)
+    if not len(amounts):
         return 0.0
-    med_amt = statistics.median(amounts)
-    return float(statistics.median([abs(a - med_amt) for a in amounts]))
+    return float(np.median(np.abs(amounts - np.median(amounts))))
 
 
 def get_amount_iqr(transaction: Transaction, all_transactions: list[Transaction]) -> float:
     """Return Interquartile Range (IQR) of amounts for this merchant."""
-    merchant_transactions = [t for t in all_transactions if t.name == transaction.name]
-    amounts = [t.amount for t in merchant_transactions]
-    if not amounts:
+    amounts = _merchant_amounts(transaction, all_transactions)
+    if not len(amounts):
         return 0.0
     amt_q1, amt_q3 = np.percentile(amounts, [25, 75])
     return float(amt_q3 - amt_q1)
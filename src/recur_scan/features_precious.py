@@ -1,67 +1,196 @@
 import collections
-import datetime
-import itertools
 import math
+import re
 import statistics
+from dataclasses import dataclass
+from enum import IntEnum
+from functools import lru_cache
 from typing import Any
 
 import numpy as np
 
 from recur_scan.transactions import Transaction
+from recur_scan.utils import parse_date
 
 # Allowed feature value type
 FeatureValue = float | int | bool
 
+# Keyword lists compiled into one alternation each, so a name is scanned once rather than once per keyword.
+# The keywords are matched anywhere in the lowercased name.
+RECURRING_MERCHANT_PATTERN = re.compile(
+    "|".join(
+        re.escape(keyword)
+        for keyword in (
+            "at&t",
+            "google play",
+            "verizon",
+            "vz wireless",
+            "vzw",
+            "t-mobile",
+            "apple",
+            "disney+",
+            "disney mobile",
+            "hbo max",
+            "amazon prime",
+            "netflix",
+            "spotify",
+            "hulu",
+            "la fitness",
+            "cleo ai",
+            "atlas",
+            "google storage",
+            "google drive",
+            "youtube premium",
+            "afterpay",
+            "amazon+",
+            "walmart+",
+            "amazonprime",
+            "duke energy",
+            "adobe",
+            # "healthy.line",  # too specific
+            "canva pty limite",
+            "brigit",
+            "cleo",
+            "microsoft",
+            "earnin",
+        )
+    )
+)
+UTILITY_KEYWORD_PATTERN = re.compile(
+    "|".join(re.escape(keyword) for keyword in ("utility", "utilities", "electric", "water", "gas", "power", "energy"))
+)
+PHONE_KEYWORD_PATTERN = re.compile("|".join(re.escape(keyword) for keyword in ("at&t", "t-mobile", "verizon")))
+SUBSCRIPTION_AMOUNTS = frozenset({0.99, 1.99, 2.99, 4.99, 9.99, 10.99, 11.99, 12.99, 14.99, 19.99})
+
 
 def amount_ends_in_00(transaction: Transaction) -> bool:
-    """Check if the transaction amount ends in .00 using string formatting after rounding."""
-    amount_str = f"{round(transaction.amount, 2):.2f}"
-    return amount_str.endswith("00")
+    """Check if the transaction amount ends in .00, comparing whole cents."""
+    return transaction.amount_cents % 100 == 0
 
 
 def is_recurring_merchant(transaction: Transaction) -> bool:
     """Check if the transaction's merchant is a known recurring company"""
-    recurring_keywords = {
-        "at&t",
-        "google play",
-        "verizon",
-        "vz wireless",
-        "vzw",
-        "t-mobile",
-        "apple",
-        "disney+",
-        "disney mobile",
-        "hbo max",
-        "amazon prime",
-        "netflix",
-        "spotify",
-        "hulu",
-        "la fitness",
-        "cleo ai",
-        "atlas",
-        "google storage",
-        "google drive",
-        "youtube premium",
-        "afterpay",
-        "amazon+",
-        "walmart+",
-        "amazonprime",
-        "duke energy",
-        "adobe",
-        # "healthy.line",  # too specific
-        "canva pty limite",
-        "brigit",
-        "cleo",
-        "microsoft",
-        "earnin",
+    return RECURRING_MERCHANT_PATTERN.search(transaction.name_lower) is not None
+
+
+def _day_intervals(transactions: list[Transaction]) -> list[int]:
+    """Days between consecutive transactions, as differences of date ordinals"""
+    ordinals = np.fromiter((t.date_ordinal for t in transactions), dtype=np.int64, count=len(transactions))
+    intervals: list[int] = np.diff(ordinals).tolist()
+    return intervals
+
+
+@lru_cache(maxsize=128)
+def _merchant_groups(all_transactions: tuple[Transaction, ...]) -> dict[str, list[Transaction]]:
+    """Group transactions by name in one pass, each group sorted by date"""
+    groups: collections.defaultdict[str, list[Transaction]] = collections.defaultdict(list)
+    for t in all_transactions:
+        groups[t.name].append(t)
+    for group in groups.values():
+        group.sort(key=lambda x: x.date)
+    return dict(groups)
+
+
+def _same_merchant(transaction: Transaction, all_transactions: list[Transaction]) -> list[Transaction]:
+    """Date-sorted transactions with the same merchant as transaction"""
+    return _merchant_groups(tuple(all_transactions)).get(transaction.name, [])
+
+
+@lru_cache(maxsize=128)
+def _merchant_amount_groups(all_transactions: tuple[Transaction, ...]) -> dict[tuple[str, float], list[Transaction]]:
+    """Group transactions by (name, amount) in one pass, each group sorted by date"""
+    groups: collections.defaultdict[tuple[str, float], list[Transaction]] = collections.defaultdict(list)
+    for t in all_transactions:
+        groups[(t.name, t.amount)].append(t)
+    for group in groups.values():
+        group.sort(key=lambda x: x.date)
+    return dict(groups)
+
+
+class RecurFreq(IntEnum):
+    """How often a merchant-amount group recurs; NONE covers slower groups and those with too few transactions"""
+
+    NONE = 0
+    DAILY = 1
+    WEEKLY = 2
+    MONTHLY = 3
+
+
+@dataclass(frozen=True)
+class _GroupDateStats:
+    """Everything the same-merchant-amount features read from one (name, amount) group"""
+
+    n: int
+    mean_gap: float
+    std_gap: float
+    frequency: RecurFreq
+    ordinals: np.ndarray  # sorted date ordinals, read-only
+    transactions: list[Transaction]  # the group itself, sorted by date
+
+
+_EMPTY_GROUP_STATS = _GroupDateStats(
+    n=0, mean_gap=0.0, std_gap=0.0, frequency=RecurFreq.NONE, ordinals=np.empty(0, dtype=np.int64), transactions=[]
+)
+
+
+@lru_cache(maxsize=128)
+def _merchant_amount_date_stats(all_transactions: tuple[Transaction, ...]) -> dict[tuple[str, float], _GroupDateStats]:
+    """Date statistics of every (name, amount) group, all reduced together in one columnar pass"""
+    groups = _merchant_amount_groups(all_transactions)
+    n_groups = len(groups)
+    sizes = np.fromiter((len(group) for group in groups.values()), dtype=np.int64, count=n_groups)
+    ordinals = np.fromiter(
+        (t.date_ordinal for group in groups.values() for t in group), dtype=np.int64, count=int(sizes.sum())
+    )
+    ordinals.flags.writeable = False
+    group_ids = np.repeat(np.arange(n_groups), sizes)
+    # gaps are taken over the concatenated groups, dropping those that straddle two groups
+    within_group = group_ids[1:] == group_ids[:-1]
+    gaps = np.diff(ordinals)[within_group].astype(np.float64)
+    gap_group_ids = group_ids[1:][within_group]
+    n_gaps = np.bincount(gap_group_ids, minlength=n_groups)
+    means = np.bincount(gap_group_ids, weights=gaps, minlength=n_groups) / np.maximum(n_gaps, 1)
+    deviations = gaps - means[gap_group_ids]
+    squared = np.bincount(gap_group_ids, weights=deviations * deviations, minlength=n_groups)
+    stds = np.sqrt(squared / np.maximum(n_gaps - 1, 1))
+    stds[n_gaps <= 1] = 0.0
+    frequencies = np.select(
+        [means <= 1, means <= 7, means <= 30],
+        [RecurFreq.DAILY, RecurFreq.WEEKLY, RecurFreq.MONTHLY],
+        default=RecurFreq.NONE,
+    )
+    frequencies[n_gaps == 0] = RecurFreq.NONE
+    group_ordinals = np.split(ordinals, np.cumsum(sizes)[:-1]) if n_groups else []
+    return {
+        key: _GroupDateStats(
+            n=n,
+            mean_gap=mean,
+            std_gap=std,
+            frequency=RecurFreq(frequency),
+            ordinals=group_ords,
+            transactions=group,
+        )
+        for (key, group), n, mean, std, frequency, group_ords in zip(
+            groups.items(),
+            sizes.tolist(),
+            means.tolist(),
+            stds.tolist(),
+            frequencies.tolist(),
+            group_ordinals,
+            strict=True,
+        )
     }
-    merchant_name = transaction.name.lower()
-    return any(keyword in merchant_name for keyword in recurring_keywords)
+
+
+def _group_date_stats(transaction: Transaction, all_transactions: list[Transaction]) -> _GroupDateStats:
+    """Date statistics of the group sharing transaction's merchant and amount"""
+    stats = _merchant_amount_date_stats(tuple(all_transactions))
+    return stats.get((transaction.name, transaction.amount), _EMPTY_GROUP_STATS)
 
 
 def get_n_transactions_same_merchant_amount(transaction: Transaction, all_transactions: list[Transaction]) -> int:
     """Get the number of transactions with the same merchant and amount"""
-    return sum(1 for t in all_transactions if t.name == transaction.name and t.amount == transaction.amount)
+    return _group_date_stats(transaction, all_transactions).n
 
 
 def get_percent_transactions_same_merchant_amount(
@@ -75,140 +204,67 @@ def get_percent_transactions_same_merchant_amount(
 
 def get_avg_days_between_same_merchant_amount(transaction: Transaction, all_transactions: list[Transaction]) -> float:
     """Calculate the average days between transactions with the same merchant and amount"""
-    same_transactions = sorted(
-        [t for t in all_transactions if t.name == transaction.name and t.amount == transaction.amount],
-        key=lambda x: x.date,
-    )
-    if len(same_transactions) < 2:
-        return 0.0
-    intervals = [
-        (
-            datetime.datetime.strptime(t2.date, "%Y-%m-%d").date()
-            - datetime.datetime.strptime(t1.date, "%Y-%m-%d").date()
-        ).days
-        for t1, t2 in itertools.pairwise(same_transactions)
-    ]
-    return sum(intervals) / len(intervals) if intervals else 0.0
+    return _group_date_stats(transaction, all_transactions).mean_gap
 
 
 def get_stddev_days_between_same_merchant_amount(
     transaction: Transaction, all_transactions: list[Transaction]
 ) -> float:
     """Calculate the standard deviation of days between transactions with the same merchant and amount"""
-    same_transactions = sorted(
-        [t for t in all_transactions if t.name == transaction.name and t.amount == transaction.amount],
-        key=lambda x: x.date,
-    )
-    if len(same_transactions) < 2:
-        return 0.0
-    intervals = [
-        (
-            datetime.datetime.strptime(t2.date, "%Y-%m-%d").date()
-            - datetime.datetime.strptime(t1.date, "%Y-%m-%d").date()
-        ).days
-        for t1, t2 in itertools.pairwise(same_transactions)
-    ]
-    if len(intervals) <= 1:
-        return 0.0
-    try:
-        return statistics.stdev(intervals)
-    except statistics.StatisticsError:
-        return 0.0
+    return _group_date_stats(transaction, all_transactions).std_gap
 
 
 def get_days_since_last_same_merchant_amount(transaction: Transaction, all_transactions: list[Transaction]) -> int:
     """Get the number of days since the last transaction with the same merchant and amount"""
-    same_transactions = [
-        t
-        for t in all_transactions
-        if t.name == transaction.name and t.amount == transaction.amount and t.date < transaction.date
-    ]
-    if not same_transactions:
+    ordinals = _group_date_stats(transaction, all_transactions).ordinals
+    # the ordinals are sorted, so the last earlier date sits just before the insertion point
+    n_earlier = int(np.searchsorted(ordinals, transaction.date_ordinal, side="left"))
+    if n_earlier == 0:
         return 0
-    last_date = max(datetime.datetime.strptime(t.date, "%Y-%m-%d").date() for t in same_transactions)
-    transaction_date = datetime.datetime.strptime(transaction.date, "%Y-%m-%d").date()
-    return (transaction_date - last_date).days
+    return transaction.date_ordinal - int(ordinals[n_earlier - 1])
 
 
-def get_recurring_frequency(transaction: Transaction, all_transactions: list[Transaction]) -> int:
+def get_recurring_frequency(transaction: Transaction, all_transactions: list[Transaction]) -> RecurFreq:
     """Determine if the transaction is recurring daily, weekly, or monthly"""
-    same_transactions = sorted(
-        [t for t in all_transactions if t.name == transaction.name and t.amount == transaction.amount],
-        key=lambda x: x.date,
-    )
-    if len(same_transactions) < 2:
-        return 0
-    intervals = [
-        (
-            datetime.datetime.strptime(t2.date, "%Y-%m-%d").date()
-            - datetime.datetime.strptime(t1.date, "%Y-%m-%d").date()
-        ).days
-        for t1, t2 in itertools.pairwise(same_transactions)
-    ]
-    if not intervals:
-        return 0
-    avg_interval = sum(intervals) / len(intervals)
-    if avg_interval <= 1:
-        return 1
-    elif avg_interval <= 7:
-        return 2
-    elif avg_interval <= 30:
-        return 3
-    else:
-        return 0
+    return _group_date_stats(transaction, all_transactions).frequency
 
 
 def get_is_utility(transaction: Transaction) -> bool:
     """Determine if the transaction is related to utilities"""
-    utility_keywords = {"utility", "utilities", "electric", "water", "gas", "power", "energy"}
-    merchant_name = transaction.name.lower()
-    return any(keyword in merchant_name for keyword in utility_keywords)
+    return UTILITY_KEYWORD_PATTERN.search(transaction.name_lower) is not None
 
 
 def get_is_phone(transaction: Transaction) -> bool:
     """Determine if the transaction is related to phone services"""
-    merchant_name = transaction.name.lower()
-    return ("at&t" in merchant_name) or ("t-mobile" in merchant_name) or ("verizon" in merchant_name)
+    return PHONE_KEYWORD_PATTERN.search(transaction.name_lower) is not None
 
 
 def is_subscription_amount(transaction: Transaction) -> bool:
     """Check if the transaction amount is one of the common subscription amounts"""
-    subscription_amounts = {0.99, 1.99, 2.99, 4.99, 9.99, 10.99, 11.99, 12.99, 14.99, 19.99}
-    return round(transaction.amount, 2) in subscription_amounts
+    return round(transaction.amount, 2) in SUBSCRIPTION_AMOUNTS
 
 
 def get_additional_features(
     transaction: Transaction, all_transactions: list[Transaction]
 ) -> dict[str, float | int | bool]:
     """Extract additional temporal and merchant consistency features that are not already included."""
-    trans_date = datetime.datetime.strptime(transaction.date, "%Y-%m-%d").date()
+    trans_date = parse_date(transaction.date)
+    trans_ordinal = trans_date.toordinal()
     day_of_week: int = trans_date.weekday()
     day_of_month: int = trans_date.day
     # is_weekend: bool = day_of_week >= 5
     # is_end_of_month: bool = day_of_month >= 28
-    same_merchant_transactions = sorted(
-        [t for t in all_transactions if t.name == transaction.name], key=lambda x: x.date
-    )
+    same_merchant_transactions = _same_merchant(transaction, all_transactions)
     if same_merchant_transactions:
-        first_date = datetime.datetime.strptime(same_merchant_transactions[0].date, "%Y-%m-%d").date()
-        days_since_first: int = (trans_date - first_date).days
+        days_since_first: int = trans_ordinal - same_merchant_transactions[0].date_ordinal
     else:
         days_since_first = 0
-    intervals = []
-    for t1, t2 in itertools.pairwise(same_merchant_transactions):
-        d1 = datetime.datetime.strptime(t1.date, "%Y-%m-%d").date()
-        d2 = datetime.datetime.strptime(t2.date, "%Y-%m-%d").date()
-        intervals.append((d2 - d1).days)
+    intervals = _day_intervals(same_merchant_transactions)
     min_interval: int = min(intervals) if intervals else 0
     max_interval: int = max(intervals) if intervals else 0
     # merchant_total_count: int = sum(1 for t in all_transactions if t.name == transaction.name)
-    merchant_recent_count: int = sum(
-        1
-        for t in all_transactions
-        if t.name == transaction.name
-        and (trans_date - datetime.datetime.strptime(t.date, "%Y-%m-%d").date()).days <= 30
-    )
-    merchant_amounts = [t.amount for t in all_transactions if t.name == transaction.name]
+    merchant_recent_count: int = sum(1 for t in same_merchant_transactions if trans_ordinal - t.date_ordinal <= 30)
+    merchant_amounts = [t.amount for t in same_merchant_transactions]
     if merchant_amounts:
         # try:
         #     amount_stddev: float = statistics.stdev(merchant_amounts) if len(merchant_amounts) > 1 else 0.0
@@ -247,7 +303,7 @@ def get_amount_variation_features(
     """
     Calculate features related to amount variations for a given transaction.
     """
-    merchant_transactions = [t for t in all_transactions if t.name == transaction.name]
+    merchant_transactions = _same_merchant(transaction, all_transactions)
     merchant_avg = statistics.mean([t.amount for t in merchant_transactions]) if merchant_transactions else 0.0
     relative_diff = abs(transaction.amount - merchant_avg) / merchant_avg if merchant_avg != 0 else 0.0
     # amount_anomaly = relative_diff > threshold
@@ -272,56 +328,38 @@ def get_new_features(
     amt = transaction.amount
 
     # 2. Rolling mean of the last 3 amounts for this user+merchant
-    same_user_merchant = sorted(
-        [t for t in all_transactions if t.user_id == transaction.user_id and t.name == transaction.name],
-        key=lambda t: datetime.datetime.strptime(t.date, "%Y-%m-%d"),
-    )
+    # finding a cached index hashes the whole group, so each index is looked up only once here
+    merchant_transactions = _same_merchant(transaction, all_transactions)
+    same_user_merchant = [t for t in merchant_transactions if t.user_id == transaction.user_id]
     last_three = [t.amount for t in same_user_merchant if t.date <= transaction.date][-3:]
     rolling_mean = float(np.mean(last_three)) if last_three else 0.0
 
     # 3-5. Calendar features
-    dt = datetime.datetime.strptime(transaction.date, "%Y-%m-%d")
+    dt = parse_date(transaction.date)
     # day_of_week = dt.weekday()  # 0=Monday … 6=Sunday
     day_of_month = dt.day  # 1-31
     # month = dt.month  # 1-12
 
     # 6. Days since last same-merchant & same-amount transaction
     previous = [t for t in same_user_merchant if t.amount == amt and t.date < transaction.date]
-    if previous:
-        last_date = max(datetime.datetime.strptime(t.date, "%Y-%m-%d").date() for t in previous)
-        days_since_last = (dt.date() - last_date).days
-    else:
-        days_since_last = 0
+    days_since_last = dt.toordinal() - max(t.date_ordinal for t in previous) if previous else 0
 
     # 7. Original recurring flag
     # recurring_flag = bool(getattr(transaction, "recurring", False))
 
     # -------------------------- Additional Features --------------------------
-    merchant_transactions = [t for t in all_transactions if t.name == transaction.name]
     merchant_avg = statistics.mean([t.amount for t in merchant_transactions]) if merchant_transactions else 0.0
     relative_diff = abs(transaction.amount - merchant_avg) / merchant_avg if merchant_avg != 0 else 0.0
     # amount_anomaly = relative_diff > threshold
 
-    same_amt = sorted(
-        (t for t in merchant_transactions if t.amount == amt),
-        key=lambda t: t.date,
-    )
-    intervals = [
-        (
-            datetime.datetime.strptime(t2.date, "%Y-%m-%d").date()
-            - datetime.datetime.strptime(t1.date, "%Y-%m-%d").date()
-        ).days
-        for t1, t2 in itertools.pairwise(same_amt)
-    ]
+    stats = _group_date_stats(transaction, all_transactions)
+    same_amt = stats.transactions
+    # the group's date-sorted int64 ordinals are shared through the cached stats, so nothing here re-reads t.date
+    intervals: list[int] = np.diff(stats.ordinals).tolist()
 
     if intervals:
-        avg_interval = statistics.mean(intervals)
-        try:
-            std_interval = statistics.stdev(intervals) if len(intervals) > 1 else 0.0
-            interval_variance_ratio = std_interval / avg_interval if avg_interval else 0.0
-        except Exception:
-            std_interval = 0.0
-            interval_variance_ratio = 0.0
+        avg_interval, std_interval = stats.mean_gap, stats.std_gap
+        interval_variance_ratio = std_interval / avg_interval if avg_interval else 0.0
         median_interval = statistics.median(intervals)
         mad_interval = statistics.median([abs(iv - median_interval) for iv in intervals])
     else:
@@ -329,7 +367,7 @@ def get_new_features(
         median_interval = mad_interval = 0.0
 
     # Day-of-Month Consistency
-    doms = [datetime.datetime.strptime(t.date, "%Y-%m-%d").day for t in same_amt]
+    doms = [parse_date(t.date).day for t in same_amt]
     if doms:
         try:
             mode_dom = statistics.mode(doms)
@@ -348,8 +386,8 @@ def get_new_features(
         seasonality_score = 0.0
 
     # Amount Drift (linear slope over time)
-    if len(same_amt) > 1:
-        dates_ord = [datetime.datetime.strptime(t.date, "%Y-%m-%d").toordinal() for t in same_amt]
+    if stats.n > 1:
+        dates_ord = stats.ordinals
         amounts = [t.amount for t in same_amt]
         try:
             slope = np.polyfit(dates_ord, amounts, 1)[0]
@@ -359,7 +397,7 @@ def get_new_features(
         slope = 0.0
 
     # Burstiness Ratio (recent vs prior 3 months)
-    trans_date = dt.date()
+    trans_date = dt
     # three_m_ago = trans_date - datetime.timedelta(days=90)
     # last_3m = sum(
     #     1 for t in same_amt if three_m_ago <= datetime.datetime.strptime(t.date, "%Y-%m-%d").date() <= trans_date
@@ -383,9 +421,8 @@ def get_new_features(
 
     # Serial Autocorrelation
     if len(intervals) > 1:
-        mean_iv = statistics.mean(intervals)
-        num = sum((intervals[i] - mean_iv) * (intervals[i - 1] - mean_iv) for i in range(1, len(intervals)))
-        den = sum((iv - mean_iv) ** 2 for iv in intervals)
+        num = sum((intervals[i] - avg_interval) * (intervals[i - 1] - avg_interval) for i in range(1, len(intervals)))
+        den = sum((iv - avg_interval) ** 2 for iv in intervals)
         acf1 = num / den if den else 0
     else:
         acf1 = 0
@@ -396,7 +433,8 @@ def get_new_features(
     cos_doy = math.cos(2 * math.pi * doy / 365)
 
     # Weekday Concentration
-    weekdays = [datetime.datetime.strptime(t.date, "%Y-%m-%d").weekday() for t in same_amt]
+    # date.weekday() is (ordinal + 6) % 7
+    weekdays: list[int] = ((stats.ordinals + 6) % 7).tolist()
     top_count = max(collections.Counter(weekdays).values(), default=0)
     weekday_concentration = top_count / len(weekdays) if weekdays else 0
 
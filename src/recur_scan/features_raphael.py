@@ -1,5 +1,7 @@
 import difflib
-from datetime import datetime
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from functools import lru_cache
 
 import numpy as np
 
@@ -9,24 +11,22 @@ from recur_scan.utils import parse_date
 
 # ===== ORIGINAL FUNCTIONS (KEPT IN PLACE) =====
 def get_n_transactions_same_day(transaction: Transaction, all_transactions: list[Transaction], n_days_off: int) -> int:
-    transaction_date = datetime.strptime(transaction.date, "%Y-%m-%d")
+    transaction_date = parse_date(transaction.date)
     transaction_day = transaction_date.day
 
-    count = 0
-    for t in all_transactions:
-        if t.name == transaction.name:  # Only consider transactions with same name
-            t_date = datetime.strptime(t.date, "%Y-%m-%d")
-            # Check if day of month is within tolerance, accounting for month boundaries
-            day_diff = abs(t_date.day - transaction_day)
-            if day_diff <= n_days_off:
-                count += 1
-            # Special case for month boundaries (e.g., Jan 31 and Feb 1 with n_days_off=1)
-            elif (transaction_day > 28 and t_date.day < 3) or (transaction_day < 3 and t_date.day > 28):
-                month_diff = abs((t_date.month - transaction_date.month) % 12)
-                if month_diff == 1 and (31 - transaction_day + t_date.day) <= n_days_off:
-                    count += 1
+    group = _name_groups(tuple(all_transactions)).get(transaction.name)  # Only consider transactions with same name
+    if group is None:
+        return 0
+    days = group.days_of_month
+    # Check if day of month is within tolerance, accounting for month boundaries
+    matches = np.abs(days - transaction_day) <= n_days_off
+    # Special case for month boundaries (e.g., Jan 31 and Feb 1 with n_days_off=1)
+    if transaction_day > 28 or transaction_day < 3:
+        across_boundary = (days < 3) if transaction_day > 28 else (days > 28)
+        month_diff = (group.months - transaction_date.month) % 12
+        matches |= across_boundary & (month_diff == 1) & ((31 - transaction_day + days) <= n_days_off)
 
-    return count
+    return int(np.count_nonzero(matches))
 
 
 def get_n_transactions_days_apart(
@@ -39,15 +39,26 @@ def get_n_transactions_days_apart(
     Get the number of transactions in all_transactions that are within n_days_off of
     being n_days_apart from transaction.
     """
-    transaction_date = parse_date(transaction.date)
-    count = 0
+    # |days_difference - n_days_apart| <= n_days_off means the other date lies in a window of
+    # [min_days, max_days] days before the transaction or in the mirrored window after it
+    min_days = max(n_days_apart - n_days_off, 0)
+    max_days = n_days_apart + n_days_off
+    if max_days < min_days:
+        return 0
+    ref_ordinal = transaction.date_ordinal
+    before_start, before_end, after_start, after_end = np.searchsorted(
+        _sorted_date_ordinals(tuple(all_transactions)),
+        [ref_ordinal - max_days, ref_ordinal - min_days + 1, ref_ordinal + min_days, ref_ordinal + max_days + 1],
+    )
+    # count from the start of the earlier window to the end of the later one, minus the dates strictly
+    # between them (when min_days == 0 the windows share the transaction's own date and nothing is removed)
+    return int(after_end - before_start - max(after_start - before_end, 0))
 
-    for t in all_transactions:
-        days_difference = abs((parse_date(t.date) - transaction_date).days)
-        if abs(days_difference - n_days_apart) <= n_days_off:
-            count += 1
 
-    return count
+@lru_cache(maxsize=128)
+def _sorted_date_ordinals(transactions: tuple[Transaction, ...]) -> np.ndarray:
+    """Sorted date ordinals of the transactions, once per distinct list of transactions"""
+    return np.sort(np.fromiter((t.date_ordinal for t in transactions), dtype=np.int64, count=len(transactions)))
 
 
 def get_pct_transactions_days_apart(
@@ -80,47 +91,94 @@ def get_pct_transactions_same_day(
     return float(n_same_day) / float(len(all_transactions))
 
 
+COMMON_SUBSCRIPTION_AMOUNT_CENTS = frozenset({499, 599, 999, 1299, 1499, 1599, 1999, 4999, 9999})
+
+
 def get_is_common_subscription_amount(transaction: Transaction) -> bool:
-    common_amounts = {4.99, 5.99, 9.99, 12.99, 14.99, 15.99, 19.99, 49.99, 99.99}
-    return transaction.amount in common_amounts
+    return transaction.amount_cents in COMMON_SUBSCRIPTION_AMOUNT_CENTS
+
+
+@dataclass(frozen=True)
+class _NameGroup:
+    """What the name-level features read about the transactions sharing one name"""
+
+    transactions: list[Transaction]  # in list order
+    amounts: list[float]  # in list order
+    amount_array: np.ndarray  # the amounts as float64
+    ordinals: np.ndarray  # in list order
+    sorted_ordinals: np.ndarray
+    days_of_month: np.ndarray  # in list order
+    months: np.ndarray  # in list order
+    week_of_month_counts: Counter[int]
+
+
+@lru_cache(maxsize=128)
+def _name_groups(transactions: tuple[Transaction, ...]) -> dict[str, _NameGroup]:
+    """Group the transactions by name in one pass, once per distinct list of transactions"""
+    by_name: defaultdict[str, list[Transaction]] = defaultdict(list)
+    for t in transactions:
+        by_name[t.name].append(t)
+    groups = {}
+    for name, txns in by_name.items():
+        amounts = [t.amount for t in txns]
+        ordinals = np.fromiter((t.date_ordinal for t in txns), dtype=np.int64, count=len(txns))
+        groups[name] = _NameGroup(
+            transactions=txns,
+            amounts=amounts,
+            amount_array=np.array(amounts, dtype=np.float64),
+            ordinals=ordinals,
+            sorted_ordinals=np.sort(ordinals),
+            days_of_month=np.array([parse_date(t.date).day for t in txns], dtype=np.int64),
+            months=np.array([parse_date(t.date).month for t in txns], dtype=np.int64),
+            week_of_month_counts=Counter(parse_date(t.date).day // 7 for t in txns),
+        )
+    return groups
 
 
 def get_occurs_same_week(transaction: Transaction, transactions: list[Transaction]) -> bool:
     """Checks if the transaction occurs in the same week of the month across multiple months."""
-    transaction_date = datetime.strptime(transaction.date, "%Y-%m-%d")
+    transaction_date = parse_date(transaction.date)
     transaction_week = transaction_date.day // 7  # Determine which week in the month (0-4)
 
-    same_week_count = sum(
-        1
-        for t in transactions
-        if t.name == transaction.name and datetime.strptime(t.date, "%Y-%m-%d").day // 7 == transaction_week
-    )
+    group = _name_groups(tuple(transactions)).get(transaction.name)
+    same_week_count = group.week_of_month_counts[transaction_week] if group is not None else 0
 
     return same_week_count >= 2  # True if found at least twice
 
 
+@lru_cache(maxsize=1024)
+def _has_similar_name(name: str, other_names: tuple[str, ...], similarity_threshold: float) -> bool:
+    """Check name against each distinct other name, once per name and set of names"""
+    matcher = difflib.SequenceMatcher(None, name)
+    for other_name in other_names:
+        matcher.set_seq2(other_name)
+        # real_quick_ratio and quick_ratio are cheap upper bounds on ratio, so most pairs are rejected early
+        if (
+            matcher.real_quick_ratio() >= similarity_threshold
+            and matcher.quick_ratio() >= similarity_threshold
+            and matcher.ratio() >= similarity_threshold
+        ):
+            return True  # If a close match is found, return True
+    return False
+
+
 def get_is_similar_name(
     transaction: Transaction, transactions: list[Transaction], similarity_threshold: float = 0.6
 ) -> bool:
     """Checks if a transaction has a similar name to other past transactions."""
-    for t in transactions:
-        similarity = difflib.SequenceMatcher(None, transaction.name.lower(), t.name.lower()).ratio()
-        if similarity >= similarity_threshold:
-            return True  # If a close match is found, return True
-    return False
+    other_names = tuple(dict.fromkeys(t.name_lower for t in transactions))
+    return _has_similar_name(transaction.name_lower, other_names, similarity_threshold)
 
 
 def get_is_fixed_interval(transaction: Transaction, transactions: list[Transaction], margin: int = 1) -> bool:
     """Returns True if a transaction recurs at fixed intervals (weekly, bi-weekly, monthly)."""
-    transaction_dates = sorted([
-        datetime.strptime(t.date, "%Y-%m-%d") for t in transactions if t.name == transaction.name
-    ])
+    group = _name_groups(tuple(transactions)).get(transaction.name)
 
-    if len(transaction_dates) < 2:
+    if group is None or len(group.sorted_ordinals) < 2:
         return False  # Not enough transactions to determine intervals
 
-    intervals = [(transaction_dates[i] - transaction_dates[i - 1]).days for i in range(1, len(transaction_dates))]
-    return all(abs(interval - 30) <= margin for interval in intervals)  # Allow ±1 day for monthly intervals
+    intervals = np.diff(group.sorted_ordinals)
+    return bool(np.all(np.abs(intervals - 30) <= margin))  # Allow ±1 day for monthly intervals
 
 
 def get_has_irregular_spike(transaction: Transaction, transactions: list[Transaction]) -> bool:
@@ -128,11 +186,11 @@ def get_has_irregular_spike(transaction: Transaction, transactions: list[Transac
     Check if the transaction amount is significantly higher than the average amount
     for the same transaction name in the user's transaction history.
     """
-    similar_transactions = [t for t in transactions if t.name == transaction.name]
-    if not similar_transactions:
+    group = _name_groups(tuple(transactions)).get(transaction.name)
+    if group is None:
         return False
 
-    average_amount = sum(t.amount for t in similar_transactions) / len(similar_transactions)
+    average_amount = sum(group.amounts) / len(group.amounts)
     return transaction.amount > average_amount * 1.5  # Spike threshold: 50% higher than average
 
 
@@ -146,34 +204,33 @@ def get_is_first_of_month(transaction: Transaction) -> bool:
 # ===== NEW FEATURES ADDED BELOW =====
 def get_is_weekday_consistent(transaction: Transaction, transactions: list[Transaction]) -> bool:
     """Check if transaction consistently occurs on the same weekday"""
-    same_name_txns = [t for t in transactions if t.name == transaction.name]
-    if len(same_name_txns) < 2:
+    group = _name_groups(tuple(transactions)).get(transaction.name)
+    if group is None or len(group.transactions) < 2:
         return False
 
-    transaction_weekday = datetime.strptime(transaction.date, "%Y-%m-%d").weekday()
+    transaction_weekday = parse_date(transaction.date).weekday()
     return all(
-        datetime.strptime(t.date, "%Y-%m-%d").weekday() == transaction_weekday for t in same_name_txns[-3:]
+        parse_date(t.date).weekday() == transaction_weekday for t in group.transactions[-3:]
     )  # Check last 3 occurrences
 
 
 def get_is_seasonal(transaction: Transaction, transactions: list[Transaction]) -> bool:
     """Detect seasonal/annual payments"""
-    same_name_txns = [t for t in transactions if t.name == transaction.name]
-    if len(same_name_txns) < 2:
+    group = _name_groups(tuple(transactions)).get(transaction.name)
+    if group is None or len(group.ordinals) < 2:
         return False
 
-    dates = [datetime.strptime(t.date, "%Y-%m-%d") for t in same_name_txns]
-    intervals = [(dates[i] - dates[i - 1]).days for i in range(1, len(dates))]
-    return all(360 <= interval <= 370 for interval in intervals)
+    intervals = np.diff(group.ordinals)  # in list order, not sorted
+    return bool(np.all((intervals >= 360) & (intervals <= 370)))
 
 
 def get_amount_variation(transaction: Transaction, transactions: list[Transaction]) -> float:
     """Calculate coefficient of variation for amounts."""
-    same_name_txns = [t for t in transactions if t.name == transaction.name]
-    if len(same_name_txns) < 2:
+    group = _name_groups(tuple(transactions)).get(transaction.name)
+    if group is None or len(group.amounts) < 2:
         return 0.0
 
-    amounts = [t.amount for t in same_name_txns]
+    amounts = group.amounts
     if len(set(amounts)) <= 1:
         return 0.0
     try:
@@ -188,7 +245,10 @@ def get_amount_variation(transaction: Transaction, transactions: list[Transactio
 
 def get_has_trial_period(transaction: Transaction, transactions: list[Transaction]) -> bool:
     """Detect potential free trial periods"""
-    same_name_txns = sorted([t for t in transactions if t.name == transaction.name], key=lambda x: x.date)
+    group = _name_groups(tuple(transactions)).get(transaction.name)
+    if group is None:
+        return False
+    same_name_txns = sorted(group.transactions, key=lambda x: x.date)
     return len(same_name_txns) >= 2 and same_name_txns[0].amount == 0 and all(t.amount > 0 for t in same_name_txns[1:])
 
 
@@ -206,17 +266,17 @@ def get_description_pattern(transaction: Transaction) -> int:
 
 def get_is_weekend_transaction(transaction: Transaction) -> bool:
     """Check if transaction occurs on weekend"""
-    return datetime.strptime(transaction.date, "%Y-%m-%d").weekday() >= 5
+    return parse_date(transaction.date).weekday() >= 5
 
 
 def get_merchant_fingerprint(transaction: Transaction, transactions: list[Transaction]) -> float:
     """Identifies unique merchant patterns using multiple characteristics."""
-    same_merchant = [t for t in transactions if t.name == transaction.name]
+    group = _name_groups(tuple(transactions)).get(transaction.name)
 
     # Calculate stability scores (0-1)
-    if len(same_merchant) > 1:
-        amounts = [t.amount for t in same_merchant]
-        days = [datetime.strptime(t.date, "%Y-%m-%d").day for t in same_merchant]
+    if group is not None and len(group.amounts) > 1:
+        amounts = group.amount_array
+        days = group.days_of_month
         # Penalize amount variation more strongly
         try:
             amount_stability = 1 - min(1, (float(np.std(amounts)) / (float(np.mean(amounts)) + 1e-6)) ** 1.5)
@@ -229,7 +289,9 @@ def get_merchant_fingerprint(transaction: Transaction, transactions: list[Transa
         day_stability = 0
 
     # Payment method clues
-    method_score = 0.5 if any("ach" in t.name.lower() or "autopay" in t.name.lower() for t in same_merchant) else 0
+    method_score = (
+        0.5 if group is not None and ("ach" in transaction.name_lower or "autopay" in transaction.name_lower) else 0
+    )
 
     # Adjusted weights: make perfect patterns score high
     return float(max(0.0, min(1.0, (amount_stability * 0.7) + (day_stability * 0.2) + (method_score * 0.1))))
@@ -243,13 +305,13 @@ def get_recurrence_confidence_score(transaction: Transaction, transactions: list
     - Merchant trust signals
     - Behavioral history
     """
-    same_merchant = [t for t in transactions if t.name == transaction.name]
+    group = _name_groups(tuple(transactions)).get(transaction.name)
 
-    if len(same_merchant) < 2:
+    if group is None or len(group.amounts) < 2:
         return 0.0
 
-    amounts = [t.amount for t in same_merchant]
-    days = [datetime.strptime(t.date, "%Y-%m-%d").day for t in same_merchant]
+    amounts = group.amounts
+    days: list[int] = group.days_of_month.tolist()
 
     # Stronger penalty for amount variation
     try:
@@ -260,16 +322,19 @@ def get_recurrence_confidence_score(transaction: Transaction, transactions: list
         day_stability = 0
 
     # Payment method clues
-    method_score = 0.5 if any("ach" in t.name.lower() or "autopay" in t.name.lower() for t in same_merchant) else 0
+    method_score = 0.5 if "ach" in transaction.name_lower or "autopay" in transaction.name_lower else 0
 
     # Special case: only two transactions and large differences
-    if len(same_merchant) == 2 and (abs(amounts[0] - amounts[1]) > 0.5 * max(amounts) or abs(days[0] - days[1]) > 10):
+    if len(amounts) == 2 and (abs(amounts[0] - amounts[1]) > 0.5 * max(amounts) or abs(days[0] - days[1]) > 10):
         return 0.0
 
     # Adjusted weights: penalize amount variation much more
     return float(max(0.0, min(1.0, (amount_stability * 0.85) + (day_stability * 0.05) + (method_score * 0.1))))
 
 
+TRUSTED_MERCHANTS = frozenset({"netflix", "spotify", "amazon prime", "mortgage", "rent"})
+
+
 def get_transaction_trust_score(transaction: Transaction, transactions: list[Transaction]) -> float:
     """
     Calculates a 0-1 score focusing on precision by verifying:
@@ -278,7 +343,7 @@ def get_transaction_trust_score(transaction: Transaction, transactions: list[Tra
     3. Temporal plausibility
     4. Behavioral patterns
     """
-    same_merchant = [t for t in transactions if t.name == transaction.name]
+    group = _name_groups(tuple(transactions)).get(transaction.name)
 
     # Base score components
     trust_signals = {
@@ -289,8 +354,7 @@ def get_transaction_trust_score(transaction: Transaction, transactions: list[Tra
     }
 
     # 1. Merchant Reputation (30% weight)
-    trusted_merchants = {"netflix", "spotify", "amazon prime", "mortgage", "rent"}
-    if any(m in transaction.name.lower() for m in trusted_merchants):
+    if any(m in transaction.name_lower for m in TRUSTED_MERCHANTS):
         trust_signals["merchant_reputation"] = 1.0
     elif "ach" in transaction.name.lower():
         trust_signals["merchant_reputation"] = 0.8
@@ -303,10 +367,9 @@ def get_transaction_trust_score(transaction: Transaction, transactions: list[Tra
             trust_signals["amount_validation"] = 0.7
 
     # 3. Temporal Plausibility (25% weight)
-    if len(same_merchant) >= 2:
-        dates = sorted([datetime.strptime(t.date, "%Y-%m-%d") for t in same_merchant])
-        intervals = [(dates[i] - dates[i - 1]).days for i in range(1, len(dates))]
-        if all(15 <= i <= 45 for i in intervals):  # Valid recurring range
+    if group is not None and len(group.sorted_ordinals) >= 2:
+        intervals = np.diff(group.sorted_ordinals)
+        if np.all((intervals >= 15) & (intervals <= 45)):  # Valid recurring range
             trust_signals["temporal_plausibility"] = 1.0
 
     # 4. Behavioral Consistency (20% weight)
@@ -333,13 +396,12 @@ def get_recurring_confidence(transaction: Transaction, transactions: list[Transa
     2. Checking amount consistency with seasonal fluctuations
     3. Validating merchant patterns
     """
-    same_merchant = [t for t in transactions if t.name == transaction.name]
-    if len(same_merchant) < 2:
+    group = _name_groups(tuple(transactions)).get(transaction.name)
+    if group is None or len(group.sorted_ordinals) < 2:
         return 0.0
 
     # 1. Interval Analysis (Allows ±7 day variance)
-    dates = sorted(datetime.strptime(t.date, "%Y-%m-%d") for t in same_merchant)
-    intervals = [(dates[i] - dates[i - 1]).days for i in range(1, len(dates))]
+    intervals: list[int] = np.diff(group.sorted_ordinals).tolist()
     if not intervals:
         return 0.0
     avg_interval = sum(intervals) / len(intervals)
@@ -347,7 +409,7 @@ def get_recurring_confidence(transaction: Transaction, transactions: list[Transa
     interval_score = max(0.0, 1 - (interval_var / 30) ** 2)
 
     # 2. Amount consistency (relative difference)
-    amounts = [t.amount for t in same_merchant]
+    amounts = group.amounts
     amount_var = max(amounts) - min(amounts)
     amount_score = max(0.0, 1 - (amount_var / (min(amounts) + 1e-6)) ** 2)
 
@@ -358,7 +420,7 @@ def get_recurring_confidence(transaction: Transaction, transactions: list[Transa
     )
 
     # Special case: only two transactions and large differences
-    if len(same_merchant) == 2 and (abs(amounts[0] - amounts[1]) > 0.5 * max(amounts) or abs(intervals[0] - 30) > 20):
+    if len(amounts) == 2 and (abs(amounts[0] - amounts[1]) > 0.5 * max(amounts) or abs(intervals[0] - 30) > 20):
         return 0.0
 
     # Weighted sum
@@ -370,16 +432,18 @@ def get_amount_mad(transaction: Transaction, transactions: list[Transaction]) ->
     Calculate the Median Absolute Deviation (MAD) relative to median amount.
     This is more robust to outliers than standard deviation.
     """
-    same_name_txns = [t for t in transactions if t.name == transaction.name]
-    if len(same_name_txns) < 2:
+    group = _name_groups(tuple(transactions)).get(transaction.name)
+    if group is None or len(group.amount_array) < 2:
         return 0.0
 
-    amounts = sorted([t.amount for t in same_name_txns])
-    median = amounts[len(amounts) // 2]
+    amounts = group.amount_array
+    # the upper median, selected in linear time instead of sorting
+    middle = len(amounts) // 2
+    median = float(np.partition(amounts, middle)[middle])
 
     # Calculate absolute deviations from median
-    abs_deviations = [abs(amount - median) for amount in amounts]
-    mad = sorted(abs_deviations)[len(abs_deviations) // 2]  # Median of absolute deviations
+    abs_deviations = np.abs(amounts - median)
+    mad = float(np.partition(abs_deviations, middle)[middle])  # Median of absolute deviations
 
     return float((mad / median) * 100) if median != 0 else 0.0
 
@@ -389,10 +453,10 @@ def get_amount_roundness(transaction: Transaction) -> float:
     Returns 1 if amount ends in .00/.99, 0.5 for .95, 0 otherwise.
     Common in subscriptions.
     """
-    cents = round(transaction.amount % 1, 2)
-    if cents in {0.00, 0.99}:
+    cents = transaction.amount_cents % 100
+    if cents in {0, 99}:
         return 1.0
-    elif cents == 0.95:
+    elif cents == 95:
         return 0.5
     return 0.0
 
@@ -442,6 +506,19 @@ def get_is_recurring_charge(
     return len(recent_txns) >= 2
 
 
+# lowercased, since they are matched against the lowercased name
+APPLE_SERVICES = frozenset({
+    "apple music",
+    "apple tv+",
+    "apple arcade",
+    "icloud",
+    "apple fitness+",
+    "apple news+",
+    "apple one",
+})
+COMMON_APPLE_AMOUNTS = frozenset({0.99, 1.99, 2.99, 4.99, 9.99, 14.99, 19.99, 29.99})
+
+
 def is_apple_subscription_service(transaction_name: str) -> bool:
     """
     Args:
@@ -449,16 +526,8 @@ def is_apple_subscription_service(transaction_name: str) -> bool:
     Returns:
         True if this is a known Apple subscription service
     """
-    apple_services = {
-        "Apple Music",
-        "Apple TV+",
-        "Apple Arcade",
-        "iCloud",
-        "Apple Fitness+",
-        "Apple News+",
-        "Apple One",
-    }
-    return any(service.lower() in transaction_name.lower() for service in apple_services)
+    name = transaction_name.lower()
+    return any(service in name for service in APPLE_SERVICES)
 
 
 def apple_transaction_amount_profile(amount: float) -> float:
@@ -468,8 +537,7 @@ def apple_transaction_amount_profile(amount: float) -> float:
     Returns:
         1.0 if amount matches common Apple pattern, 0.0 if suspicious
     """
-    common_amounts = {0.99, 1.99, 2.99, 4.99, 9.99, 14.99, 19.99, 29.99}
-    return 1.0 if amount in common_amounts else 0.0
+    return 1.0 if amount in COMMON_APPLE_AMOUNTS else 0.0
 
 
 def get_new_features(
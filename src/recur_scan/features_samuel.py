@@ -6,45 +6,46 @@ import numpy as np
 from recur_scan.transactions import Transaction
 from recur_scan.utils import parse_date
 
+ALWAYS_RECURRING_VENDORS = frozenset({
+    "google storage",
+    "netflix",
+    "hulu",
+    "spotify",
+    "amazon prime",
+    "apple music",
+    "microsoft 365",
+    "dropbox",
+    "adobe creative cloud",
+    "discord nitro",
+    "zoom subscription",
+    "patreon",
+    "new york times",
+    "wall street journal",
+    "github copilot",
+    "notion",
+    "evernote",
+    "expressvpn",
+    "nordvpn",
+    "youtube premium",
+    "linkedin premium",
+    "at&t",
+    "afterpay",
+    "amazon+",
+    "walmart+",
+    "amazonprime",
+    "t-mobile",
+    "duke energy",
+    "adobe",
+    "charter comm",
+    "boostmobile",
+    "verizon",
+    "disney+",
+})
+
 
 def get_is_always_recurring(transaction: Transaction) -> bool:
     """Check if the transaction is always recurring because of the vendor name - check lowercase match."""
-    always_recurring_vendors = {
-        "google storage",
-        "netflix",
-        "hulu",
-        "spotify",
-        "amazon prime",
-        "apple music",
-        "microsoft 365",
-        "dropbox",
-        "adobe creative cloud",
-        "discord nitro",
-        "zoom subscription",
-        "patreon",
-        "new york times",
-        "wall street journal",
-        "github copilot",
-        "notion",
-        "evernote",
-        "expressvpn",
-        "nordvpn",
-        "youtube premium",
-        "linkedin premium",
-        "at&t",
-        "afterpay",
-        "amazon+",
-        "walmart+",
-        "amazonprime",
-        "t-mobile",
-        "duke energy",
-        "adobe",
-        "charter comm",
-        "boostmobile",
-        "verizon",
-        "disney+",
-    }
-    return transaction.name.lower() in always_recurring_vendors
+    return transaction.name.lower() in ALWAYS_RECURRING_VENDORS
 
 
 def get_transaction_frequency(transaction: Transaction, all_transactions: list[Transaction]) -> int:
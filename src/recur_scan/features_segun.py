@@ -1,33 +1,62 @@
+import math
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Iterable
 from datetime import datetime
-from statistics import median, stdev
+from functools import lru_cache
+from statistics import median
 
 from recur_scan.transactions import Transaction
 
 
+@lru_cache(maxsize=128)
+def _amount_summary(transactions: tuple[Transaction, ...]) -> tuple[float, float, float]:
+    """Get the (min, max, total) amount in one pass over the transactions, once per distinct list of transactions"""
+    amounts = [t.amount for t in transactions]
+    if not amounts:
+        return 0.0, 0.0, 0
+    return min(amounts), max(amounts), sum(amounts)
+
+
+def _sample_std(values: Iterable[float]) -> float:
+    """Sample standard deviation in one pass with Welford's update, for at least two values"""
+    n = 0
+    mean = 0.0
+    m2 = 0.0
+    for value in values:
+        n += 1
+        delta = value - mean
+        mean += delta / n
+        m2 += delta * (value - mean)
+    return math.sqrt(m2 / (n - 1))
+
+
+@lru_cache(maxsize=128)
+def _amount_counts(transactions: tuple[Transaction, ...]) -> Counter[float]:
+    """Count each amount once per distinct list of transactions"""
+    return Counter(t.amount for t in transactions)
+
+
 def get_total_transaction_amount(all_transactions: list[Transaction]) -> float:
     """Get the total amount of all transactions"""
-    return sum(t.amount for t in all_transactions)
+    return _amount_summary(tuple(all_transactions))[2]
 
 
 def get_average_transaction_amount(all_transactions: list[Transaction]) -> float:
     """Get the average amount of all transactions"""
     if not all_transactions:
         return 0.0
-    return sum(t.amount for t in all_transactions) / len(all_transactions)
+    return _amount_summary(tuple(all_transactions))[2] / len(all_transactions)
 
 
 def get_max_transaction_amount(all_transactions: list[Transaction]) -> float:
     """Get the maximum transaction amount"""
-    if not all_transactions:
-        return 0.0
-    return max(t.amount for t in all_transactions)
+    return _amount_summary(tuple(all_transactions))[1]
 
 
 def get_min_transaction_amount(all_transactions: list[Transaction]) -> float:
     """Get the minimum transaction amount"""
-    if not all_transactions:
-        return 0.0
-    return min(t.amount for t in all_transactions)
+    return _amount_summary(tuple(all_transactions))[0]
 
 
 def get_transaction_count(all_transactions: list[Transaction]) -> int:
@@ -39,7 +68,7 @@ def get_transaction_amount_std(all_transactions: list[Transaction]) -> float:
     """Get the standard deviation of transaction amounts"""
     if len(all_transactions) < 2:  # Standard deviation requires at least two data points
         return 0.0
-    return stdev(t.amount for t in all_transactions)
+    return _sample_std(t.amount for t in all_transactions)
 
 
 def get_transaction_amount_median(all_transactions: list[Transaction]) -> float:
@@ -53,7 +82,8 @@ def get_transaction_amount_range(all_transactions: list[Transaction]) -> float:
     """Get the range of transaction amounts (max - min)"""
     if not all_transactions:
         return 0.0
-    return max(t.amount for t in all_transactions) - min(t.amount for t in all_transactions)
+    min_amount, max_amount, _ = _amount_summary(tuple(all_transactions))
+    return max_amount - min_amount
 
 
 def get_unique_transaction_amount_count(all_transactions: list[Transaction]) -> int:
@@ -63,7 +93,7 @@ def get_unique_transaction_amount_count(all_transactions: list[Transaction]) ->
 
 def get_transaction_amount_frequency(transaction: Transaction, all_transactions: list[Transaction]) -> int:
     """Get the frequency of the transaction amount in all transactions"""
-    return sum(1 for t in all_transactions if t.amount == transaction.amount)
+    return _amount_counts(tuple(all_transactions))[transaction.amount]
 
 
 def get_transaction_day_of_week(transaction: Transaction) -> int:
@@ -118,7 +148,7 @@ def get_transaction_interval_std(all_transactions: list[Transaction]) -> float:
     ]
     if len(intervals) < 2:  # Standard deviation requires at least two data points
         return 0.0
-    return stdev(intervals)
+    return _sample_std(intervals)
 
 
 def get_transaction_amount_percentage(transaction: Transaction, all_transactions: list[Transaction]) -> float:
@@ -129,18 +159,21 @@ def get_transaction_amount_percentage(transaction: Transaction, all_transactions
     return (transaction.amount / total_amount) * 100
 
 
+@lru_cache(maxsize=128)
+def _sorted_date_ordinals(transactions: tuple[Transaction, ...]) -> list[int]:
+    """Get the date ordinals in ascending order, once per distinct list of transactions"""
+    return sorted(t.date_ordinal for t in transactions)
+
+
 def get_transaction_recency(transaction: Transaction, all_transactions: list[Transaction]) -> int:
     """Get the number of days since the last transaction."""
-    transaction_date = datetime.strptime(transaction.date, "%Y-%m-%d")
-    previous_dates = [
-        datetime.strptime(t.date, "%Y-%m-%d")
-        for t in all_transactions
-        if datetime.strptime(t.date, "%Y-%m-%d") < transaction_date
-    ]
-    if not previous_dates:
+    ordinals = _sorted_date_ordinals(tuple(all_transactions))
+    transaction_ordinal = transaction.date_ordinal
+    # the number of transactions on earlier dates, found by binary search
+    n_previous = bisect_left(ordinals, transaction_ordinal)
+    if n_previous == 0:
         return 0
-    last_transaction_date = max(previous_dates)
-    return (transaction_date - last_transaction_date).days
+    return transaction_ordinal - ordinals[n_previous - 1]
 
 
 def get_transaction_frequency_per_month(all_transactions: list[Transaction]) -> float:
@@ -244,7 +277,7 @@ def calculate_streak(all_transactions: list[Transaction]) -> int:
         return 0
 
     # Sort transactions by date
-    sorted_transactions = sorted(all_transactions, key=lambda t: datetime.strptime(t.date, "%Y-%m-%d"))
+    sorted_transactions = sorted(all_transactions, key=lambda t: t.date)
     dates = [datetime.strptime(t.date, "%Y-%m-%d") for t in sorted_transactions]
 
     if not dates:
@@ -1,15 +1,29 @@
 import random
+from collections import Counter
+from dataclasses import dataclass
 from functools import lru_cache
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from datetime import date
 import numpy as np
-from numpy import ndarray
-from scipy.stats import mode
 
 from recur_scan.transactions import Transaction
-from recur_scan.utils import parse_date
+from recur_scan.utils import get_date_ordinal, parse_date
+
+
+@dataclass(frozen=True)
+class TransactionIndex:
+    """Arrays and counts over a list of transactions, built once and shared by the feature functions."""
+
+    amounts: np.ndarray
+    amounts_by_date: np.ndarray
+    date_ordinals: np.ndarray
+    sorted_date_ordinals: np.ndarray
+    intervals: np.ndarray
+    unique_amounts: np.ndarray
+    unique_amount_counts: np.ndarray
+    name_counts: Counter[str]
 
 
 def _precompute_dates_and_intervals(all_transactions: list[Transaction]) -> tuple[list["date"], list[int]]:
@@ -21,6 +35,32 @@ def _precompute_dates_and_intervals(all_transactions: list[Transaction]) -> tupl
     return dates, intervals
 
 
+@lru_cache(maxsize=128)
+def _build_index(transactions: tuple[Transaction, ...]) -> TransactionIndex:
+    """Build the index once per distinct list of transactions."""
+    n = len(transactions)
+    amounts = np.fromiter((t.amount for t in transactions), dtype=np.float64, count=n)
+    date_ordinals = np.fromiter((get_date_ordinal(t.date) for t in transactions), dtype=np.int64, count=n)
+    date_order = np.argsort(date_ordinals, kind="stable")
+    sorted_date_ordinals = date_ordinals[date_order]
+    unique_amounts, unique_amount_counts = np.unique(amounts, return_counts=True)
+    return TransactionIndex(
+        amounts=amounts,
+        amounts_by_date=amounts[date_order],
+        date_ordinals=date_ordinals,
+        sorted_date_ordinals=sorted_date_ordinals,
+        intervals=np.diff(sorted_date_ordinals),
+        unique_amounts=unique_amounts,
+        unique_amount_counts=unique_amount_counts,
+        name_counts=Counter(t.name for t in transactions),
+    )
+
+
+def build_transaction_index(all_transactions: list[Transaction]) -> TransactionIndex:
+    """Get the index for all_transactions; repeated calls with the same transactions are cached."""
+    return _build_index(tuple(all_transactions))
+
+
 @lru_cache(maxsize=1000)
 def _cached_merchant_transactions(merchant_name: str, transactions_tuple: tuple) -> list[Transaction]:
     """Cache merchant transactions to avoid repeated filtering."""
@@ -28,15 +68,22 @@ def _cached_merchant_transactions(merchant_name: str, transactions_tuple: tuple)
     return [t for t in transactions if t.name == merchant_name]
 
 
+@lru_cache(maxsize=1000)
+def _merchant_unique_amounts(merchant_name: str, transactions_tuple: tuple) -> tuple[np.ndarray, np.ndarray]:
+    """Distinct amounts of a merchant's transactions and how often each occurs."""
+    merchant_transactions = _cached_merchant_transactions(merchant_name, transactions_tuple)
+    return np.unique(np.array([t.amount for t in merchant_transactions], dtype=np.float64), return_counts=True)
+
+
 def get_transaction_frequency(all_transactions: list[Transaction]) -> float:
-    _, intervals = _precompute_dates_and_intervals(all_transactions)
-    return float(np.mean(intervals)) if intervals else 0.0
+    intervals = build_transaction_index(all_transactions).intervals
+    return float(np.mean(intervals)) if intervals.size else 0.0
 
 
 def get_interval_consistency(all_transactions: list[Transaction]) -> float:
-    _, intervals = _precompute_dates_and_intervals(all_transactions)
+    intervals = build_transaction_index(all_transactions).intervals
     try:
-        return float(np.std(intervals)) if intervals else 0.0
+        return float(np.std(intervals)) if intervals.size else 0.0
     except Exception:
         return 0.0
 
@@ -44,7 +91,7 @@ def get_interval_consistency(all_transactions: list[Transaction]) -> float:
 def get_amount_variability(all_transactions: list[Transaction]) -> float:
     if not all_transactions:
         return 0.0
-    amounts = np.fromiter((t.amount for t in all_transactions), float)
+    amounts = build_transaction_index(all_transactions).amounts
     mean_amount = float(np.mean(amounts))
     try:
         return float(np.std(amounts) / mean_amount) if mean_amount > 0 else 0.0
@@ -55,7 +102,7 @@ def get_amount_variability(all_transactions: list[Transaction]) -> float:
 def get_amount_range(all_transactions: list[Transaction]) -> float:
     if not all_transactions:
         return 0.0
-    amounts = np.fromiter((t.amount for t in all_transactions), float)
+    amounts = build_transaction_index(all_transactions).amounts
     return float(np.max(amounts) - np.min(amounts)) if amounts.size else 0.0
 
 
@@ -64,75 +111,71 @@ def get_transaction_count(all_transactions: list[Transaction]) -> int:
 
 
 def get_interval_mode(all_transactions: list[Transaction]) -> float:
-    _, intervals = _precompute_dates_and_intervals(all_transactions)
-    if not intervals:
+    intervals = build_transaction_index(all_transactions).intervals
+    if not intervals.size:
         return 0.0
-    mode_result = mode(intervals, keepdims=True)
-    mode_array = cast(ndarray, mode_result.mode)
-    return float(mode_array.item(0)) if mode_array.size > 0 else 0.0
+    # day gaps are small non-negative ints; argmax picks the smallest gap on ties, as scipy's mode did
+    return float(np.bincount(intervals).argmax())
 
 
 def get_normalized_interval_consistency(all_transactions: list[Transaction]) -> float:
-    _, intervals = _precompute_dates_and_intervals(all_transactions)
-    mean_interval = float(np.mean(intervals)) if intervals else 0.0
+    intervals = build_transaction_index(all_transactions).intervals
+    mean_interval = float(np.mean(intervals)) if intervals.size else 0.0
     try:
-        std_dev = float(np.std(intervals)) if intervals else 0.0
+        std_dev = float(np.std(intervals)) if intervals.size else 0.0
         return std_dev / mean_interval if mean_interval > 0 else 0.0
     except Exception:
         return 0.0
 
 
 def get_days_since_last_same_amount(transaction: Transaction, all_transactions: list[Transaction]) -> float:
-    prior_transactions = (
-        t
-        for t in all_transactions
-        if parse_date(t.date) < parse_date(transaction.date) and t.amount == transaction.amount
-    )
-    prior_dates = [parse_date(t.date) for t in prior_transactions]
-    return (parse_date(transaction.date) - max(prior_dates)).days if prior_dates else -1.0
+    index = build_transaction_index(all_transactions)
+    ref_ordinal = get_date_ordinal(transaction.date)
+    prior = (index.date_ordinals < ref_ordinal) & (index.amounts == transaction.amount)
+    return int(ref_ordinal - index.date_ordinals[prior].max()) if prior.any() else -1.0
 
 
 def get_amount_relative_change(transaction: Transaction, all_transactions: list[Transaction]) -> float:
-    prior_transactions = [t for t in all_transactions if parse_date(t.date) < parse_date(transaction.date)]
-    if not prior_transactions:
+    index = build_transaction_index(all_transactions)
+    prior = np.flatnonzero(index.date_ordinals < get_date_ordinal(transaction.date))
+    if not prior.size:
         return 0.0
-    last_amount = prior_transactions[-1].amount
+    last_amount = float(index.amounts[prior[-1]])
     return (transaction.amount - last_amount) / last_amount if last_amount > 0 else 0.0
 
 
 def get_merchant_name_frequency(transaction: Transaction, all_transactions: list[Transaction]) -> int:
-    return sum(1 for t in all_transactions if t.name == transaction.name)
+    return build_transaction_index(all_transactions).name_counts[transaction.name]
 
 
 def get_interval_histogram(all_transactions: list[Transaction]) -> dict[str, float]:
-    _, intervals = _precompute_dates_and_intervals(all_transactions)
-    if not intervals:
+    intervals = build_transaction_index(all_transactions).intervals
+    if not intervals.size:
         return {"biweekly": 0.0, "monthly": 0.0}
-    biweekly = sum(1 for i in intervals if 13 <= i <= 15) / len(intervals)
-    monthly = sum(1 for i in intervals if 28 <= i <= 31) / len(intervals)
+    biweekly = float(((intervals >= 13) & (intervals <= 15)).mean())
+    monthly = float(((intervals >= 28) & (intervals <= 31)).mean())
     return {"biweekly": biweekly, "monthly": monthly}
 
 
 def get_amount_stability_score(all_transactions: list[Transaction]) -> float:
     if not all_transactions:
         return 0.0
-    amounts = np.fromiter((t.amount for t in all_transactions), float)
+    amounts = build_transaction_index(all_transactions).amounts
     mean = np.mean(amounts)
     try:
         std = np.std(amounts)
-        return sum(1 for a in amounts if abs(a - mean) <= std) / len(amounts) if std > 0 else 1.0
+        return float((np.abs(amounts - mean) <= std).mean()) if std > 0 else 1.0
     except Exception:
         return 0.0
 
 
 def get_dominant_interval_strength(all_transactions: list[Transaction]) -> float:
-    _, intervals = _precompute_dates_and_intervals(all_transactions)
-    if not intervals:
+    intervals = build_transaction_index(all_transactions).intervals
+    if not intervals.size:
         return 0.0
     bins = [(6, 8), (13, 15), (28, 31)]
-    counts = [sum(1 for i in intervals if lo <= i <= hi) for lo, hi in bins]
-    max_count = max(counts) if counts else 0
-    return max_count / len(intervals) if intervals else 0.0
+    counts = [int(np.count_nonzero((intervals >= lo) & (intervals <= hi))) for lo, hi in bins]
+    return max(counts) / len(intervals)
 
 
 def get_near_amount_consistency(
@@ -140,9 +183,10 @@ def get_near_amount_consistency(
 ) -> float:
     if not all_transactions:
         return 0.0
-    amounts = np.fromiter((t.amount for t in all_transactions), float)
-    similar = sum(1 for a in amounts if abs(a - transaction.amount) / max(transaction.amount, 0.01) <= threshold)
-    return similar / len(amounts) if amounts.size else 0.0
+    index = build_transaction_index(all_transactions)
+    # compare each distinct amount once, weighted by how often it occurs
+    near = np.abs(index.unique_amounts - transaction.amount) / max(transaction.amount, 0.01) <= threshold
+    return int(index.unique_amount_counts[near].sum()) / index.amounts.size
 
 
 def get_merchant_amount_signature(
@@ -151,33 +195,32 @@ def get_merchant_amount_signature(
     merchant_transactions = _cached_merchant_transactions(transaction.name, tuple(all_transactions))
     if len(merchant_transactions) > 50:
         merchant_transactions = random.sample(merchant_transactions, 50)
-    similar = sum(
-        1
-        for t in merchant_transactions
-        if abs(t.amount - transaction.amount) / max(transaction.amount, 0.01) <= threshold
-    )
-    return similar / len(merchant_transactions) if merchant_transactions else 0.0
+        unique_amounts, counts = np.unique([t.amount for t in merchant_transactions], return_counts=True)
+    else:
+        unique_amounts, counts = _merchant_unique_amounts(transaction.name, tuple(all_transactions))
+    if not counts.size:
+        return 0.0
+    similar = np.abs(unique_amounts - transaction.amount) / max(transaction.amount, 0.01) <= threshold
+    return int(counts[similar].sum()) / len(merchant_transactions)
 
 
 def get_amount_cluster_count(
     transaction: Transaction, all_transactions: list[Transaction], threshold: float = 0.05
 ) -> int:
-    dates, intervals = _precompute_dates_and_intervals(all_transactions)
-    if not intervals:
+    index = build_transaction_index(all_transactions)
+    intervals = index.intervals
+    if not intervals.size:
         return 0
-    amounts = np.fromiter((t.amount for t in all_transactions), float)
-    cluster_count = 0
-    for i, a in enumerate(amounts):
-        if abs(a - transaction.amount) / max(transaction.amount, 0.01) <= threshold and i > 0 and intervals[i - 1] > 5:
-            cluster_count += 1
-    return cluster_count
+    # in date order, amounts_by_date[i] is the transaction that ends intervals[i - 1]
+    similar = np.abs(index.amounts_by_date[1:] - transaction.amount) / max(transaction.amount, 0.01) <= threshold
+    return int(np.count_nonzero(similar & (intervals > 5)))
 
 
 def get_transaction_density(all_transactions: list[Transaction]) -> float:
-    dates = [parse_date(t.date) for t in all_transactions]
-    if len(dates) < 2:
+    ordinals = build_transaction_index(all_transactions).sorted_date_ordinals
+    if len(ordinals) < 2:
         return 0.0
-    time_span = (max(dates) - min(dates)).days
+    time_span = int(ordinals[-1] - ordinals[0])
     return len(all_transactions) / time_span if time_span > 0 else 0.0
 
 
@@ -195,13 +238,12 @@ def get_amount_similarity_ratio(transaction: Transaction, all_transactions: list
 
 
 def get_interval_cluster_strength(all_transactions: list[Transaction]) -> float:
-    _, intervals = _precompute_dates_and_intervals(all_transactions)
-    if not intervals:
+    intervals = build_transaction_index(all_transactions).intervals
+    if not intervals.size:
         return 0.0
     bins = [(6, 8), (13, 15), (20, 24), (28, 31)]
-    counts = [sum(1 for i in intervals if lo <= i <= hi) for lo, hi in bins]
-    max_count = max(counts) if counts else 0
-    return max_count / len(intervals) if intervals else 0.0
+    counts = [int(np.count_nonzero((intervals >= lo) & (intervals <= hi))) for lo, hi in bins]
+    return max(counts) / len(intervals)
 
 
 def get_merchant_recurrence_score(transaction: Transaction, all_transactions: list[Transaction]) -> float:
@@ -231,20 +273,16 @@ def get_day_of_month_consistency(all_transactions: list[Transaction]) -> float:
     if len(all_transactions) < 2:
         return 0.0
     days = np.fromiter((parse_date(t.date).day for t in all_transactions), int)
-    mode_result = mode(days, keepdims=True)
-    mode_array = cast(ndarray, mode_result.mode)
-    if mode_array.size == 0:
-        return 0.0
-    mode_day = int(mode_array.item(0))
-    count = sum(1 for d in days if abs(d - mode_day) <= 2)
+    mode_day = int(np.bincount(days).argmax())
+    count = int(np.count_nonzero(np.abs(days - mode_day) <= 2))
     return count / len(days)
 
 
 def get_long_term_recurrence(all_transactions: list[Transaction]) -> float:
-    dates = [parse_date(t.date) for t in all_transactions]
-    if len(dates) < 2:
+    ordinals = build_transaction_index(all_transactions).sorted_date_ordinals
+    if len(ordinals) < 2:
         return 0.0
-    time_span = (max(dates) - min(dates)).days
+    time_span = int(ordinals[-1] - ordinals[0])
     return time_span / 365.0 if time_span > 0 else 0.0
 
 
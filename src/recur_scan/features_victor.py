@@ -83,7 +83,7 @@ def amount_stability_index(all_transactions: list[Transaction], tolerance: float
     if not amounts:
         return 0.0
     median_amount = np.median(amounts)
-    within_tolerance = len([amount for amount in amounts if abs(amount - median_amount) <= median_amount * tolerance])
+    within_tolerance = sum(1 for amount in amounts if abs(amount - median_amount) <= median_amount * tolerance)
     return within_tolerance / len(amounts)
 
 
@@ -2,11 +2,19 @@ import csv
 import os
 from collections import defaultdict
 from dataclasses import asdict, dataclass, fields
+from functools import lru_cache
 
 from loguru import logger
 
+from recur_scan.utils import get_date_ordinal
 
-@dataclass(frozen=True)
+
+@lru_cache(maxsize=8192)
+def _lower_name(name: str) -> str:
+    return name.lower()
+
+
+@dataclass(frozen=True, slots=True)
 class Transaction:
     id: int  # unique identifier
     user_id: str  # user id
@@ -14,6 +22,21 @@ class Transaction:
     date: str  # date of the transaction
     amount: float  # amount of the transaction
 
+    @property
+    def name_lower(self) -> str:
+        """The vendor name in lowercase, shared by all transactions with the same name."""
+        return _lower_name(self.name)
+
+    @property
+    def amount_cents(self) -> int:
+        """The amount in whole cents, for exact integer comparisons and hashing."""
+        return round(self.amount * 100)
+
+    @property
+    def date_ordinal(self) -> int:
+        """The date as a proleptic Gregorian ordinal, so day differences are plain int subtraction."""
+        return get_date_ordinal(self.date)
+
 
 # Create a type alias for grouped transactions that maps a tuple of (user_id, name) to a list of transactions
 type GroupedTransactions = dict[tuple[str, str], list[Transaction]]
@@ -1,13 +1,54 @@
 from datetime import date, datetime
 from functools import lru_cache
+from typing import TYPE_CHECKING
 
+import numpy as np
 
-@lru_cache(maxsize=1024)
+if TYPE_CHECKING:
+    # imported for annotations only: recur_scan.transactions itself imports this module
+    from recur_scan.transactions import Transaction
+
+
+@lru_cache(maxsize=65536)
 def parse_date(date_str: str) -> date:
     """Parse a date string into a datetime.date object."""
+    # date.fromisoformat is much faster than strptime but accepts other ISO 8601 forms too,
+    # so only take the fast path for plain YYYY-MM-DD strings
+    if (
+        len(date_str) == 10
+        and date_str[4] == "-"
+        and date_str[7] == "-"
+        and date_str.isascii()
+        and date_str[:4].isdigit()
+        and date_str[5:7].isdigit()
+        and date_str[8:].isdigit()
+    ):
+        return date.fromisoformat(date_str)
     return datetime.strptime(date_str, "%Y-%m-%d").date()
 
 
+@lru_cache(maxsize=4096)
+def get_date_ordinal(date_str: str) -> int:
+    """Get the ordinal day number of a date string, so day differences are plain int subtraction."""
+    return parse_date(date_str).toordinal()
+
+
 def get_day(date: str) -> int:
     """Get the day of the month from a transaction date."""
     return int(date.split("-")[2])
+
+
+@lru_cache(maxsize=128)
+def _sorted_amounts(transactions: tuple["Transaction", ...]) -> np.ndarray:
+    """All amounts in ascending order, so range counts are two binary searches"""
+    return np.sort(np.fromiter((t.amount for t in transactions), dtype=np.float64, count=len(transactions)))
+
+
+def count_amounts_between(transactions: list["Transaction"], lower_bound: float, upper_bound: float) -> int:
+    """Count the transactions with lower_bound <= amount <= upper_bound."""
+    amounts = _sorted_amounts(tuple(transactions))
+    n_in_range = np.searchsorted(amounts, upper_bound, side="right") - np.searchsorted(
+        amounts, lower_bound, side="left"
+    )
+    # the bounds are reversed for negative amounts, where nothing can be in range
+    return max(int(n_in_range), 0)
@@ -0,0 +1,65 @@
+import pytest
+
+from recur_scan.features import get_features, get_group_features, get_user_features
+from recur_scan.transactions import Transaction, group_transactions
+
+
+@pytest.fixture
+def duplicate_charges_group() -> list[Transaction]:
+    """A date-sorted (user_id, name) group with several same-day, same-amount duplicate charges"""
+    return [
+        Transaction(id=1, user_id="user1", name="Netflix", amount=15.99, date="2024-01-15"),
+        Transaction(id=2, user_id="user1", name="Netflix", amount=15.99, date="2024-01-15"),
+        Transaction(id=3, user_id="user1", name="Netflix", amount=15.99, date="2024-02-15"),
+        Transaction(id=4, user_id="user1", name="Netflix", amount=15.99, date="2024-03-15"),
+        Transaction(id=5, user_id="user1", name="Netflix", amount=15.99, date="2024-03-15"),
+        Transaction(id=6, user_id="user1", name="Netflix", amount=15.99, date="2024-03-15"),
+        Transaction(id=7, user_id="user1", name="Netflix", amount=17.99, date="2024-04-15"),
+    ]
+
+
+def test_get_group_features_duplicate_charges(duplicate_charges_group: list[Transaction]) -> None:
+    """Test that duplicates whose features are copied get the same features as featurizing each one."""
+    group_features = get_group_features(duplicate_charges_group)
+    for transaction in duplicate_charges_group:
+        assert group_features[transaction] == get_features(transaction, list(duplicate_charges_group))
+
+
+def test_get_group_features(duplicate_charges_group: list[Transaction]) -> None:
+    """Test that get_group_features returns one entry per transaction, in group order, keyed by transaction."""
+    group_features = get_group_features(duplicate_charges_group)
+    assert list(group_features) == duplicate_charges_group
+    assert [transaction.id for transaction in group_features] == [1, 2, 3, 4, 5, 6, 7]
+    for transaction, features in group_features.items():
+        assert features == get_features(transaction, duplicate_charges_group)
+
+    # map the features back to the transactions by (user_id, name) group, as the train and predict scripts do
+    transactions = [
+        Transaction(id=10, user_id="user2", name="Spotify", amount=9.99, date="2024-01-03"),
+        *duplicate_charges_group,
+        Transaction(id=11, user_id="user2", name="Spotify", amount=9.99, date="2024-02-03"),
+    ]
+    grouped_transactions = group_transactions(transactions)
+    features_by_group = {group_key: get_group_features(group) for group_key, group in grouped_transactions.items()}
+    all_features = [
+        features_by_group[(transaction.user_id, transaction.name)][transaction] for transaction in transactions
+    ]
+    assert len(all_features) == len(transactions)
+    for transaction, transaction_features in zip(transactions, all_features, strict=True):
+        group = grouped_transactions[(transaction.user_id, transaction.name)]
+        assert transaction_features == get_features(transaction, group)
+
+
+def test_get_user_features(duplicate_charges_group: list[Transaction]) -> None:
+    """Test that get_user_features returns one get_group_features result per group, in the order given."""
+    other_group = [
+        Transaction(id=20, user_id="user1", name="Spotify", amount=9.99, date="2024-01-03"),
+        Transaction(id=21, user_id="user1", name="Spotify", amount=9.99, date="2024-02-03"),
+    ]
+    groups = [other_group, duplicate_charges_group]
+    user_features = get_user_features(groups)
+    assert len(user_features) == len(groups)
+    for group, group_features in zip(groups, user_features, strict=True):
+        assert list(group_features) == group
+        assert group_features == get_group_features(group)
+    assert get_user_features([]) == []
@@ -91,6 +91,11 @@ def test_get_time_features() -> None:
     result = get_time_features(transactions[0], transactions)
     assert result["month_asimi"] == 1
     assert result["days_until_next_transaction_asimi"] == 1
+    # the last transaction has no next one
+    assert get_time_features(transactions[3], transactions)["days_until_next_transaction_asimi"] == 0
+    # another transaction on the same date counts as the next one
+    same_day = [*transactions, Transaction(id=5, user_id="user1", name="name1", amount=2.99, date="2024-01-14")]
+    assert get_time_features(same_day[2], same_day)["days_until_next_transaction_asimi"] == 0
 
 
 def test_get_vendor_features() -> None:
@@ -116,6 +116,19 @@ def test_get_n_transactions_same_month(transactions) -> None:
     assert get_n_transactions_same_month(transactions[3], transactions) == 2
 
 
+def test_get_n_transactions_same_month_non_padded_date() -> None:
+    """Test that dates without zero padding are counted in their month and weekday."""
+    transactions = [
+        Transaction(id=1, user_id="user1", name="Netflix", amount=15.99, date="2024-1-5"),
+        Transaction(id=2, user_id="user1", name="Netflix", amount=15.99, date="2024-01-12"),
+        Transaction(id=3, user_id="user1", name="Netflix", amount=15.99, date="2024-2-9"),
+    ]
+    assert get_n_transactions_same_month(transactions[0], transactions) == 2
+    assert get_n_transactions_same_month(transactions[2], transactions) == 1
+    # all three dates are Fridays
+    assert get_percent_transactions_same_day_of_week(transactions[0], transactions) == 1.0
+
+
 def test_get_percent_transactions_same_month(transactions) -> None:
     """Test that get_percent_transactions_same_month returns the correct percentage
     of transactions in the same month."""
@@ -178,6 +191,9 @@ def test_get_n_transactions_within_amount_range(transactions) -> None:
     number of transactions within a certain amount range."""
     assert get_n_transactions_within_amount_range(transactions[0], transactions, 0.1) == 2
     assert get_n_transactions_within_amount_range(transactions[2], transactions, 0.1) == 1
+    # for a negative amount the bounds are reversed, so no transaction is in range
+    refund = Transaction(id=99, user_id="user1", name="name1", amount=-10.0, date="2024-01-05")
+    assert get_n_transactions_within_amount_range(refund, [*transactions, refund], 0.1) == 0
 
 
 def test_get_percent_transactions_within_amount_range(transactions) -> None:
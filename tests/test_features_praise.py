@@ -67,6 +67,7 @@ from recur_scan.features_praise import (
     moneylion_days_since_last_same_amount,
     moneylion_is_biweekly,
     moneylion_weekday_pattern,
+    precompute,
 )
 from recur_scan.transactions import Transaction
 
@@ -84,6 +85,30 @@ def test_is_recurring_merchant() -> None:
     assert not is_recurring_merchant(transaction)
 
 
+def test_precompute() -> None:
+    """Test precompute builds the group context once and reuses it for the same transactions."""
+    transactions = [
+        create_transaction(1, "user1", "VendorA", "2023-01-01", 100.0),
+        create_transaction(2, "user1", "VendorA", "2023-01-08", 100.0),
+        create_transaction(3, "user1", "VendorA", "2023-01-22", 100.0),
+        create_transaction(4, "user1", "VendorA", "2023-01-23", 5.0),
+    ]
+    ctx = precompute(transactions)
+    assert ctx.n == 4
+    assert ctx.amounts.tolist() == [100.0, 100.0, 100.0, 5.0]
+    assert ctx.ordinals.tolist() == [738521, 738528, 738542, 738543]
+    assert ctx.names.tolist() == ["VendorA"] * 4
+    assert ctx.user_ids.tolist() == ["user1"] * 4
+    assert ctx.sum_amount == 305.0
+    assert ctx.min_amount == 5.0
+    assert ctx.max_amount == 100.0
+    assert ctx.name_amount_counts[("VendorA", 10000)] == 3
+    assert ctx.avg_days_by_name_amount == {("VendorA", 10000): 10.5}
+    assert ctx.most_frequent_names == ("VendorA",)
+    assert ctx.recurring_names == frozenset({"VendorA"})
+    assert precompute(list(transactions)) is ctx
+
+
 def test_get_avg_days_between_same_merchant_amount() -> None:
     """Test get_avg_days_between_same_merchant_amount returns correct average days."""
     transactions = [
@@ -150,6 +175,12 @@ def test_is_recurring() -> None:
     ]
     transaction = transactions[0]
     assert is_recurring(transaction, transactions)
+    # amounts ending in .99 are checked on whole cents, so float noise does not hide them
+    transactions = [
+        create_transaction(1, "user1", "Gym", "2024-01-01", 20.0),
+        create_transaction(2, "user1", "Gym", "2024-01-31", 19.989999999),
+    ]
+    assert is_recurring(transactions[0], transactions)
 
 
 def test_amount_ends_in_99() -> None:
@@ -3,6 +3,7 @@ import math
 import pytest
 
 from recur_scan.features_precious import (
+    RecurFreq,
     amount_ends_in_00,
     get_additional_features,
     get_amount_variation_features,
@@ -102,6 +103,20 @@ def test_get_avg_stddev_days_between_same_merchant_amount(recurring_transactions
     assert pytest.approx(stddev) == 0.0
 
 
+def test_get_avg_stddev_days_between_same_merchant_amount_interleaved_groups():
+    t1 = Transaction(id=1, user_id="user1", name="AT&T", amount=50.99, date="2023-01-01")
+    t2 = Transaction(id=2, user_id="user1", name="Spotify", amount=9.99, date="2023-01-05")
+    t3 = Transaction(id=3, user_id="user1", name="AT&T", amount=50.99, date="2023-01-11")
+    t4 = Transaction(id=4, user_id="user1", name="AT&T", amount=50.99, date="2023-01-31")
+    t5 = Transaction(id=5, user_id="user1", name="AT&T", amount=10.00, date="2023-02-01")
+    txs = [t1, t2, t3, t4, t5]
+    # AT&T at 50.99 is 10 then 20 days apart; the other groups have a single transaction
+    assert pytest.approx(get_avg_days_between_same_merchant_amount(t1, txs)) == 15.0
+    assert pytest.approx(get_stddev_days_between_same_merchant_amount(t1, txs)) == math.sqrt(50)
+    assert get_avg_days_between_same_merchant_amount(t2, txs) == 0.0
+    assert get_stddev_days_between_same_merchant_amount(t5, txs) == 0.0
+
+
 def test_get_days_since_last_same_merchant_amount(recurring_transactions):
     assert get_days_since_last_same_merchant_amount(recurring_transactions[1], recurring_transactions) == 30
     assert get_days_since_last_same_merchant_amount(recurring_transactions[2], recurring_transactions) == 30
@@ -112,7 +127,9 @@ def test_get_recurring_frequency():
     t2 = Transaction(id=2, user_id="user1", name="AT&T", amount=50.99, date="2023-01-31")
     t3 = Transaction(id=3, user_id="user1", name="AT&T", amount=50.99, date="2023-03-02")
     freq = get_recurring_frequency(t1, [t1, t2, t3])
+    assert freq is RecurFreq.MONTHLY
     assert freq == 3
+    assert get_recurring_frequency(t1, [t1]) is RecurFreq.NONE
 
 
 # ------------------ Tests for Miscellaneous Functions ------------------
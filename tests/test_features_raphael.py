@@ -98,6 +98,10 @@ def test_get_is_common_subscription_amount() -> None:
     assert not get_is_common_subscription_amount(
         Transaction(id=2, user_id="user1", name="Unknown Service", amount=27.5, date="2024-01-01")
     )
+    # amounts are compared in whole cents, so float arithmetic noise does not hide a match
+    assert get_is_common_subscription_amount(
+        Transaction(id=3, user_id="user1", name="Spotify", amount=0.04 + 9.95, date="2024-01-01")
+    )
 
 
 def test_get_is_first_of_month() -> None:
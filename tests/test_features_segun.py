@@ -89,6 +89,11 @@ def test_get_transaction_amount_std() -> None:
         Transaction(id=3, user_id="user1", name="name1", amount=200.0, date="2024-01-03"),
     ]
     assert get_transaction_amount_std(transactions) == pytest.approx(50.0)
+    # identical amounts have exactly zero spread
+    constant = [
+        Transaction(id=i, user_id="user1", name="name1", amount=15.99, date=f"2024-01-0{i}") for i in range(1, 4)
+    ]
+    assert get_transaction_amount_std(constant) == 0.0
 
 
 def test_get_transaction_amount_median() -> None:
@@ -4,6 +4,7 @@ import numpy as np
 import pytest
 
 from recur_scan.features_tife import (
+    build_transaction_index,
     get_amount_cluster_count,
     get_amount_deviation,
     get_amount_range,
@@ -72,6 +73,22 @@ def same_day_transactions():
     ]
 
 
+def test_build_transaction_index(transactions, empty_transactions) -> None:
+    """Test that build_transaction_index builds the shared arrays and counts once per list of transactions."""
+    index = build_transaction_index(transactions)
+    assert index.amounts.tolist() == [100.0, 100.0, 105.0, 200.0, 100.0]
+    assert build_transaction_index(transactions[::-1]).amounts_by_date.tolist() == [100.0, 100.0, 105.0, 200.0, 100.0]
+    assert index.intervals.tolist() == [14, 17, 29, 14]
+    assert index.unique_amounts.tolist() == [100.0, 105.0, 200.0]
+    assert index.unique_amount_counts.tolist() == [3, 1, 1]
+    assert index.sorted_date_ordinals[0] == datetime(2024, 1, 1).toordinal()
+    assert index.name_counts == {"vendor1": 4, "vendor2": 1}
+    assert build_transaction_index(transactions) is index
+    empty_index = build_transaction_index(empty_transactions)
+    assert empty_index.amounts.size == 0
+    assert empty_index.intervals.size == 0
+
+
 def test_get_transaction_frequency(transactions, empty_transactions, single_transaction) -> None:
     """Test that get_transaction_frequency calculates the average interval correctly."""
     assert pytest.approx(get_transaction_frequency(transactions)) == (14 + 17 + 29 + 14) / 4  # 18.5
@@ -137,6 +154,14 @@ def test_get_days_since_last_same_amount(transactions) -> None:
 def test_get_amount_cluster_count(transactions, empty_transactions, single_transaction) -> None:
     """Test that get_amount_cluster_count counts clusters with interval filtering."""
     assert get_amount_cluster_count(transactions[0], transactions) == 3
+    # amounts are matched to the interval that precedes them in date order, not in list order
+    unsorted = [
+        Transaction(id=1, user_id="user1", name="vendor1", amount=50.0, date="2024-01-31"),
+        Transaction(id=2, user_id="user1", name="vendor1", amount=10.0, date="2024-01-01"),
+        Transaction(id=3, user_id="user1", name="vendor1", amount=10.0, date="2024-01-03"),
+    ]
+    assert get_amount_cluster_count(unsorted[0], unsorted) == 1
+    assert get_amount_cluster_count(unsorted[1], unsorted) == 0
     assert get_amount_cluster_count(transactions[0], empty_transactions) == 0
     assert get_amount_cluster_count(transactions[0], single_transaction) == 0
 
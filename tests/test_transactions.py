@@ -0,0 +1,25 @@
+from datetime import date
+
+from recur_scan.transactions import Transaction
+
+
+def test_name_lower() -> None:
+    """Test that name_lower returns the lowercased vendor name."""
+    transaction = Transaction(id=1, user_id="user1", name="Netflix.COM", date="2024-01-01", amount=15.99)
+    assert transaction.name_lower == "netflix.com"
+    assert transaction.name == "Netflix.COM"
+
+
+def test_amount_cents() -> None:
+    """Test that amount_cents converts the amount to whole cents."""
+    assert Transaction(id=1, user_id="user1", name="Netflix", date="2024-01-01", amount=15.99).amount_cents == 1599
+    assert Transaction(id=2, user_id="user1", name="Refund", date="2024-01-02", amount=-0.29).amount_cents == -29
+    assert Transaction(id=3, user_id="user1", name="Store", date="2024-01-03", amount=10).amount_cents == 1000
+
+
+def test_date_ordinal() -> None:
+    """Test that date_ordinal gives day numbers whose differences are day counts."""
+    jan = Transaction(id=1, user_id="user1", name="Netflix", date="2024-01-31", amount=15.99)
+    mar = Transaction(id=2, user_id="user1", name="Netflix", date="2024-03-01", amount=15.99)
+    assert jan.date_ordinal == date(2024, 1, 31).toordinal()
+    assert mar.date_ordinal - jan.date_ordinal == 30
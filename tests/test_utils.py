@@ -2,21 +2,59 @@ from datetime import date
 
 import pytest
 
-from recur_scan.utils import get_day, parse_date
+from recur_scan.transactions import Transaction
+from recur_scan.utils import count_amounts_between, get_date_ordinal, get_day, parse_date
 
 
 def test_parse_date():
     """Test parse_date function."""
     # Test with valid date format
     assert parse_date("2024-01-01") == date(2024, 1, 1)
+    assert parse_date("2024-02-29") == date(2024, 2, 29)
+    # non-padded dates are still accepted, as with strptime
+    assert parse_date("2024-1-5") == date(2024, 1, 5)
+
+    # Test with an invalid day
+    with pytest.raises(ValueError, match=r"day is out of range for month"):
+        parse_date("2023-02-29")
+
+    # Test with other ISO 8601 forms that strptime rejects
+    with pytest.raises(ValueError, match=r"does not match format"):
+        parse_date("20240101")
 
     # Test with invalid date format
     with pytest.raises(ValueError, match=r"does not match format"):
         parse_date("01/01/2024")
 
 
+def test_get_date_ordinal():
+    """Test get_date_ordinal function."""
+    assert get_date_ordinal("2024-01-01") == date(2024, 1, 1).toordinal()
+    assert get_date_ordinal("2024-03-01") - get_date_ordinal("2024-02-01") == 29
+
+    # Test with invalid date format
+    with pytest.raises(ValueError, match=r"does not match format"):
+        get_date_ordinal("01/01/2024")
+
+
 def test_get_day():
     """Test get_day function."""
     assert get_day("2024-01-01") == 1
     assert get_day("2024-01-02") == 2
     assert get_day("2024-01-03") == 3
+
+
+def test_count_amounts_between():
+    """Test count_amounts_between function."""
+    transactions = [
+        Transaction(id=1, user_id="user1", name="Netflix", amount=amount, date="2024-01-01")
+        for amount in [15.99, 9.99, 20.00, 15.99, -5.00]
+    ]
+    # both bounds are inclusive
+    assert count_amounts_between(transactions, 9.99, 15.99) == 3
+    assert count_amounts_between(transactions, 10.00, 19.99) == 2
+    assert count_amounts_between(transactions, -10.00, 0.00) == 1
+    assert count_amounts_between(transactions, 100.00, 200.00) == 0
+    # reversed bounds, as for a range around a negative amount, count nothing
+    assert count_amounts_between(transactions, 20.00, 9.99) == 0
+    assert count_amounts_between([], 0.00, 100.00) == 0